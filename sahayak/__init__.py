@@ -0,0 +1 @@
+"""Sahayak Associates document generator: screens, PDF builders and calculations."""
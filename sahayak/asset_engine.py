@@ -0,0 +1,422 @@
+"""Asset analysis over explicit holdings, independent of Streamlit.
+
+Each analyser takes a list of holdings plus AnalysisParams and returns the
+summary dict shown by the decision analyzer (or None when nothing in the
+list can be analysed). analyze_portfolio runs every asset class of one
+client; analyze_portfolios does the same for a whole client base.
+
+The horizon, tax rate and inflation in AnalysisParams may also be arrays of
+one shape; every figure that depends on them then comes back with that
+shape, which is how scenario_cube evaluates a whole grid in one pass.
+"""
+from collections import namedtuple
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from sahayak.tracing import span
+from sahayak.xirr import holdings_xirr
+
+# --- Inputs ---
+MutualFundHolding = namedtuple(
+    'MutualFundHolding',
+    ['scheme_name', 'category', 'invested_amount', 'current_value', 'investment_date', 'monthly_sip'],
+    defaults=(0,)
+)
+PropertyHolding = namedtuple(
+    'PropertyHolding',
+    ['purchase_value', 'current_value', 'purchase_date', 'monthly_rental_income', 'annual_maintenance', 'property_type'],
+    defaults=(0, 0, "Residential")
+)
+GoldHolding = namedtuple(
+    'GoldHolding',
+    ['purchase_price', 'quantity', 'current_price', 'purchase_date', 'annual_storage_cost', 'gold_type'],
+    defaults=(0, "Physical Gold")
+)
+# compounding is interest periods per year (see FD_COMPOUNDING)
+FixedDeposit = namedtuple(
+    'FixedDeposit',
+    ['amount', 'annual_rate', 'tenure_years', 'fd_type', 'compounding'],
+    defaults=(7.5, 3, "Regular FD", 1)
+)
+# as_of is the valuation date for holding periods; None means today.
+# mf_returns overrides entries of MF_EXPECTED_RETURNS, {category: % a year}
+AnalysisParams = namedtuple('AnalysisParams', ['horizon_years', 'tax_rate', 'inflation', 'as_of', 'mf_returns'],
+                            defaults=(None, None))
+
+# Asset classes in report order, with the holding type each one takes
+ASSET_CLASSES = {
+    'Mutual Funds': MutualFundHolding,
+    'Real Estate': PropertyHolding,
+    'Gold': GoldHolding,
+    'Fixed Deposits': FixedDeposit,
+}
+
+# Column names of the mutual fund editor, in MutualFundHolding order
+MF_COLUMNS = ['Scheme Name', 'Category', 'Invested Amount (Rs.)', 'Current Value (Rs.)', 'Investment Date', 'Monthly SIP (Rs.)']
+
+EQUITY_CATEGORIES = ['Equity Large Cap', 'Equity Mid Cap', 'Equity Small Cap', 'ELSS']
+
+# Assumed annual return (%) per mutual fund category for projections;
+# categories missing from the table are assumed to return nothing
+MF_EXPECTED_RETURNS = {
+    'Equity Large Cap': 12.0,
+    'Equity Mid Cap': 12.0,
+    'Equity Small Cap': 12.0,
+    'ELSS': 12.0,
+    'Debt Fund': 7.0,
+    'Hybrid Fund': 9.0,
+}
+
+# Asset mix buckets, matched against the category name in this order
+MF_ASSET_MIX = [('Equity', 'Equity|ELSS'), ('Debt', 'Debt'), ('Hybrid', 'Hybrid')]
+
+def parse_analysis_params(horizon, tax_bracket, inflation, as_of=None):
+    """AnalysisParams from the screen's labels, e.g. "5 Years" and "30%" """
+    return AnalysisParams(int(horizon.split()[0]), float(tax_bracket.strip('%')) / 100, inflation, as_of)
+
+def mutual_fund_holdings(mf_data):
+    """Holdings from a DataFrame with the mutual fund editor's columns"""
+    return [MutualFundHolding(*row) for row in mf_data[MF_COLUMNS].itertuples(index=False, name=None)]
+
+def _as_of(params):
+    return params.as_of or datetime.now().date()
+
+def _summary(current_value, invested_amount, current_gains, tax_impact, exit_load, net_proceeds,
+             future_value, expected_return, liquidity, risk_level):
+    return {
+        'current_value': current_value,
+        'invested_amount': invested_amount,
+        'current_gains': current_gains,
+        'tax_impact': tax_impact,
+        'exit_load': exit_load,
+        'net_proceeds': net_proceeds,
+        'future_value': future_value,
+        'expected_return': expected_return,
+        'liquidity': liquidity,
+        'risk_level': risk_level
+    }
+
+# --- Analysers ---
+def analyze_mutual_funds(holdings, params):
+    mf_data = pd.DataFrame(list(holdings), columns=MutualFundHolding._fields)
+    years = params.horizon_years
+    # Trailing axis for the schemes when the parameters are a scenario grid
+    tax_rate = np.asarray(params.tax_rate, dtype=float)[..., None]
+    today = _as_of(params)
+
+    # Filter out empty rows
+    mf_data = mf_data[
+        (mf_data['invested_amount'] > 0) |
+        (mf_data['current_value'] > 0)
+    ]
+
+    if mf_data.empty:
+        return None
+
+    total_invested = mf_data['invested_amount'].sum()
+    total_current = mf_data['current_value'].sum()
+
+    if total_invested == 0:
+        return None
+
+    current_gains = total_current - total_invested
+
+    # Calculate tax implications based on holding period and category.
+    # Rows without an investment date pay neither tax nor exit load.
+    holding_days = (pd.Timestamp(today) - pd.to_datetime(mf_data['investment_date'])).dt.days.to_numpy()
+    dated = ~np.isnan(holding_days)
+    gains = (mf_data['current_value'] - mf_data['invested_amount']).to_numpy(dtype=float)
+    current = mf_data['current_value'].to_numpy(dtype=float)
+    is_equity = mf_data['category'].isin(EQUITY_CATEGORIES).to_numpy()
+
+    tax_on_gains = np.select(
+        [
+            dated & is_equity & (holding_days > 365) & (gains > 100000),  # Equity LTCG above the exemption
+            dated & is_equity & (holding_days <= 365) & (gains > 0),      # Equity STCG
+            dated & ~is_equity & (holding_days > 1095) & (gains > 0),     # Debt LTCG with indexation
+            dated & ~is_equity & (holding_days <= 1095) & (gains > 0),    # Debt STCG at slab rate
+        ],
+        [(gains - 100000) * 0.10, gains * 0.15, gains * 0.20, gains * tax_rate],
+        default=0.0
+    )
+    total_tax_impact = tax_on_gains.sum(axis=-1)
+
+    # Exit load (typically 1% if < 1 year)
+    total_exit_load = np.where(dated & (holding_days < 365), current * 0.01, 0.0).sum()
+
+    net_proceeds = total_current - total_tax_impact - total_exit_load
+
+    # Future projection from each category's assumed return, weighted by
+    # current value (invested amount while nothing has a current value)
+    categories = mf_data['category']
+    weights = current if total_current > 0 else mf_data['invested_amount'].to_numpy(dtype=float)
+    weights = weights / weights.sum()
+    returns = categories.map({**MF_EXPECTED_RETURNS, **(params.mf_returns or {})}).to_numpy(dtype=float, na_value=0.0)
+    expected_return = float(weights @ returns)
+
+    asset_mix = mf_asset_mix(categories, weights)
+    equity_ratio = asset_mix['Equity'] / 100
+
+    future_value = total_current * ((1 + expected_return/100) ** years)
+
+    result = _summary(total_current, total_invested, current_gains, total_tax_impact, total_exit_load, net_proceeds,
+                      future_value, expected_return, 'High', 'Medium to High' if equity_ratio > 0.5 else 'Low to Medium')
+
+    # Realised return (XIRR, %) from the SIP and lumpsum history; None when
+    # the flows have no rate, e.g. everything was bought today
+    scheme_xirr, portfolio_xirr = holdings_xirr(holdings, today)
+    result['xirr'] = _percent(portfolio_xirr)
+    result['scheme_xirr'] = {scheme: _percent(rate) for scheme, rate in scheme_xirr.items()}
+    result['asset_mix'] = asset_mix
+    return result
+
+def mf_asset_mix(categories, weights):
+    """Share (%) of Equity, Debt, Hybrid and Other given each scheme's
+    category and weight"""
+    categories = pd.Series(categories).astype(object)
+    weights = np.asarray(weights, dtype=float)
+    total = weights.sum()
+    mix = {}
+    unmatched = np.ones(len(weights), dtype=bool)
+    for bucket, pattern in MF_ASSET_MIX:
+        matched = unmatched & categories.str.contains(pattern, na=False).to_numpy(dtype=bool)
+        mix[bucket] = float(weights[matched].sum() / total * 100) if total else 0.0
+        unmatched &= ~matched
+    mix['Other'] = float(weights[unmatched].sum() / total * 100) if total else 0.0
+    return mix
+
+def analyze_real_estate(holdings, params):
+    years, tax_rate, inflation = params.horizon_years, params.tax_rate, params.inflation
+    today = _as_of(params)
+
+    totals = None
+    for prop in holdings:
+        if prop.purchase_value == 0 or prop.current_value == 0:
+            continue
+
+        current_gains = prop.current_value - prop.purchase_value
+        holding_days = (today - (prop.purchase_date or today)).days
+
+        # Tax calculation for real estate
+        if holding_days > 730:  # LTCG (2 years for real estate)
+            indexed_cost = prop.purchase_value * (1 + inflation/100) ** (holding_days/365)
+            taxable_gains = np.maximum(0, prop.current_value - indexed_cost)
+            tax_impact = taxable_gains * 0.20
+        else:  # STCG
+            tax_impact = current_gains * tax_rate if current_gains > 0 else 0
+
+        net_proceeds = prop.current_value - tax_impact
+
+        # Future projection (real estate appreciation + rental yield)
+        future_capital_value = prop.current_value * ((1 + 8/100) ** years)
+        future_rental_income = prop.monthly_rental_income * 12 * years * (1 + inflation/100) ** (years/2)
+        total_future_value = future_capital_value + future_rental_income - (prop.annual_maintenance * years)
+
+        totals = _add(totals, prop.current_value, prop.purchase_value, current_gains, tax_impact, net_proceeds, total_future_value)
+
+    if totals is None:
+        return None
+    current_value, invested, gains, tax_impact, net_proceeds, future_value = totals
+    return _summary(current_value, invested, gains, tax_impact, 0, net_proceeds, future_value, 8.0, 'Low', 'Medium')
+
+def analyze_gold(holdings, params):
+    years, tax_rate, inflation = params.horizon_years, params.tax_rate, params.inflation
+    today = _as_of(params)
+
+    totals = None
+    for gold in holdings:
+        if gold.purchase_price == 0 or gold.quantity == 0 or gold.current_price == 0:
+            continue
+
+        purchase_value = gold.purchase_price * gold.quantity
+        current_value = gold.current_price * gold.quantity
+        current_gains = current_value - purchase_value
+        holding_days = (today - (gold.purchase_date or today)).days
+
+        # Tax calculation for gold
+        if holding_days > 1095:  # LTCG (3 years for gold)
+            tax_impact = current_gains * 0.20 if current_gains > 0 else 0
+        else:  # STCG
+            tax_impact = current_gains * tax_rate if current_gains > 0 else 0
+
+        net_proceeds = current_value - tax_impact
+
+        # Future projection (gold typically beats inflation by 2-3%)
+        future_value = current_value * ((1 + (inflation + 2)/100) ** years) - (gold.annual_storage_cost * years)
+
+        totals = _add(totals, current_value, purchase_value, current_gains, tax_impact, net_proceeds, future_value)
+
+    if totals is None:
+        return None
+    current_value, invested, gains, tax_impact, net_proceeds, future_value = totals
+    return _summary(current_value, invested, gains, tax_impact, 0, net_proceeds, future_value,
+                    inflation + 2, 'Medium', 'Low to Medium')
+
+def analyze_fixed_deposits(holdings, params):
+    """FDs with accrual tax: interest is taxed every year, so only the
+    post-tax interest compounds. An FD maturing before the horizon is
+    reinvested at the same rate."""
+    holdings = [fd for fd in holdings if fd.amount != 0]
+    if not holdings:
+        return None
+
+    # FDs on the last axis, after any scenario grid axes
+    projection = project_fd_accrual(
+        [fd.amount for fd in holdings], [fd.annual_rate for fd in holdings],
+        np.asarray(params.horizon_years)[..., None], np.asarray(params.tax_rate)[..., None],
+        [fd.compounding for fd in holdings]
+    )
+    principal = sum(fd.amount for fd in holdings)
+    total_tax_paid = projection['tax_paid'].sum(axis=-1)
+    amount = projection['maturity'].sum(axis=-1)
+
+    effective_annual_return = ((amount / principal) ** (1/params.horizon_years) - 1) * 100
+    return _summary(principal, principal, 0, total_tax_paid, 0, amount, amount,
+                    effective_annual_return, 'Medium', 'Very Low')
+
+# --- Fixed deposit projection ---
+# Compounding periods per year offered for FDs
+FD_COMPOUNDING = {"Yearly": 1, "Half-yearly": 2, "Quarterly": 4, "Monthly": 12}
+
+def project_fd_accrual(principals, annual_rates, years, tax_rate, compounding=1, schedule=False):
+    """Post-tax growth of FDs whose interest is taxed in the year it accrues.
+
+    principals, annual_rates (%), years, compounding (periods per year) and
+    tax_rate broadcast against each other, so a ladder of FDs is one call.
+    Within a year interest compounds at the FD's frequency; at year end tax
+    on that year's interest is paid and only the remainder compounds on.
+    Returns arrays 'maturity', 'interest' (gross) and 'tax_paid'; with
+    schedule=True also 'schedule', a dict of per-year 'opening', 'interest',
+    'tax' and 'closing' arrays shaped (FDs, years).
+    An FD's tenure is not an input: each FD is projected over years, as if
+    reinvested at the same rate when it matures.
+    """
+    principals, annual_rates, years, compounding, tax_rate = np.broadcast_arrays(
+        np.asarray(principals, dtype=float), np.asarray(annual_rates, dtype=float),
+        np.asarray(years, dtype=int), np.asarray(compounding, dtype=float), np.asarray(tax_rate, dtype=float)
+    )
+
+    # Effective yearly rate, and the balance's growth once that year's tax is paid
+    yearly_rate = (1 + annual_rates / 100 / compounding) ** compounding - 1
+    net_rate = yearly_rate * (1 - tax_rate)
+    growth = 1 + net_rate
+    maturity = principals * growth ** years
+
+    # Tax is tax_rate on each year's interest, a geometric series over the
+    # post-tax balances; with no net growth every year's interest is the same
+    compounds = net_rate != 0
+    tax_paid = np.where(
+        compounds,
+        principals * tax_rate * yearly_rate * (growth ** years - 1) / np.where(compounds, net_rate, 1),
+        principals * tax_rate * yearly_rate * years
+    )
+
+    projection = {
+        'maturity': maturity,
+        'interest': maturity - principals + tax_paid,
+        'tax_paid': tax_paid,
+    }
+
+    if schedule:
+        year_index = np.arange(years.max(initial=0))
+        active = year_index < years[..., None]
+        opening = principals[..., None] * growth[..., None] ** np.minimum(year_index, years[..., None])
+        interest = np.where(active, opening * yearly_rate[..., None], 0.0)
+        tax = interest * tax_rate[..., None]
+        projection['schedule'] = {
+            'opening': opening,
+            'interest': interest,
+            'tax': tax,
+            'closing': opening + interest - tax,
+        }
+
+    return projection
+
+def _percent(rate):
+    return None if np.isnan(rate) else float(rate * 100)
+
+def _add(totals, *values):
+    """Running per-field totals across holdings"""
+    if totals is None:
+        return values
+    return tuple(total + value for total, value in zip(totals, values))
+
+ANALYZERS = {
+    'Mutual Funds': analyze_mutual_funds,
+    'Real Estate': analyze_real_estate,
+    'Gold': analyze_gold,
+    'Fixed Deposits': analyze_fixed_deposits,
+}
+
+# --- Portfolios ---
+def analyze_portfolio(portfolio, params):
+    """Results per asset class for one client's {asset class: holdings};
+    classes with nothing to analyse are left out"""
+    results = {}
+    for asset_class, analyze in ANALYZERS.items():
+        holdings = portfolio.get(asset_class)
+        if holdings:
+            with span("calc.asset_class", asset_class=asset_class, holdings=len(holdings)):
+                result = analyze(holdings, params)
+            if result:
+                results[asset_class] = result
+    return results
+
+def analyze_portfolios(portfolios, params):
+    """analyze_portfolio over many clients. portfolios is an iterable of
+    portfolios, or a dict of client id -> portfolio (results keep the ids)."""
+    if isinstance(portfolios, dict):
+        return {client: analyze_portfolio(portfolio, params) for client, portfolio in portfolios.items()}
+    return [analyze_portfolio(portfolio, params) for portfolio in portfolios]
+
+# --- Scenarios ---
+# Figures reported per asset class and scenario
+SCENARIO_FIELDS = ['current_value', 'tax_impact', 'exit_load', 'net_proceeds', 'future_value', 'expected_return']
+
+def scenario_cube(portfolio, horizons, tax_rates, inflations, as_of=None, mf_returns=None):
+    """Analyse one portfolio under every combination of horizon (years),
+    tax rate (0.30 for 30%) and inflation (%).
+
+    The whole grid goes through analyze_portfolio once, with array
+    parameters. Returns a tidy DataFrame, one row per asset class and
+    scenario, with SCENARIO_FIELDS plus real_future_value, the future value
+    in today's money at that scenario's inflation.
+    """
+    grid = np.meshgrid(np.asarray(horizons, dtype=int), np.asarray(tax_rates, dtype=float),
+                       np.asarray(inflations, dtype=float), indexing='ij')
+    horizon, tax_rate, inflation = (axis.ravel() for axis in grid)
+    results = analyze_portfolio(portfolio, AnalysisParams(horizon, tax_rate, inflation, as_of, mf_returns))
+
+    frames = []
+    for asset_class, result in results.items():
+        frame = pd.DataFrame({
+            'asset_class': asset_class,
+            'horizon_years': horizon,
+            'tax_rate': tax_rate,
+            'inflation': inflation,
+            **{field: np.broadcast_to(np.asarray(result[field], dtype=float), horizon.shape) for field in SCENARIO_FIELDS}
+        })
+        frame['real_future_value'] = frame['future_value'] / (1 + frame['inflation'] / 100) ** frame['horizon_years']
+        frames.append(frame)
+    if not frames:
+        return pd.DataFrame(columns=['asset_class', 'horizon_years', 'tax_rate', 'inflation', *SCENARIO_FIELDS, 'real_future_value'])
+    return pd.concat(frames, ignore_index=True)
+
+def portfolio_from_records(records):
+    """Portfolio of holdings from plain dicts, e.g. a parsed JSON/YAML spec:
+    {asset class: [{field: value}]}. Dates may be given as YYYY-MM-DD."""
+    portfolio = {}
+    for asset_class, rows in records.items():
+        holding_type = ASSET_CLASSES.get(asset_class)
+        if holding_type is None:
+            raise ValueError(f"unknown asset class '{asset_class}' (expected one of: {', '.join(ASSET_CLASSES)})")
+        portfolio[asset_class] = [holding_type(**{field: _parse_date(field, value) for field, value in row.items()})
+                                  for row in rows]
+    return portfolio
+
+def _parse_date(field, value):
+    if field.endswith('_date') and isinstance(value, str):
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    return value
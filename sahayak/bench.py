@@ -0,0 +1,312 @@
+"""Benchmarks of the calculation, table, chart and report hot paths.
+
+    python -m sahayak.bench [-k table] [--repeat 20] [--save bench.json] [--compare bench.json]
+
+Every benchmark runs a fixed synthetic workload (seeded, so each run times
+the same data) and reports throughput (items a second), p50 and p99
+latency of one call and the peak memory one call allocates (tracemalloc,
+measured in a separate run so it doesn't slow the timed ones). --save
+writes the results as a JSON baseline; --compare checks them against one
+and exits 1 when a benchmark's p50 is slower than the baseline by more
+than --tolerance.
+"""
+import argparse
+import json
+import platform
+import re
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# Imported first: quietens Streamlit's warnings about caches outside a server
+from sahayak.cli import build_report
+from sahayak.goals import GOAL_ORDER, goal_params, calculate_goal
+from sahayak.pdf_common import dataframe_to_table, fund_performance_table
+from sahayak.utils import (format_indian_number, calculate_future_value, calculate_sip_amount,
+                           calculate_lumpsum_amount, calculate_retirement_corpus, calculate_goal_progress)
+
+SEED = 20240601
+DEFAULT_REPEAT = 20
+# Stop repeating a benchmark after this long, once it has MIN_RUNS samples
+MAX_SECONDS = 10.0
+MIN_RUNS = 5
+DEFAULT_TOLERANCE = 0.25
+TABLE_SIZES = (10, 100, 1000)
+
+# --- Synthetic data ---
+def _rng():
+    return np.random.default_rng(SEED)
+
+def _allocation_rows(rows):
+    rng = _rng()
+    categories = ['Equity', 'Debt', 'Hybrid']
+    return pd.DataFrame({
+        'Category': [categories[i % 3] for i in range(rows)],
+        'SubCategory': [f"Sub Category {i % 7}" for i in range(rows)],
+        'Scheme Name': [f"Scheme {i:04d} Fund - Direct Plan - Growth" for i in range(rows)],
+        'Allocation (%)': np.round(rng.uniform(1, 20, rows), 2),
+        'Amount': np.round(rng.uniform(1000, 5000000, rows), 2),
+    })
+
+def _fund_perf_rows(rows):
+    rng = _rng()
+    return pd.DataFrame({
+        'Scheme Name': [f"Scheme {i:04d} Fund - Direct Plan - Growth" for i in range(rows)],
+        'PE': rng.uniform(10, 40, rows), 'SD': rng.uniform(5, 25, rows), 'SR': rng.uniform(-0.5, 2, rows),
+        'Beta': rng.uniform(0.5, 1.3, rows), 'Alpha': rng.uniform(-3, 5, rows),
+        '1Y': rng.uniform(-10, 40, rows), '3Y': rng.uniform(0, 25, rows), '5Y': rng.uniform(5, 20, rows),
+        '10Y': rng.uniform(8, 18, rows),
+    })
+
+def _goal_inputs(clients):
+    rng = _rng()
+    ages = rng.integers(25, 55, clients)
+    values = []
+    for age in ages:
+        values.append({
+            'edu_current_age': int(rng.integers(0, 15)), 'edu_current_cost': float(rng.uniform(2e5, 4e6)),
+            'marriage_target_age': int(age + rng.integers(1, 15)), 'marriage_amount': float(rng.uniform(5e5, 5e6)),
+            'monthly_expenses': float(rng.uniform(2e4, 3e5)),
+            'retirement_monthly_exp': float(rng.uniform(3e4, 4e5)), 'retirement_already_saved': float(rng.uniform(0, 5e6)),
+        })
+    return [int(age) for age in ages], values
+
+def _goal_results(goals=4):
+    ages, values = _goal_inputs(1)
+    calculated = [calculate_goal(goal_key, goal_params(goal_key, values[0]), ages[0]) for goal_key in GOAL_ORDER[:goals]]
+    return [goal for goal in calculated if goal]
+
+REPORT_SPECS = {
+    'investment': {
+        'report': 'investment', 'client_name': "Bench Client", 'report_date': "01-06-2024",
+        'financial_goal': "Wealth Creation", 'investment_horizon': "Long Term (> 7 years)", 'risk_profile': "Moderate",
+        'return_expectation': "10-12%", 'investment_amount': "2500000", 'sip_amount': "50000",
+        'strategy_note': "Equity now, debt via STP over the next year.",
+        'lumpsum_alloc': _allocation_rows(10).to_dict('records'), 'sip_alloc': _allocation_rows(10).to_dict('records'),
+        'fund_perf': _fund_perf_rows(10).to_dict('records'),
+        'factsheet_links': "\n".join(f"Scheme {i} - Factsheet | https://example.com/{i}" for i in range(5)),
+    },
+    'goal_plan': {'report': 'goal_plan', 'client_name': "Bench Client", 'current_age': 32, 'date': "01-06-2024"},
+    'mom': {'report': 'mom', 'investor_name': "Bench Client", 'meeting_date_time': "01-06-2024 11:00"},
+    'checklist': {'report': 'checklist', 'client_name': "Bench Client", 'meeting_date': "01-06-2024"},
+    'asset_analysis': {
+        'report': 'asset_analysis', 'client_name': "Bench Client", 'horizon_years': 5, 'tax_rate': 0.3, 'inflation': 6.0,
+        'holdings': {
+            'Mutual Funds': [{'scheme_name': f"Scheme {i}", 'category': "Equity Large Cap", 'invested_amount': 100000,
+                              'current_value': 100000 + 15000 * i, 'investment_date': f"20{15 + i}-04-01",
+                              'monthly_sip': 5000} for i in range(6)],
+            'Real Estate': [{'purchase_value': 5000000, 'current_value': 8000000, 'purchase_date': "2018-04-01",
+                             'monthly_rental_income': 20000}],
+            'Gold': [{'purchase_price': 4800.0, 'quantity': 100.0, 'current_price': 6500.0,
+                      'purchase_date': "2019-01-01"}],
+            'Fixed Deposits': [{'amount': 1000000}, {'amount': 500000, 'annual_rate': 7.0, 'tenure_years': 5}],
+        },
+    },
+}
+
+# --- Benchmarks ---
+# Each returns (function to time, items one call processes)
+def bench_future_value():
+    rng = _rng()
+    inputs = list(zip(rng.uniform(1e4, 1e7, 10000), rng.uniform(2, 12, 10000), rng.integers(1, 40, 10000)))
+    return lambda: [calculate_future_value(*row) for row in inputs], len(inputs)
+
+def bench_sip_amount():
+    rng = _rng()
+    inputs = list(zip(rng.uniform(1e5, 5e7, 10000), rng.integers(1, 35, 10000), rng.uniform(0, 15, 10000),
+                      rng.uniform(0, 1e6, 10000)))
+    return lambda: [calculate_sip_amount(*row) for row in inputs], len(inputs)
+
+def bench_lumpsum_amount():
+    rng = _rng()
+    inputs = list(zip(rng.uniform(1e5, 5e7, 10000), rng.integers(1, 35, 10000), rng.uniform(0, 15, 10000),
+                      rng.uniform(0, 1e6, 10000)))
+    return lambda: [calculate_lumpsum_amount(*row) for row in inputs], len(inputs)
+
+def bench_retirement_corpus():
+    rng = _rng()
+    inputs = list(zip(rng.uniform(2e4, 5e5, 10000), rng.integers(10, 40, 10000), rng.uniform(3, 9, 10000),
+                      np.full(10000, 0.3), rng.uniform(5, 12, 10000)))
+    return lambda: [calculate_retirement_corpus(*row) for row in inputs], len(inputs)
+
+def bench_goal_progress():
+    rng = _rng()
+    ages = rng.integers(25, 45, 1000)
+    inputs = [(int(age), int(age + rng.integers(5, 30)), float(rng.uniform(0, 1e6)), float(rng.uniform(1e3, 1e5)),
+               float(rng.uniform(6, 14))) for age in ages]
+    return lambda: [calculate_goal_progress(*row) for row in inputs], len(inputs)
+
+def bench_calculate_goals():
+    ages, values = _goal_inputs(2500)
+    def run():
+        return [calculate_goal(goal_key, goal_params(goal_key, client), age)
+                for age, client in zip(ages, values) for goal_key in GOAL_ORDER]
+    return run, len(ages) * len(GOAL_ORDER)
+
+def bench_format_indian_number():
+    rng = _rng()
+    # Every magnitude from paise to hundreds of crores, some negative
+    amounts = (10 ** rng.uniform(-2, 10, 100000)) * rng.choice([1, 1, 1, -1], 100000)
+    return lambda: [format_indian_number(amount) for amount in amounts], len(amounts)
+
+def bench_dataframe_to_table(rows):
+    table = _allocation_rows(rows)
+    return lambda: dataframe_to_table(table), rows
+
+def bench_fund_performance_table(rows):
+    table = _fund_perf_rows(rows)
+    return lambda: fund_performance_table(table), rows
+
+def bench_goal_progress_chart():
+    from sahayak.screens.goal_planner import goal_progress_chart
+    goals = _goal_results()
+    return lambda: goal_progress_chart(goals), 1
+
+def bench_asset_comparison_chart():
+    from sahayak.asset_engine import AnalysisParams, analyze_portfolio, portfolio_from_records
+    from sahayak.screens.asset_analyzer import asset_comparison_chart, build_comparison_data
+    spec = REPORT_SPECS['asset_analysis']
+    results = analyze_portfolio(portfolio_from_records(spec['holdings']), AnalysisParams(5, 0.3, 6.0))
+    comparison = build_comparison_data(results)
+    return lambda: asset_comparison_chart(comparison), 1
+
+def bench_rolling_returns_chart():
+    from sahayak.screens.investment_sheet import rolling_returns_chart
+    rng = _rng()
+    dates = pd.date_range("2015-01-01", "2024-12-31", freq='D')
+    series = pd.DataFrame(rng.normal(12, 6, (len(dates), 5)).cumsum(axis=0) / np.arange(1, len(dates) + 1)[:, None] + 10,
+                          index=dates, columns=[f"Scheme {i}" for i in range(5)])
+    return lambda: rolling_returns_chart(series, '3Y'), 1
+
+def bench_report(report):
+    spec = REPORT_SPECS[report]
+    return lambda: build_report(spec), 1
+
+BENCHMARKS = {
+    'calc.future_value': bench_future_value,
+    'calc.sip_amount': bench_sip_amount,
+    'calc.lumpsum_amount': bench_lumpsum_amount,
+    'calc.retirement_corpus': bench_retirement_corpus,
+    'calc.goal_progress': bench_goal_progress,
+    'calc.goals': bench_calculate_goals,
+    'format.indian_number': bench_format_indian_number,
+    **{f"table.dataframe_to_table.{rows}": (lambda rows=rows: bench_dataframe_to_table(rows)) for rows in TABLE_SIZES},
+    **{f"table.fund_performance.{rows}": (lambda rows=rows: bench_fund_performance_table(rows)) for rows in TABLE_SIZES},
+    'chart.goal_progress': bench_goal_progress_chart,
+    'chart.asset_comparison': bench_asset_comparison_chart,
+    'chart.rolling_returns': bench_rolling_returns_chart,
+    **{f"report.{report}": (lambda report=report: bench_report(report)) for report in REPORT_SPECS},
+}
+
+# --- Running ---
+def run_benchmark(setup, repeat=DEFAULT_REPEAT, max_seconds=MAX_SECONDS):
+    """Time one benchmark: {items, runs, mean_ms, p50_ms, p99_ms, throughput, peak_kb}"""
+    function, items = setup()
+    function()                              # warm-up: imports, fonts, caches
+    times = []
+    started = time.perf_counter()
+    while len(times) < repeat and (len(times) < MIN_RUNS or time.perf_counter() - started < max_seconds):
+        begin = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - begin)
+    times = np.array(times)
+
+    tracemalloc.start()
+    try:
+        function()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'items': items,
+        'runs': len(times),
+        'mean_ms': float(times.mean() * 1000),
+        'p50_ms': float(np.percentile(times, 50) * 1000),
+        'p99_ms': float(np.percentile(times, 99) * 1000),
+        'throughput': float(items / times.mean()),
+        'peak_kb': peak / 1024,
+    }
+
+def run_benchmarks(pattern=None, repeat=DEFAULT_REPEAT, max_seconds=MAX_SECONDS, progress=None):
+    """Results of every benchmark whose name matches pattern (a regex), by name"""
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if pattern and not re.search(pattern, name):
+            continue
+        results[name] = run_benchmark(setup, repeat, max_seconds)
+        if progress:
+            progress(name, results[name])
+    return results
+
+def baseline(results):
+    """JSON-ready baseline of results, with the environment they were measured in"""
+    return {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'results': results,
+    }
+
+def compare(results, base, tolerance=DEFAULT_TOLERANCE):
+    """{name: p50 now / p50 in the baseline} for benchmarks in both, and the
+    names slower than the baseline by more than tolerance"""
+    ratios = {name: result['p50_ms'] / base['results'][name]['p50_ms']
+              for name, result in results.items()
+              if name in base.get('results', {}) and base['results'][name]['p50_ms'] > 0}
+    return ratios, [name for name, ratio in ratios.items() if ratio > 1 + tolerance]
+
+def _row(name, result, ratio=None):
+    change = "" if ratio is None else f"{(ratio - 1) * 100:+7.1f}%"
+    return (f"{name:<34} {result['items']:>7} {result['p50_ms']:>10.3f} {result['p99_ms']:>10.3f} "
+            f"{result['throughput']:>13,.0f} {result['peak_kb']:>10,.0f} {change}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m sahayak.bench", description="Benchmark Sahayak's calculation, table, chart and report paths")
+    parser.add_argument("-k", "--filter", help="only run benchmarks whose name matches this regular expression")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help=f"timed runs per benchmark (default {DEFAULT_REPEAT})")
+    parser.add_argument("--max-seconds", type=float, default=MAX_SECONDS, help=f"time limit per benchmark once it has {MIN_RUNS} runs")
+    parser.add_argument("--save", help="write the results to this JSON baseline")
+    parser.add_argument("--compare", help="compare with this JSON baseline; exit 1 on a regression")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed p50 slowdown against the baseline (default 0.25 = 25%%)")
+    parser.add_argument("--list", action='store_true', help="list the benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(name for name in BENCHMARKS if not args.filter or re.search(args.filter, name)))
+        return 0
+    base = None
+    if args.compare:
+        try:
+            with open(args.compare, encoding='utf-8') as f:
+                base = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"error: {e}", file=sys.stderr)
+            return 2
+
+    print(f"{'benchmark':<34} {'items':>7} {'p50 ms':>10} {'p99 ms':>10} {'items/s':>13} {'peak KB':>10}")
+    def progress(name, result):
+        ratio = None
+        if base is not None and name in base.get('results', {}):
+            ratio = compare({name: result}, base)[0].get(name)
+        print(_row(name, result, ratio), flush=True)
+    results = run_benchmarks(args.filter, args.repeat, args.max_seconds, progress)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(baseline(results), f, indent=1)
+    if base is not None:
+        regressions = compare(results, base, args.tolerance)[1]
+        if regressions:
+            print(f"slower than {args.compare} by more than {args.tolerance:.0%}: {', '.join(regressions)}", file=sys.stderr)
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
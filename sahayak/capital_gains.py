@@ -0,0 +1,364 @@
+"""Lot-level capital gains for mutual fund redemptions.
+
+Transactions are a DataFrame with columns scheme, date, units and nav:
+purchases (SIP instalments, lumpsums) have positive units, past redemptions
+negative units. Redemptions consume purchase lots first-in-first-out within
+each scheme. Schemes are a DataFrame indexed by scheme with its category,
+current nav and, optionally, grandfathered_nav (the NAV on 31-Jan-2018).
+
+Everything is computed on arrays; there is no per-lot Python loop.
+"""
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+from sahayak.asset_engine import EQUITY_CATEGORIES
+from sahayak.xirr import holding_flows
+
+# --- Tax rules ---
+# Same rules as the decision analyzer, applied per lot
+EQUITY_LTCG_DAYS = 365
+DEBT_LTCG_DAYS = 1095
+EQUITY_STCG_RATE = 0.15
+EQUITY_LTCG_RATE = 0.10
+DEBT_LTCG_RATE = 0.20
+# Equity LTCG exempt each financial year, across all schemes
+LTCG_EXEMPTION = 100000
+EXIT_LOAD_DAYS = 365
+EXIT_LOAD_RATE = 0.01
+# Equity units bought on or before this date use the higher of cost and the
+# NAV on this date (capped at the sale NAV) as their cost
+GRANDFATHER_DATE = date(2018, 1, 31)
+
+# Gain buckets; losses are set off against gains in the same bucket
+EQUITY_SHORT, EQUITY_LONG, DEBT_SHORT, DEBT_LONG = range(4)
+BUCKET_TERMS = np.array(['STCG', 'LTCG', 'STCG', 'LTCG'])
+
+# Units below this are float noise from cumulative sums, not real slices
+_UNIT_TOLERANCE = 1e-6
+
+TRANSACTION_COLUMNS = ['scheme', 'date', 'units', 'nav']
+
+# --- FIFO matching ---
+def fifo_match(buy_group, buy_units, sell_group, sell_units):
+    """Match sells against buys first-in-first-out within each group.
+
+    Groups are integer codes; within a group, buys and sells must each be in
+    chronological order. Returns (buy_index, sell_index, units) for every
+    slice of a buy, with sell_index -1 for units that are still held.
+    Selling more units than a group holds raises ValueError.
+    """
+    buy_group = np.asarray(buy_group, dtype=np.int64)
+    sell_group = np.asarray(sell_group, dtype=np.int64)
+    buy_units = np.asarray(buy_units, dtype=float)
+    sell_units = np.asarray(sell_units, dtype=float)
+    n_groups = int(max(buy_group.max(initial=-1), sell_group.max(initial=-1))) + 1
+    if not len(buy_units):
+        if sell_units.sum() > _UNIT_TOLERANCE:
+            raise ValueError("redemptions without any purchases")
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0)
+
+    # Lay every group's buys end to end on one cumulative-units axis
+    buy_order = np.argsort(buy_group, kind='stable')
+    buy_end = np.cumsum(buy_units[buy_order])
+    held = np.bincount(buy_group, weights=buy_units, minlength=n_groups)
+    group_start = np.concatenate(([0.0], np.cumsum(held)[:-1]))
+    if not len(sell_units):
+        # Nothing sold: every buy is one slice, still held
+        units = buy_units[buy_order]
+        keep = units > _UNIT_TOLERANCE
+        return buy_order[keep], np.full(int(keep.sum()), -1, dtype=np.int64), units[keep]
+
+    # Each group's sells take the front of that group's stretch of the axis
+    sell_order = np.argsort(sell_group, kind='stable')
+    sorted_groups = sell_group[sell_order]
+    sell_cum = np.cumsum(sell_units[sell_order])
+    first_sell = np.searchsorted(sorted_groups, sorted_groups, side='left')
+    sold_before = np.where(first_sell > 0, sell_cum[first_sell - 1], 0.0)
+    sell_end = group_start[sorted_groups] + sell_cum - sold_before
+    sell_start = sell_end - sell_units[sell_order]
+
+    oversold = sell_end > group_start[sorted_groups] + held[sorted_groups] + _UNIT_TOLERANCE
+    if oversold.any():
+        raise ValueError(f"redemptions exceed units held in group {sorted_groups[oversold][0]}")
+
+    # Slices between consecutive boundaries belong to exactly one buy and at
+    # most one sell
+    bounds = np.unique(np.concatenate(([0.0], buy_end, sell_start, sell_end)))
+    lo, hi = bounds[:-1], bounds[1:]
+    keep = (hi - lo > _UNIT_TOLERANCE) & (lo < buy_end[-1])
+    lo, hi = lo[keep], hi[keep]
+
+    lot = np.minimum(np.searchsorted(buy_end, lo, side='right'), len(buy_end) - 1)
+    sell = np.searchsorted(sell_start, lo, side='right') - 1
+    matched = (sell >= 0) & (lo < sell_end[np.maximum(sell, 0)] - _UNIT_TOLERANCE)
+
+    return buy_order[lot], np.where(matched, sell_order[np.maximum(sell, 0)], -1), hi - lo
+
+def open_lots(transactions):
+    """Units of each purchase still held after past redemptions"""
+    tx = _prepare(transactions)
+    buys, sells = tx[tx['units'] > 0], tx[tx['units'] < 0]
+    buy_index, sell_index, units = fifo_match(buys['code'], buys['units'], sells['code'], -sells['units'])
+    held = sell_index < 0
+    # A lot's unsold units are always one slice: its tail after every sell
+    lots = buys.iloc[np.sort(buy_index[held])][['scheme', 'date', 'nav']].reset_index(drop=True)
+    lots.insert(2, 'units', units[held][np.argsort(buy_index[held], kind='stable')])
+    lots['scheme'] = lots['scheme'].astype(object)
+    return lots
+
+# --- Redemption tax ---
+def redemption_tax(transactions, schemes, as_of=None, redeem=None, tax_rate=0.30, exemption_used=None):
+    """Tax and exit load of redeeming at the schemes' current NAV, lot by lot.
+
+    redeem maps scheme -> units to sell now, after past redemptions; None
+    sells every unit still held. exemption_used is the equity LTCG
+    exemption already used this financial year; None works it out from this
+    year's past redemptions in transactions.
+
+    Returns (lots, totals): one row per lot sold with its cost, gain, term,
+    tax and exit load, and the summed figures.
+    """
+    as_of = np.datetime64(as_of or datetime.now().date(), 'D')
+    tx = _prepare(transactions, schemes)
+    info = schemes.reindex(tx['scheme'].cat.categories)
+    current_nav = info['nav'].to_numpy(dtype=float)
+
+    buys, past = tx[tx['units'] > 0], tx[tx['units'] < 0]
+    held = np.bincount(buys['code'], weights=buys['units'], minlength=len(info)) \
+        - np.bincount(past['code'], weights=-past['units'], minlength=len(info))
+    if redeem is None:
+        to_sell = np.clip(held, 0, None)
+    else:
+        to_sell = np.zeros(len(info))
+        for scheme, units in redeem.items():
+            if scheme not in info.index:
+                raise ValueError(f"no scheme details for: {scheme}")
+            to_sell[info.index.get_loc(scheme)] = units
+
+    # Today's sells come after every past one, so FIFO puts them on the
+    # oldest units that are left
+    selling = np.flatnonzero(to_sell > 0)
+    sell_code = np.concatenate((past['code'].to_numpy(), selling))
+    sell_units = np.concatenate((-past['units'].to_numpy(dtype=float), to_sell[selling]))
+    sell_date = np.concatenate((_days(past['date']), np.full(len(selling), as_of)))
+    sell_nav = np.concatenate((past['nav'].to_numpy(dtype=float), current_nav[selling]))
+    buy_index, sell_index, units = fifo_match(buys['code'], buys['units'], sell_code, sell_units)
+
+    sold = sell_index >= 0
+    buy_index, sell_index, units = buy_index[sold], sell_index[sold], units[sold]
+    slices = _gains(buys, info, buy_index, units, sell_date[sell_index], sell_nav[sell_index])
+
+    # Only this financial year's past redemptions count against the exemption
+    now = sell_index >= len(past)
+    if exemption_used is None:
+        this_year = now | (sell_date[sell_index] >= _financial_year_start(as_of))
+        earlier = this_year & ~now & (slices['bucket'] == EQUITY_LONG)
+        exemption_used = min(LTCG_EXEMPTION, max(0.0, slices['gain'][earlier].sum()))
+
+    lots = {name: values[now] for name, values in slices.items()}
+    exemption_left = LTCG_EXEMPTION - exemption_used
+    lots['tax'], exempted = _bucket_tax(lots['gain'], lots['bucket'], tax_rate, exemption_left)
+    lots['exit_load'] = np.where(lots['holding_days'] < EXIT_LOAD_DAYS, lots['sale_value'] * EXIT_LOAD_RATE, 0.0)
+
+    order = np.argsort(buy_index[now], kind='stable')
+    lots_df = pd.DataFrame({
+        'scheme': buys['scheme'].astype(object).to_numpy()[buy_index[now]],
+        'purchase_date': _days(buys['date'])[buy_index[now]],
+        'units': units[now],
+        'cost': lots['cost'],
+        'cost_basis': lots['cost_basis'],
+        'sale_value': lots['sale_value'],
+        'gain': lots['gain'],
+        'holding_days': lots['holding_days'],
+        'term': BUCKET_TERMS[lots['bucket']],
+        'equity': lots['bucket'] <= EQUITY_LONG,
+        'tax': lots['tax'],
+        'exit_load': lots['exit_load'],
+    }).iloc[order].reset_index(drop=True)
+
+    totals = {
+        'sale_value': lots['sale_value'].sum(),
+        'cost': lots['cost'].sum(),
+        'gain': lots['gain'].sum(),
+        'ltcg': lots['gain'][BUCKET_TERMS[lots['bucket']] == 'LTCG'].sum(),
+        'stcg': lots['gain'][BUCKET_TERMS[lots['bucket']] == 'STCG'].sum(),
+        'exemption_used': exempted,
+        'exemption_left': exemption_left - exempted,
+        'tax': lots['tax'].sum(),
+        'exit_load': lots['exit_load'].sum(),
+    }
+    totals['net_proceeds'] = totals['sale_value'] - totals['tax'] - totals['exit_load']
+    return lots_df, totals
+
+def _prepare(transactions, schemes=None):
+    """Transactions sorted by date, with a categorical scheme and its code"""
+    tx = transactions[TRANSACTION_COLUMNS].copy()
+    if not pd.api.types.is_datetime64_any_dtype(tx['date']):
+        tx['date'] = pd.to_datetime(tx['date'])
+    names = pd.unique(tx['scheme']) if schemes is None else schemes.index
+    tx['scheme'] = pd.Categorical(tx['scheme'], categories=names)
+    tx['code'] = tx['scheme'].cat.codes.astype(np.int64)
+    if (tx['code'] < 0).any():
+        missing = transactions['scheme'][(tx['code'] < 0).to_numpy()].unique()
+        raise ValueError(f"no scheme details for: {', '.join(sorted(map(str, missing)))}")
+    return tx.sort_values('date', kind='stable').reset_index(drop=True)
+
+def _days(dates):
+    return dates.to_numpy().astype('datetime64[D]')
+
+def _gains(buys, info, buy_index, units, sale_date, sale_nav):
+    """Cost, gain, holding period and bucket of each sold slice"""
+    code = buys['code'].to_numpy()[buy_index]
+    purchase_date = _days(buys['date'])[buy_index]
+    cost_nav = buys['nav'].to_numpy(dtype=float)[buy_index]
+    equity = info['category'].isin(EQUITY_CATEGORIES).to_numpy()[code]
+    holding_days = (sale_date - purchase_date).astype(np.int64)
+    long_term = holding_days > np.where(equity, EQUITY_LTCG_DAYS, DEBT_LTCG_DAYS)
+
+    # Grandfathering only ever raises the cost of pre-2018 equity units
+    cost_basis = cost_nav
+    if 'grandfathered_nav' in info:
+        fmv = info['grandfathered_nav'].to_numpy(dtype=float)[code]
+        grandfathered = equity & long_term & (purchase_date <= np.datetime64(GRANDFATHER_DATE)) & ~np.isnan(fmv)
+        cost_basis = np.where(grandfathered, np.maximum(cost_nav, np.minimum(np.nan_to_num(fmv), sale_nav)), cost_nav)
+
+    return {
+        'cost': units * cost_nav,
+        'cost_basis': units * cost_basis,
+        'sale_value': units * sale_nav,
+        'gain': units * (sale_nav - cost_basis),
+        'holding_days': holding_days,
+        'bucket': np.where(equity, np.where(long_term, EQUITY_LONG, EQUITY_SHORT),
+                           np.where(long_term, DEBT_LONG, DEBT_SHORT)),
+    }
+
+def _bucket_tax(gain, bucket, tax_rate, exemption_left, investor=None, n_investors=1):
+    """Per-lot tax after set-off of losses within each bucket and the equity
+    LTCG exemption, both applied to lots in order. Lots of different
+    investors (integer codes) are set off and exempted separately; returns
+    (tax, exemption used), the exemption used per investor when given."""
+    rates = np.array([EQUITY_STCG_RATE, EQUITY_LTCG_RATE, tax_rate, DEBT_LTCG_RATE])
+    cell = bucket if investor is None else np.asarray(investor, dtype=np.int64) * 4 + bucket
+    n_cells = 4 * n_investors
+    positive = np.clip(gain, 0, None)
+    losses = np.bincount(cell, weights=np.clip(-gain, 0, None), minlength=n_cells)
+    allowance = np.zeros((n_investors, 4))
+    allowance[:, EQUITY_LONG] = np.maximum(0.0, exemption_left)
+    shield = losses + allowance.ravel()
+
+    # Gains of the same bucket before each lot, in lot order
+    order = np.argsort(cell, kind='stable')
+    running = np.cumsum(positive[order])
+    cell_total = np.bincount(cell, weights=positive, minlength=n_cells)
+    before_cell = np.concatenate(([0.0], np.cumsum(cell_total)[:-1]))
+    gains_before = np.empty_like(positive)
+    gains_before[order] = running - positive[order] - before_cell[cell[order]]
+
+    shielded = np.clip(shield[cell] - gains_before, 0, positive)
+    taxable = positive - shielded
+    net_ltcg = (cell_total - losses).reshape(n_investors, 4)[:, EQUITY_LONG]
+    exempted = np.minimum(allowance[:, EQUITY_LONG], np.maximum(0.0, net_ltcg))
+    return taxable * rates[bucket], (exempted[0] if investor is None else exempted)
+
+def lots_tax(lots, investor, n_investors, tax_rate=0.30, exemption_left=LTCG_EXEMPTION):
+    """Tax on lots priced by redemption_tax (or parts of them), with loss
+    set-off and the LTCG exemption applied per investor code rather than
+    across all lots; lots must be in each investor's sale order"""
+    long_term = (lots['term'] == 'LTCG').to_numpy()
+    bucket = np.where(lots['equity'], np.where(long_term, EQUITY_LONG, EQUITY_SHORT),
+                      np.where(long_term, DEBT_LONG, DEBT_SHORT))
+    tax, _ = _bucket_tax(lots['gain'].to_numpy(dtype=float), bucket, tax_rate, exemption_left, investor, n_investors)
+    return tax
+
+def _financial_year_start(day):
+    """1 April of the Indian financial year containing day"""
+    day = pd.Timestamp(day)
+    year = day.year if day.month >= 4 else day.year - 1
+    return np.datetime64(date(year, 4, 1), 'D')
+
+# --- Tax harvesting ---
+def harvest_plan(transactions, schemes, as_of=None, tax_rate=0.30, exemption_used=None):
+    """Units to redeem so that realised equity LTCG uses up what is left of
+    this year's exemption, without realising STCG or paying exit load.
+
+    Only the oldest lots of an equity scheme can be sold (FIFO), so each
+    scheme offers the run of long-term, load-free lots at the front of its
+    queue. Lots are taken greedily by gain per rupee redeemed, which churns
+    the least capital for the exemption used; within a scheme that ratio is
+    ironed to its running minimum so the greedy order never skips a lot.
+    The exemption is per investor: plan each family member separately.
+
+    Returns (plan, summary): units, sale value and gain per scheme, and the
+    gain harvested, the LTCG tax it saves, and the tax and exit load of
+    carrying out the plan (zero unless the inputs change in between).
+    """
+    lots, totals = redemption_tax(transactions, schemes, as_of, tax_rate=tax_rate, exemption_used=exemption_used)
+    available = totals['exemption_used'] + totals['exemption_left']
+    schemes_of = lots['scheme']
+
+    # Harvestable lots: the load-free equity LTCG lots ahead of any other lot
+    free = lots['equity'] & (lots['term'] == 'LTCG') & (lots['exit_load'] == 0)
+    blocked = (~free).astype(int).groupby(schemes_of, sort=False).cummax().astype(bool)
+    ratio = (lots['gain'] / lots['sale_value'].where(lots['sale_value'] > 0)).fillna(0.0)
+    ironed = ratio.groupby(schemes_of, sort=False).cummin()
+    candidates = np.flatnonzero((~blocked & (ironed > 0)).to_numpy())
+
+    # Best ratio first; the stable sort keeps each scheme's lots in FIFO order
+    order = candidates[np.argsort(-ironed.to_numpy()[candidates], kind='stable')]
+    gain = lots['gain'].to_numpy()[order]
+    taken_before = np.cumsum(gain) - gain
+    fraction = np.clip((available - taken_before) / gain, 0.0, 1.0)
+    chosen = order[fraction > 0]
+    fraction = fraction[fraction > 0]
+
+    picked = lots.iloc[chosen][['scheme', 'units', 'sale_value', 'gain']].copy()
+    picked[['units', 'sale_value', 'gain']] = picked[['units', 'sale_value', 'gain']].mul(fraction, axis=0)
+    plan = picked.groupby('scheme', sort=False, as_index=False)[['units', 'sale_value', 'gain']].sum()
+
+    summary = {
+        'exemption_available': available,
+        'gain_harvested': plan['gain'].sum(),
+        'tax_saved': plan['gain'].sum() * EQUITY_LTCG_RATE,
+        'sale_value': plan['sale_value'].sum(),
+        'tax': 0.0,
+        'exit_load': 0.0,
+    }
+    if len(plan):
+        _, check = redemption_tax(transactions, schemes, as_of, redeem=dict(zip(plan['scheme'], plan['units'])),
+                                  tax_rate=tax_rate, exemption_used=LTCG_EXEMPTION - available)
+        summary['tax'], summary['exit_load'] = check['tax'], check['exit_load']
+    return plan, summary
+
+def holdings_transactions(holdings, keys=None, as_of=None):
+    """(transactions, schemes) from analyzer holding rows, one lot per purchase.
+
+    The rows carry amounts rather than units and NAVs, so each row becomes
+    its own scheme holding one unit per rupee invested, valued at current
+    value / invested amount. Its purchases are the lumpsum and monthly SIP
+    instalments up to as_of laid out by xirr.holding_flows, so recent
+    instalments stay short-term and within the exit load period. Schemes are
+    keyed "<name> (row <n>)" unless keys gives one per holding. Rows without
+    an amount or date are skipped.
+    """
+    holdings = list(holdings)
+    flows = holding_flows(holdings, as_of)
+    rows = flows.drop_duplicates('holding')
+    if keys is None:
+        key_of = dict(zip(rows['holding'], rows['scheme']))
+    else:
+        key_of = {row: keys[row] for row in rows['holding']}
+    buys = flows[flows['amount'] < 0]
+    transactions = pd.DataFrame({
+        'scheme': pd.Series(buys['holding'].map(key_of).to_numpy(), dtype=object),
+        'date': buys['date'].to_numpy(),
+        'units': -buys['amount'].to_numpy(dtype=float),
+        'nav': 1.0,
+    }, columns=TRANSACTION_COLUMNS)
+    held = [holdings[row] for row in rows['holding']]
+    schemes = pd.DataFrame({
+        'category': [h.category for h in held],
+        'nav': [(h.current_value or 0) / float(h.invested_amount) for h in held],
+    }, index=pd.Index([key_of[row] for row in rows['holding']], dtype=object))
+    return transactions, schemes
@@ -0,0 +1,392 @@
+"""Generate reports from a JSON/YAML spec without a Streamlit server.
+
+    python -m sahayak.cli spec.yaml [-o report.pdf] [--output-dir reports/] [--state runs.json] [--export results/]
+        [--trace log|traces/] [--metrics run.prom]
+
+A spec is one report, a list of reports, or {"reports": [...]}. Every report
+names its type in "report" and may set "output" (relative to --output-dir);
+the other keys are the builder's inputs, with tables given as lists of row
+dicts. A report that would overwrite another report of the same run fails.
+
+With --state, each report's inputs are fingerprinted and recorded with its
+output, and a later run skips the reports whose inputs are unchanged and
+whose output is still there, so a nightly batch only rebuilds the clients
+that changed.
+
+With --export, the results of goal plan and asset analysis reports are
+also appended to a columnar results export (see sahayak.results_export).
+
+With --trace, each report is timed stage by stage (calculations, tables,
+charts, PDF layout, header and footer drawing) and the spans are logged as
+JSON lines ("log") or written as Chrome trace files to a directory (see
+sahayak.tracing).
+
+With --metrics, the run's report counts, build times, PDF sizes and cache
+hits are written to a file in the Prometheus text format, for a node
+exporter textfile collector (see sahayak.metrics).
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+from datetime import datetime
+
+import pandas as pd
+import streamlit.logger
+
+# The builders' caches fall back to in-memory storage outside a Streamlit
+# server and would otherwise warn about it for every cached function
+streamlit.logger.set_log_level("error")
+
+from sahayak.asset_engine import AnalysisParams, analyze_portfolio, portfolio_from_records
+from sahayak.fund_metrics import fill_fund_performance
+from sahayak.goals import GOAL_ORDER, goal_params, calculate_goal, summarize_goals
+from sahayak.nav_store import MANIFEST_FILE, NavStore
+from sahayak.resources import default_table
+from sahayak.results_export import ResultsWriter
+from sahayak.rolling_returns import ROLLING_WINDOWS, scheme_rolling_returns
+from sahayak.stp import stp_schedule
+from sahayak import metrics, tracing
+
+# --- Spec loading ---
+def load_spec(path):
+    """Parse a report spec from a .json, .yaml or .yml file"""
+    with open(path, encoding='utf-8') as f:
+        if os.path.splitext(path)[1].lower() in ('.yaml', '.yml'):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError("YAML specs need PyYAML (pip install pyyaml); use a .json spec instead")
+            return yaml.safe_load(f)
+        return json.load(f)
+
+def report_specs(spec):
+    """The list of report specs inside a loaded spec"""
+    if isinstance(spec, dict) and 'reports' in spec:
+        spec = spec['reports']
+    specs = spec if isinstance(spec, list) else [spec]
+    for report in specs:
+        if not isinstance(report, dict) or 'report' not in report:
+            raise ValueError("each report spec needs a 'report' type")
+    return specs
+
+def _require(spec, *fields):
+    missing = [field for field in fields if spec.get(field) in (None, "")]
+    if missing:
+        raise ValueError(f"{spec['report']} report is missing {', '.join(missing)}")
+
+def _table(rows):
+    """DataFrame from a list of row dicts, or None when absent"""
+    if rows is None:
+        return None
+    return pd.DataFrame(rows)
+
+def _text(value):
+    # Amounts may be written as numbers in a spec; the PDF builders take the
+    # text typed in the app
+    return "" if value is None else str(value)
+
+def _slug(name):
+    return str(name).replace(' ', '_')
+
+# --- Report builders ---
+# Each takes a report spec and returns (pdf buffer, default file name)
+def build_investment_report(spec):
+    from sahayak.screens.investment_sheet import generate_investment_pdf
+    _require(spec, 'client_name', 'report_date', 'financial_goal', 'investment_horizon', 'risk_profile', 'return_expectation')
+
+    # stp: {start_date, frequency, instalments or instalment_amount} adds the
+    # transfer schedule between the initial and final allocations
+    schedule = None
+    if spec.get('stp'):
+        _require(spec, 'initial_alloc', 'final_alloc')
+        stp = spec['stp']
+        schedule = stp_schedule(_table(spec['initial_alloc']), _table(spec['final_alloc']),
+                                stp.get('start_date'), stp.get('frequency', "Fortnightly"),
+                                stp.get('instalments'), stp.get('instalment_amount'))['schedule']
+
+    # nav_history: {store, benchmark, as_of, rolling_returns} fills
+    # fund_perf's SD to 10Y columns from an imported NAV store, and adds
+    # the funds' rolling returns charted over the given window ("3Y")
+    fund_perf = _table(spec.get('fund_perf'))
+    rolling = None
+    if spec.get('nav_history'):
+        _require(spec, 'fund_perf')
+        history = spec['nav_history']
+        store = NavStore(history['store'])
+        fund_perf, missing = fill_fund_performance(fund_perf, store, history.get('benchmark'), history.get('as_of'))
+        if missing:
+            print(f"warning: no NAV history for {', '.join(missing)}", file=sys.stderr)
+        if history.get('rolling_returns'):
+            window = history['rolling_returns']
+            if window not in ROLLING_WINDOWS:
+                raise ValueError(f"unknown rolling_returns window '{window}' (expected one of: {', '.join(ROLLING_WINDOWS)})")
+            rolling = scheme_rolling_returns(store, fund_perf['Scheme Name'].fillna('').astype(str), window)
+
+    pdf = generate_investment_pdf(
+        spec['client_name'], spec['report_date'], spec['financial_goal'], spec['investment_horizon'],
+        spec['risk_profile'], spec['return_expectation'],
+        investment_amount=_text(spec.get('investment_amount')),
+        sip_amount=_text(spec.get('sip_amount')),
+        strategy_note=spec.get('strategy_note'),
+        lumpsum_alloc=_table(spec.get('lumpsum_alloc')),
+        sip_alloc=_table(spec.get('sip_alloc')),
+        fund_perf=fund_perf,
+        initial_alloc=_table(spec.get('initial_alloc')),
+        final_alloc=_table(spec.get('final_alloc')),
+        factsheet_links=spec.get('factsheet_links', ""),
+        stp_schedule=schedule,
+        rolling_returns=rolling
+    )
+    return pdf, f"Investment_Sheet_{_slug(spec['client_name'])}_{datetime.now().strftime('%Y%m%d')}.pdf"
+
+def build_goal_report(spec, export=None):
+    from sahayak.screens.goal_planner import generate_financial_goal_pdf
+    _require(spec, 'client_name', 'current_age')
+
+    # goals: {goal_key: {field: value}} or a list of goal keys using defaults
+    goals = spec.get('goals') or {goal_key: {} for goal_key in GOAL_ORDER}
+    if isinstance(goals, list):
+        goals = {goal_key: {} for goal_key in goals}
+    unknown = [goal_key for goal_key in goals if goal_key not in GOAL_ORDER]
+    if unknown:
+        raise ValueError(f"unknown goals: {', '.join(unknown)}")
+
+    current_age = spec['current_age']
+    calculated_goals = []
+    with tracing.span("calc.goals", goals=len(goals)):
+        for goal_key in GOAL_ORDER:
+            if goal_key in goals:
+                goal = calculate_goal(goal_key, goal_params(goal_key, goals[goal_key]), current_age)
+                if goal:
+                    calculated_goals.append(goal)
+    if not calculated_goals:
+        raise ValueError("none of the goals produced a result")
+
+    date_field = spec.get('date', datetime.now().strftime("%d-%m-%Y"))
+    risk_profile = spec.get('risk_profile', "Moderate")
+    current_assets = _table(spec.get('current_assets'))
+    results = {
+        'calculated_goals': calculated_goals,
+        **summarize_goals(calculated_goals),
+        'client_name': spec['client_name'],
+        'current_age': current_age,
+        'date_field': date_field,
+        'risk_profile': risk_profile,
+        'edited_assets': current_assets if current_assets is not None else default_table('current_assets')
+    }
+
+    pdf = generate_financial_goal_pdf(results, spec['client_name'], current_age, date_field, risk_profile)
+    if export is not None:
+        export.add_goals(results)
+    return pdf, f"Financial_Goal_Report_{_slug(spec['client_name'])}_{datetime.now().strftime('%Y%m%d')}.pdf"
+
+def build_mom_report(spec):
+    from sahayak.screens.minutes_of_meeting import generate_mom_pdf
+    _require(spec, 'investor_name')
+
+    allocation = _table(spec.get('allocation'))
+    investment = _table(spec.get('investment'))
+    pdf = generate_mom_pdf(
+        spec['investor_name'], spec.get('meeting_organizer', "Mr. Puneet Kohli"),
+        spec.get('meeting_date_time', ""), spec.get('meeting_location', ""), spec.get('minutes_drafted_date', ""),
+        spec.get('investment_horizon', "Short Term"), spec.get('risk_profile', "Conservative"),
+        spec.get('return_expectation', "8% - 10% CAGR"), spec.get('awareness_level', "LOW"),
+        spec.get('agenda_items', "- Review of Asset Allocation\n- Fund Review"),
+        allocation if allocation is not None else default_table('mom_asset_allocation'),
+        investment if investment is not None else default_table('mom_investment'),
+        spec.get('additional_notes', "")
+    )
+    return pdf, f"MOM_{_slug(spec['investor_name'])}_{datetime.now().strftime('%Y%m%d')}.pdf"
+
+def build_checklist_report(spec):
+    from sahayak.screens.meeting_checklist import DEFAULT_CHECKLIST_ITEMS, generate_meeting_checklist_pdf
+    _require(spec, 'client_name')
+
+    items = spec.get('checklist_items') or list(DEFAULT_CHECKLIST_ITEMS)
+    pdf = generate_meeting_checklist_pdf(
+        spec['client_name'], spec.get('meeting_date', ""), spec.get('meeting_time', ""),
+        spec.get('meeting_location', ""), items
+    )
+    return pdf, f"Meeting_Checklist_{_slug(spec['client_name'])}_{datetime.now().strftime('%Y%m%d')}.pdf"
+
+def build_asset_report(spec, export=None):
+    from sahayak.screens.asset_analyzer import build_comparison_data, generate_comprehensive_asset_pdf
+
+    # Either holdings to analyse, {asset class: [holding fields]}, with the
+    # analysis parameters (as_of: YYYY-MM-DD valuation date, default today;
+    # mf_returns: {category: % a year} overrides the default return
+    # assumptions), or results already produced by the analyzer
+    params = None
+    if spec.get('holdings'):
+        params = AnalysisParams(spec.get('horizon_years', 5), spec.get('tax_rate', 0.30), spec.get('inflation', 6.0),
+                                report_as_of(spec), spec.get('mf_returns'))
+        results = analyze_portfolio(portfolio_from_records(spec['holdings']), params)
+        if not results:
+            raise ValueError("none of the holdings could be analysed")
+    else:
+        _require(spec, 'results')
+        results = spec['results']
+
+    selected_assets = spec.get('selected_assets') or list(results)
+    pdf = generate_comprehensive_asset_pdf(results, build_comparison_data(results), selected_assets)
+    if export is not None:
+        export.add_asset_analysis(results, spec.get('client_name', ""), params=params)
+    # Asset specs need not name the client, so a digest of the spec keeps
+    # the default names of one batch apart
+    spec_digest = hashlib.sha256(json.dumps(spec, sort_keys=True, default=str).encode('utf-8')).hexdigest()[:8]
+    client = _slug(spec.get('client_name') or "Client")
+    return pdf, f"Asset_Comparison_Report_{client}_{spec_digest}_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf"
+
+REPORT_BUILDERS = {
+    'investment': build_investment_report,
+    'goal_plan': build_goal_report,
+    'mom': build_mom_report,
+    'checklist': build_checklist_report,
+    'asset_analysis': build_asset_report,
+}
+
+# Reports whose results go to a results export
+EXPORTED_REPORTS = {'goal_plan', 'asset_analysis'}
+
+def build_report(spec, export=None):
+    """Build the PDF for one report spec; returns (buffer, default file name).
+    With export (a ResultsWriter), the report's results are appended to it."""
+    builder = REPORT_BUILDERS.get(spec['report'])
+    if builder is None:
+        raise ValueError(f"unknown report type '{spec['report']}' (expected one of: {', '.join(REPORT_BUILDERS)})")
+    with tracing.request(f"report.{spec['report']}"), metrics.observe_report(spec['report']) as observation:
+        if export is not None and spec['report'] in EXPORTED_REPORTS:
+            pdf, file_name = builder(spec, export)
+        else:
+            pdf, file_name = builder(spec)
+        observation['pdf_bytes'] = pdf.getbuffer().nbytes
+        return pdf, file_name
+
+# --- Incremental runs ---
+# Spec field holding the date a report's figures are valued at; today when
+# it is left out
+AS_OF_FIELDS = {'asset_analysis': 'as_of', 'goal_plan': 'date'}
+
+def report_as_of(spec):
+    """The date a report is valued at, as given in its spec (an as_of of
+    YYYY-MM-DD is parsed), or None for reports that don't depend on one"""
+    field = AS_OF_FIELDS.get(spec.get('report'))
+    if field is None:
+        return None
+    value = spec.get(field)
+    if value is None:
+        return datetime.now().date()
+    if field == 'as_of' and isinstance(value, str):
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    return value
+
+def report_fingerprint(spec, *context):
+    """Digest of everything a report is built from: its spec, the date it
+    is valued at, the NAV store it reads (by the store's import time) and
+    any context such as where it is written"""
+    payload = {'spec': spec, 'as_of': report_as_of(spec), 'context': context}
+    store = (spec.get('nav_history') or {}).get('store')
+    if store:
+        try:
+            payload['nav_store'] = os.path.getmtime(os.path.join(store, MANIFEST_FILE))
+        except OSError:
+            pass
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+def load_run_state(path):
+    """{fingerprint: output file} from an earlier run, empty when there is none"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_run_state(path, state):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=1, sort_keys=True)
+    os.replace(path + '.tmp', path)
+
+# --- Command line ---
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m sahayak.cli", description="Generate Sahayak PDF reports from a JSON/YAML spec")
+    parser.add_argument("spec", help="path to a .json, .yaml or .yml report spec")
+    parser.add_argument("-o", "--output", help="output file; only valid when the spec holds a single report")
+    parser.add_argument("--output-dir", default=".", help="directory for reports without an explicit output (default: current directory)")
+    parser.add_argument("--state", help="run state file; reports whose inputs haven't changed since the run that wrote it are skipped")
+    parser.add_argument("--export", help="directory of a columnar results export to append goal plan and asset analysis results to")
+    parser.add_argument("--trace", help="time each report's stages: 'log' for JSON log lines on stderr, or a directory for Chrome trace files")
+    parser.add_argument("--metrics", help="file to write the run's metrics to, in the Prometheus text format")
+    args = parser.parse_args(argv)
+
+    try:
+        specs = report_specs(load_spec(args.spec))
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    if args.output and len(specs) > 1:
+        print("error: --output needs a spec with a single report; use --output-dir or per-report 'output'", file=sys.stderr)
+        return 2
+
+    try:
+        export = ResultsWriter(args.export) if args.export else None
+        if args.trace:
+            tracing.configure(args.trace)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    previous = load_run_state(args.state) if args.state else {}
+    state = {}
+    written = set()
+    failures = 0
+    for number, spec in enumerate(specs, 1):
+        try:
+            fingerprint = report_fingerprint(spec, args.output, os.path.abspath(args.output_dir))
+            unchanged = fingerprint in previous and os.path.exists(previous[fingerprint])
+            if args.state:
+                metrics.cache_lookup('run_state', unchanged)
+            if unchanged:
+                state[fingerprint] = previous[fingerprint]
+                written.add(os.path.abspath(previous[fingerprint]))
+                print(f"{previous[fingerprint]} (unchanged)")
+                continue
+            pdf, file_name = build_report(spec, export)
+            # Relative per-report outputs are placed under --output-dir
+            output = args.output or os.path.join(args.output_dir, spec.get('output') or file_name)
+            if os.path.abspath(output) in written:
+                raise ValueError(f"{output} is already written by an earlier report of this run; set a distinct 'output'")
+            written.add(os.path.abspath(output))
+            os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+            with open(output, 'wb') as f:
+                f.write(pdf.getvalue())
+            state[fingerprint] = output
+            print(output)
+        except Exception as e:
+            failures += 1
+            print(f"error: report {number} ({spec.get('report')}): {e}", file=sys.stderr)
+
+    if export is not None:
+        try:
+            export.close()
+        except OSError as e:
+            print(f"error: could not write results export: {e}", file=sys.stderr)
+            failures += 1
+    if args.state:
+        # Only this spec's reports are kept, so removed ones don't linger
+        try:
+            save_run_state(args.state, state)
+        except OSError as e:
+            print(f"error: could not save run state: {e}", file=sys.stderr)
+            failures += 1
+    if args.metrics:
+        try:
+            metrics.write(args.metrics)
+        except OSError as e:
+            print(f"error: could not write metrics: {e}", file=sys.stderr)
+            failures += 1
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,267 @@
+"""Local SQLite store of clients and what each screen held for them.
+
+    clients   one row per client and advisor, with the review date; indexed
+              on lower-cased name, advisor and review date
+    records   one row per client and screen: the screen's session values
+              (inputs, edited tables, results) as one JSON document, keyed
+              by (client_id, screen) so loading a screen is one primary key
+              read
+
+The database is created on first use. Records are plain JSON, versioned by
+RECORD_FORMAT: scalars and lists as themselves, and dates, tuples, numpy
+arrays, DataFrames and CompactTables as {"$<type>": ...} objects, tables
+column by column with their dtypes. Nothing in a record names a Python
+class, so loading one never runs code, and a record this version can't
+read fails with ValueError rather than coming back wrong.
+"""
+import json
+import math
+import sqlite3
+import threading
+from datetime import date, datetime, time
+
+import numpy as np
+import pandas as pd
+
+from sahayak.session_store import CompactTable
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS clients (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    advisor TEXT NOT NULL DEFAULT '',
+    review_date TEXT,
+    updated_at TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS clients_name ON clients (name_key, advisor);
+CREATE INDEX IF NOT EXISTS clients_advisor ON clients (advisor, name_key);
+CREATE INDEX IF NOT EXISTS clients_review ON clients (review_date);
+CREATE TABLE IF NOT EXISTS records (
+    client_id INTEGER NOT NULL REFERENCES clients (id) ON DELETE CASCADE,
+    screen TEXT NOT NULL,
+    data BLOB NOT NULL,
+    saved_at TEXT NOT NULL,
+    PRIMARY KEY (client_id, screen)
+) WITHOUT ROWID;
+"""
+
+CLIENT_COLUMNS = ['id', 'name', 'advisor', 'review_date', 'updated_at']
+
+# Version of the record encoding; bump it when the encoding changes
+RECORD_FORMAT = 1
+
+def _name_key(name):
+    return " ".join(str(name).lower().split())
+
+def _iso(value):
+    if value is None or value == "":
+        return None
+    if isinstance(value, (date, datetime)):
+        return value.strftime("%Y-%m-%d")
+    return pd.Timestamp(value).strftime("%Y-%m-%d")
+
+class ClientStore:
+    """Clients and their saved screens in one SQLite file; safe to share
+    between sessions (one connection, serialized by a lock)"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA foreign_keys=ON")
+            self._db.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    # --- Clients ---
+    def save_client(self, name, advisor="", review_date=None):
+        """Id of the client with this name and advisor, created or updated
+        with the review date"""
+        name = " ".join(str(name).split())
+        if not name:
+            raise ValueError("a client needs a name")
+        advisor = " ".join(str(advisor or "").split())
+        now = datetime.now().isoformat(timespec='seconds')
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT INTO clients (name, name_key, advisor, review_date, updated_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (name_key, advisor) DO UPDATE SET name = excluded.name, "
+                "review_date = COALESCE(excluded.review_date, review_date), updated_at = excluded.updated_at",
+                (name, _name_key(name), advisor, _iso(review_date), now))
+            return self._db.execute("SELECT id FROM clients WHERE name_key = ? AND advisor = ?",
+                                    (_name_key(name), advisor)).fetchone()[0]
+
+    def client(self, client_id):
+        """The client's row as a dict, or None"""
+        with self._lock:
+            row = self._db.execute(f"SELECT {', '.join(CLIENT_COLUMNS)} FROM clients WHERE id = ?", (client_id,)).fetchone()
+        return dict(zip(CLIENT_COLUMNS, row)) if row else None
+
+    def find_clients(self, name=None, advisor=None, review_from=None, review_to=None, screen=None, limit=50):
+        """Clients whose name starts with name (any case), optionally for one
+        advisor, with a review date in [review_from, review_to] and with a
+        saved screen, as a DataFrame of CLIENT_COLUMNS plus the screens
+        saved for each"""
+        where, args = [], []
+        if name:
+            # Prefix range on the name index
+            key = _name_key(name)
+            where.append("name_key >= ? AND name_key < ?")
+            args += [key, key + "\uffff"]
+        if advisor:
+            where.append("advisor = ?")
+            args.append(" ".join(str(advisor).split()))
+        if review_from:
+            where.append("review_date >= ?")
+            args.append(_iso(review_from))
+        if review_to:
+            where.append("review_date <= ?")
+            args.append(_iso(review_to))
+        if screen:
+            where.append("EXISTS (SELECT 1 FROM records WHERE client_id = c.id AND screen = ?)")
+            args.append(screen)
+        query = (f"SELECT {', '.join('c.' + column for column in CLIENT_COLUMNS)}, "
+                 "(SELECT group_concat(screen, ', ') FROM records WHERE client_id = c.id) FROM clients c"
+                 + (" WHERE " + " AND ".join(where) if where else "")
+                 + " ORDER BY c.name_key, c.advisor LIMIT ?")
+        with self._lock:
+            rows = self._db.execute(query, args + [int(limit)]).fetchall()
+        return pd.DataFrame(rows, columns=CLIENT_COLUMNS + ['screens'])
+
+    def delete_client(self, client_id):
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM clients WHERE id = ?", (client_id,))
+
+    # --- Screen records ---
+    def save_screen(self, client_id, screen, values):
+        """Store a screen's values (a dict) for the client, replacing any earlier save"""
+        now = datetime.now().isoformat(timespec='seconds')
+        data = encode_record(values)
+        with self._lock, self._db:
+            self._db.execute("INSERT OR REPLACE INTO records (client_id, screen, data, saved_at) VALUES (?, ?, ?, ?)",
+                             (client_id, screen, data, now))
+            self._db.execute("UPDATE clients SET updated_at = ? WHERE id = ?", (now, client_id))
+
+    def load_screen(self, client_id, screen):
+        """The values saved for the client's screen, or None"""
+        with self._lock:
+            row = self._db.execute("SELECT data FROM records WHERE client_id = ? AND screen = ?",
+                                   (client_id, screen)).fetchone()
+        return decode_record(row[0]) if row else None
+
+# --- Record encoding ---
+def encode_record(values):
+    """A screen's values (a dict) as a versioned JSON document, in bytes.
+    Raises ValueError for a value that has no plain encoding."""
+    document = {'format': RECORD_FORMAT, 'values': _encode(values)}
+    return json.dumps(document, allow_nan=False, separators=(',', ':')).encode('utf-8')
+
+def decode_record(data):
+    """The values of a record written by encode_record"""
+    try:
+        document = json.loads(bytes(data).decode('utf-8'))
+    except (UnicodeDecodeError, ValueError):
+        raise ValueError("saved record is not in a format this version can read") from None
+    if not isinstance(document, dict) or document.get('format') != RECORD_FORMAT:
+        version = document.get('format') if isinstance(document, dict) else None
+        raise ValueError(f"saved record has format {version}; this version reads format {RECORD_FORMAT}")
+    return _decode(document['values'])
+
+def _encode(value):
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, np.generic):
+        return _encode(value.item())
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return value if math.isfinite(value) else {'$float': repr(value)}
+    # datetime before date: every datetime is also a date
+    if isinstance(value, datetime):
+        return {'$datetime': value.isoformat()}
+    if isinstance(value, date):
+        return {'$date': value.isoformat()}
+    if isinstance(value, time):
+        return {'$time': value.isoformat()}
+    if value is pd.NaT:
+        return {'$nat': None}
+    if value is pd.NA:
+        return {'$na': None}
+    if isinstance(value, list):
+        return [_encode(v) for v in value]
+    if isinstance(value, tuple):
+        return {'$tuple': [_encode(v) for v in value]}
+    if isinstance(value, dict):
+        if all(isinstance(key, str) and not key.startswith('$') for key in value):
+            return {key: _encode(v) for key, v in value.items()}
+        return {'$dict': [[_encode(key), _encode(v)] for key, v in value.items()]}
+    if isinstance(value, np.ndarray):
+        return {'$array': {'dtype': value.dtype.str, 'shape': list(value.shape),
+                           'data': [_encode(v) for v in value.ravel().tolist()]}}
+    if isinstance(value, CompactTable):
+        return {'$compact_table': _encode_frame(value.to_frame())}
+    if isinstance(value, pd.DataFrame):
+        return {'$frame': _encode_frame(value)}
+    raise ValueError(f"cannot save a {type(value).__name__} in a client record")
+
+def _encode_frame(df):
+    index = None
+    if not (isinstance(df.index, pd.RangeIndex) and df.index.start == 0 and df.index.step == 1):
+        index = {'dtype': str(df.index.dtype), 'data': [_encode(v) for v in df.index.tolist()]}
+    return {
+        'columns': [_encode(name) for name in df.columns],
+        'dtypes': [str(dtype) for dtype in df.dtypes],
+        'data': [[_encode(v) for v in df.iloc[:, i].tolist()] for i in range(df.shape[1])],
+        'length': len(df),
+        'index': index,
+    }
+
+# Tagged objects and the decoders of their payloads
+_DECODERS = {
+    '$float': float,
+    '$datetime': datetime.fromisoformat,
+    '$date': date.fromisoformat,
+    '$time': time.fromisoformat,
+    '$nat': lambda _: pd.NaT,
+    '$na': lambda _: pd.NA,
+    '$tuple': lambda items: tuple(_decode(v) for v in items),
+    '$dict': lambda pairs: {_decode(key): _decode(v) for key, v in pairs},
+    '$array': lambda array: np.array([_decode(v) for v in array['data']],
+                                     dtype=np.dtype(array['dtype'])).reshape(array['shape']),
+    '$frame': lambda frame: _decode_frame(frame),
+    '$compact_table': lambda frame: CompactTable.from_frame(_decode_frame(frame)),
+}
+
+def _decode(value):
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    if not isinstance(value, dict):
+        return value
+    if len(value) == 1:
+        (key, payload), = value.items()
+        if key.startswith('$'):
+            decoder = _DECODERS.get(key)
+            if decoder is None:
+                raise ValueError(f"saved record holds an unknown value type '{key}'")
+            return decoder(payload)
+    return {key: _decode(v) for key, v in value.items()}
+
+def _decode_frame(frame):
+    columns = [_decode(name) for name in frame['columns']]
+    data = {i: _series(values, dtype) for i, (values, dtype) in enumerate(zip(frame['data'], frame['dtypes']))}
+    df = pd.DataFrame(data, index=pd.RangeIndex(frame['length']))
+    df.columns = pd.Index(columns)
+    if frame['index'] is not None:
+        df.index = pd.Index(_series(frame['index']['data'], frame['index']['dtype']))
+    return df
+
+def _series(values, dtype):
+    values = [_decode(v) for v in values]
+    if dtype.startswith('datetime64'):
+        return pd.Series(pd.to_datetime(values)).astype(dtype)
+    return pd.Series(values, dtype=dtype)
@@ -0,0 +1,166 @@
+"""Risk and return metrics of mutual fund schemes from their NAV history.
+
+Fills the Investment Sheet's Fund Performance columns the way factsheets
+quote them:
+
+    SD      annualized standard deviation of monthly returns (%)
+    SR      Sharpe ratio: annualized mean excess return over SD
+    Beta    slope of the monthly excess returns on the benchmark's
+    Alpha   Jensen's alpha, annualized (%)
+    1Y..10Y trailing CAGR to the as-of date (%)
+
+Risk figures use the RISK_WINDOW_MONTHS monthly returns up to the as-of
+date. NAVs are sampled on the as-of date's day of every month, taking the
+last NAV published at most MAX_NAV_GAP_DAYS before it. All schemes are
+computed together as columns of one returns matrix, rolling windows come
+from cumulative sums and the regression against the benchmark is solved
+for every column at once. PE can't be derived from NAVs and is left as
+entered.
+"""
+import numpy as np
+import pandas as pd
+
+from sahayak.tracing import traced
+from sahayak.xirr import instalment_dates
+
+RISK_FREE_RATE = 6.5          # % a year
+RISK_WINDOW_MONTHS = 36
+CAGR_YEARS = {'1Y': 1, '3Y': 3, '5Y': 5, '10Y': 10}
+METRIC_COLUMNS = ['SD', 'SR', 'Beta', 'Alpha'] + list(CAGR_YEARS)
+# Longest run of days without a NAV (holidays, weekends) before a scheme
+# counts as having no price on a date
+MAX_NAV_GAP_DAYS = 7
+# Schemes read from the store per pass, to bound memory over long histories
+SCHEMES_PER_PASS = 500
+
+# --- Vectorized core ---
+def sample_navs(navs, rows):
+    """NAVs of every column on the given row positions of a calendar-day
+    matrix: the last NAV on or up to MAX_NAV_GAP_DAYS before, else NaN"""
+    rows = np.asarray(rows, dtype=np.int64)
+    position = np.where(np.isnan(navs), -1, np.arange(len(navs))[:, None])
+    np.maximum.accumulate(position, axis=0, out=position)
+    found = position[rows]
+    sampled = navs[np.maximum(found, 0), np.arange(navs.shape[1])[None, :]]
+    sampled[(found < 0) | (rows[:, None] - found > MAX_NAV_GAP_DAYS)] = np.nan
+    return sampled
+
+def _window_sums(values, window):
+    # Sum over each trailing window of rows, from one cumulative sum
+    total = np.concatenate((np.zeros((1,) + values.shape[1:]), np.cumsum(values, axis=0)))
+    return total[window:] - total[:-window]
+
+def rolling_risk(returns, benchmark=None, window=RISK_WINDOW_MONTHS, risk_free=RISK_FREE_RATE):
+    """Rolling SD, SR, Beta and Alpha of monthly returns.
+
+    returns is (months x schemes), benchmark the benchmark's monthly
+    returns (months,) or None. Returns a dict of (months - window + 1 x
+    schemes) arrays, one row per window ending at that month; a window with
+    any missing return is NaN.
+    """
+    returns = np.asarray(returns, dtype=float)
+    monthly_free = (1 + risk_free / 100) ** (1 / 12) - 1
+    excess = returns - monthly_free
+    valid = ~np.isnan(excess)
+    x = np.where(valid, excess, 0.0)
+
+    complete = _window_sums(valid.astype(float), window) == window
+    sum_x = _window_sums(x, window)
+    mean_x = sum_x / window
+    var_x = np.clip(_window_sums(x * x, window) - sum_x * mean_x, 0, None) / (window - 1)
+    sd = np.sqrt(var_x)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sharpe = mean_x / sd * np.sqrt(12)
+    metrics = {
+        'SD': np.where(complete, sd * np.sqrt(12) * 100, np.nan),
+        'SR': np.where(complete & (sd > 0), sharpe, np.nan),
+    }
+
+    if benchmark is None:
+        metrics['Beta'] = metrics['Alpha'] = np.full(sd.shape, np.nan)
+        return metrics
+    # Least squares of fund excess on benchmark excess, per column and window
+    y = np.asarray(benchmark, dtype=float)[:, None] - monthly_free
+    both = valid & ~np.isnan(y)
+    x, y = np.where(both, x, 0.0), np.where(both, y, 0.0)
+    complete &= _window_sums(both.astype(float), window) == window
+    sum_x, sum_y = _window_sums(x, window), _window_sums(y, window)
+    covariance = _window_sums(x * y, window) - sum_x * sum_y / window
+    variance = _window_sums(y * y, window) - sum_y * sum_y / window
+    with np.errstate(divide='ignore', invalid='ignore'):
+        beta = covariance / variance
+    alpha = (sum_x - beta * sum_y) / window * 12 * 100
+    metrics['Beta'] = np.where(complete & (variance > 0), beta, np.nan)
+    metrics['Alpha'] = np.where(complete & (variance > 0), alpha, np.nan)
+    return metrics
+
+def trailing_cagr(monthly_navs, years=CAGR_YEARS):
+    """Trailing CAGR (%) to the last row of month-spaced NAVs, one column
+    per entry of years ({label: years}), one row per scheme"""
+    last = monthly_navs[-1]
+    columns = {}
+    for label, span in years.items():
+        months = 12 * span
+        if months < len(monthly_navs):
+            columns[label] = ((last / monthly_navs[-1 - months]) ** (1 / span) - 1) * 100
+        else:
+            columns[label] = np.full(last.shape, np.nan)
+    return columns
+
+# --- From the NAV store ---
+@traced("calc.fund_metrics")
+def fund_metrics(store, codes, benchmark=None, as_of=None, window=RISK_WINDOW_MONTHS, risk_free=RISK_FREE_RATE):
+    """METRIC_COLUMNS for each scheme code in a NavStore, as a DataFrame
+    indexed by code. benchmark is a scheme code or name in the store (an
+    index fund, say) for Beta and Alpha. as_of defaults to the latest NAV
+    among the schemes. Codes not in the store get NaN."""
+    codes = [str(code) for code in codes]
+    known = list(dict.fromkeys(code for code in codes if code in store))
+    benchmark = store.find(benchmark) if benchmark is not None else None
+    if as_of is None:
+        ends = [store.date_range(code)[1] for code in known + ([benchmark] if benchmark else [])]
+        as_of = max(ends) if ends else np.datetime64('today', 'D')
+    as_of = np.datetime64(as_of, 'D')
+
+    # The as-of date's day in each month back to the longest lookback
+    months = max(window, 12 * max(CAGR_YEARS.values()))
+    samples = instalment_dates(np.full(months + 1, as_of), np.arange(-months, 1))
+    start = samples[0] - MAX_NAV_GAP_DAYS
+    rows = (samples - start).astype(np.int64)
+
+    bench_returns = None
+    if benchmark:
+        bench_navs = sample_navs(store.matrix([benchmark], start, as_of)[1], rows)[:, 0]
+        bench_returns = bench_navs[1:] / bench_navs[:-1] - 1
+
+    result = pd.DataFrame(np.nan, index=pd.Index(known, name='code'), columns=METRIC_COLUMNS)
+    for first in range(0, len(known), SCHEMES_PER_PASS):
+        batch = known[first:first + SCHEMES_PER_PASS]
+        monthly = sample_navs(store.matrix(batch, start, as_of)[1], rows)
+        risk = rolling_risk(monthly[1:] / monthly[:-1] - 1, bench_returns, window, risk_free)
+        columns = {name: values[-1] for name, values in risk.items()}
+        columns.update(trailing_cagr(monthly))
+        result.loc[batch, list(columns)] = np.column_stack(list(columns.values()))
+    return result.reindex(pd.Index(codes, name='code'))
+
+def fill_fund_performance(table, store, benchmark=None, as_of=None):
+    """Fund Performance table with the NAV-derived columns filled in.
+
+    Each row's Scheme Name is looked up in the store by code or exact name;
+    rows that aren't found keep what was entered. Returns (table, names not
+    found).
+    """
+    table = table.copy()
+    for column in METRIC_COLUMNS:
+        table[column] = pd.to_numeric(table[column], errors='coerce') if column in table else np.nan
+    names = table['Scheme Name'].fillna('').astype(str).str.strip()
+    codes = [store.find(name) if name else None for name in names]
+    found = [i for i, code in enumerate(codes) if code]
+    missing = [name for name, code in zip(names, codes) if name and not code]
+    if found:
+        metrics = fund_metrics(store, [codes[i] for i in found], benchmark, as_of)
+        values = metrics.to_numpy().round(2)
+        # Keep what was entered where the history is too short for a figure
+        current = table[METRIC_COLUMNS].to_numpy(dtype=float)[found]
+        table.loc[table.index[found], METRIC_COLUMNS] = np.where(np.isnan(values), current, values)
+    return table, missing
@@ -0,0 +1,183 @@
+from sahayak.utils import (calculate_future_value, calculate_sip_amount, calculate_lumpsum_amount,
+                           calculate_stepup_sip, calculate_retirement_corpus)
+from sahayak.metrics import cache_lookup
+from sahayak.tracing import span
+
+# --- Goal definitions ---
+# Goals in the order they are shown and reported
+GOAL_ORDER = ['education', 'marriage', 'emergency', 'retirement']
+
+GOAL_LABELS = {
+    'education': "🎓 Education Goal",
+    'marriage': "💍 Marriage/Business Goal",
+    'emergency': "🚨 Emergency Corpus",
+    'retirement': "🏖️ Retirement Corpus",
+}
+
+# Input fields per goal with their defaults. The field names double as the
+# widget keys of the goal planner screen.
+GOAL_FIELDS = {
+    'education': {
+        'edu_goal_name': "Child Education",
+        'edu_current_age': 5,
+        'edu_target_age': 18,
+        'edu_current_cost': 500000,
+        'edu_inflation': 8.0,
+        'edu_return': 12.0,
+        'edu_already_saved': 0,
+    },
+    'marriage': {
+        'marriage_goal_name': "Marriage/Business",
+        'marriage_target_age': 31,
+        'marriage_amount': 2000000,
+        'marriage_inflation': 6.0,
+        'marriage_return': 10.0,
+        'marriage_already_saved': 0,
+    },
+    'emergency': {
+        'emergency_months': 6,
+        'monthly_expenses': 50000,
+        'emergency_return': 6.0,
+        'emergency_already_saved': 0,
+    },
+    'retirement': {
+        'retirement_age': 60,
+        'retirement_years': 25,
+        'retirement_monthly_exp': 100000,
+        'retirement_inflation': 6.0,
+        'retirement_return': 8.0,
+        'retirement_already_saved': 0,
+    },
+}
+
+# Tax rate applied to real returns when sizing the retirement corpus
+RETIREMENT_TAX_RATE = 0.3
+
+def goal_params(goal_key, values=None):
+    """Inputs for one goal, taking each field from values when present"""
+    values = values or {}
+    return {field: values.get(field, default) for field, default in GOAL_FIELDS[goal_key].items()}
+
+def _goal_row(name, target_value, already_saved, years, expected_return):
+    required_sip = calculate_sip_amount(target_value, years, expected_return, already_saved)
+    stepup_sip = calculate_stepup_sip(required_sip, 10)
+    required_lumpsum = calculate_lumpsum_amount(target_value, years, expected_return, already_saved)
+
+    return {
+        'Goal': f'{name}',
+        'Target Value': target_value,
+        'Already Saved': already_saved,
+        'Progress': (already_saved / target_value * 100) if target_value > 0 else 0,
+        'Deficit': max(0, target_value - already_saved),
+        'Monthly SIP': required_sip,
+        'Step-up SIP': stepup_sip,
+        'Lumpsum': required_lumpsum
+    }
+
+def calculate_goal(goal_key, params, current_age):
+    """Result row for one goal, or None when its inputs don't describe a goal"""
+    p = params
+
+    if goal_key == 'education':
+        if p['edu_current_age'] < p['edu_target_age'] and p['edu_current_cost'] > 0:
+            years_to_education = p['edu_target_age'] - p['edu_current_age']
+            education_future_value = calculate_future_value(p['edu_current_cost'], p['edu_inflation'], years_to_education)
+            return _goal_row(p['edu_goal_name'], education_future_value, p['edu_already_saved'],
+                             years_to_education, p['edu_return'])
+
+    elif goal_key == 'marriage':
+        if p['marriage_target_age'] > current_age and p['marriage_amount'] > 0:
+            years_to_marriage = p['marriage_target_age'] - current_age
+            marriage_future_value = calculate_future_value(p['marriage_amount'], p['marriage_inflation'], years_to_marriage)
+            return _goal_row(p['marriage_goal_name'], marriage_future_value, p['marriage_already_saved'],
+                             years_to_marriage, p['marriage_return'])
+
+    elif goal_key == 'emergency':
+        if p['emergency_months'] > 0 and p['monthly_expenses'] > 0:
+            emergency_target = p['emergency_months'] * p['monthly_expenses']
+            return _goal_row('Emergency Fund', emergency_target, p['emergency_already_saved'],
+                             1, p['emergency_return'])
+
+    elif goal_key == 'retirement':
+        if p['retirement_age'] > current_age and p['retirement_monthly_exp'] > 0:
+            years_to_retirement = p['retirement_age'] - current_age
+            retirement_corpus_needed = calculate_retirement_corpus(
+                p['retirement_monthly_exp'], p['retirement_years'], p['retirement_inflation'],
+                RETIREMENT_TAX_RATE, p['retirement_return']
+            )
+            return _goal_row('Retirement Corpus', retirement_corpus_needed, p['retirement_already_saved'],
+                             years_to_retirement, p['retirement_return'])
+
+    return None
+
+def summarize_goals(calculated_goals):
+    """Combined SIP, step-up SIP and lumpsum over the calculated goals"""
+    return {
+        'total_sip': sum(goal['Monthly SIP'] for goal in calculated_goals),
+        'total_stepup_sip': sum(goal['Step-up SIP'] for goal in calculated_goals),
+        'total_lumpsum': sum(goal['Lumpsum'] for goal in calculated_goals),
+    }
+
+# --- Incremental recalculation ---
+# Goals whose result depends on the client's age as well as their own fields
+AGE_DEPENDENT_GOALS = {'marriage', 'retirement'}
+
+def goal_inputs(goal_key, params, current_age):
+    """Everything calculate_goal reads for one goal, as a comparable tuple"""
+    inputs = tuple(params[field] for field in GOAL_FIELDS[goal_key])
+    return inputs + (current_age,) if goal_key in AGE_DEPENDENT_GOALS else inputs
+
+class GoalPlan:
+    """Goal results kept with the inputs they were calculated from.
+
+    A goal is recalculated only when its inputs (goal_inputs) differ from
+    the last calculation, and the totals only when a goal's result or the
+    selection of goals changed. version counts those changes, so views of
+    the plan can tell whether they are stale.
+    """
+
+    def __init__(self):
+        self._results = {}              # goal_key: (inputs, result row or None)
+        self.selected = ()
+        self.summary = summarize_goals([])
+        self.version = 0
+
+    def result(self, goal_key, values, current_age):
+        """Result row for one goal (see calculate_goal), recalculated only
+        if its inputs changed; values maps field names to inputs"""
+        changed, row = self._refresh(goal_key, values, current_age)
+        if changed and goal_key in self.selected:
+            self._summarize()
+        return row
+
+    def update(self, goal_keys, values, current_age):
+        """Bring the selected goals up to date; returns the goal keys that
+        were recalculated"""
+        with span("calc.goals", goals=len(goal_keys)):
+            changed = [goal_key for goal_key in goal_keys if self._refresh(goal_key, values, current_age)[0]]
+        if changed or tuple(goal_keys) != self.selected:
+            self.selected = tuple(goal_keys)
+            self._summarize()
+        return changed
+
+    def calculated_goals(self):
+        """Result rows of the selected goals that produced one, in selection order"""
+        rows = [self._results[goal_key][1] for goal_key in self.selected if goal_key in self._results]
+        return [row for row in rows if row]
+
+    def _refresh(self, goal_key, values, current_age):
+        # (whether it was recalculated, result row)
+        params = goal_params(goal_key, values)
+        inputs = goal_inputs(goal_key, params, current_age)
+        cached = self._results.get(goal_key)
+        hit = cached is not None and cached[0] == inputs
+        cache_lookup('goal_plan', hit)
+        if hit:
+            return False, cached[1]
+        row = calculate_goal(goal_key, params, current_age)
+        self._results[goal_key] = (inputs, row)
+        return True, row
+
+    def _summarize(self):
+        self.summary = summarize_goals(self.calculated_goals())
+        self.version += 1
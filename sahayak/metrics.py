@@ -0,0 +1,232 @@
+"""Process-wide report and cache metrics in the Prometheus text format.
+
+    sahayak_reports_total{report, status}        reports built, status "ok" or "error"
+    sahayak_report_duration_seconds{report}      histogram of build times
+    sahayak_report_pdf_bytes{report}             histogram of PDF sizes
+    sahayak_cache_lookups_total{cache}           lookups of each cache
+    sahayak_cache_misses_total{cache}            lookups that had to compute the value
+    sahayak_sessions                             live app sessions
+    sahayak_session_bytes{session}               bytes held by each session's state
+    sahayak_session_key_bytes{key}               bytes held under each session_state key,
+                                                 across sessions
+
+A report's error count includes calculation failures as well as PDF layout
+ones. The app serves the metrics at http://127.0.0.1:PORT/metrics when
+SAHAYAK_METRICS_PORT is set (SAHAYAK_METRICS_HOST changes the address);
+CLI runs can write them to a file for a textfile collector (--metrics).
+"""
+import functools
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger("sahayak.metrics")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Report types, as named by the CLI spec's "report" key
+REPORT_TYPES = ('investment', 'mom', 'checklist', 'goal_plan', 'asset_analysis')
+CACHES = ('nav_store', 'scheme_index', 'pdf_image', 'goal_plan', 'run_state')
+
+DURATION_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+PDF_BYTE_BUCKETS = (10e3, 25e3, 50e3, 100e3, 250e3, 500e3, 1e6, 2.5e6, 5e6, 10e6)
+
+_lock = threading.Lock()
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _labels(names, values, extra=""):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _number(value):
+    if value == float('inf'):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+class Counter:
+    def __init__(self, name, help, labelnames=(), initial=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        # Label values reported as 0 before their first increment
+        self._values = {tuple(labels): 0 for labels in initial}
+
+    def inc(self, *labels, amount=1):
+        with _lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels):
+        return self._values.get(labels, 0)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        lines += [f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}"
+                  for labels, value in sorted(self._values.items())]
+        return lines
+
+class Histogram:
+    def __init__(self, name, help, labelnames=(), buckets=DURATION_BUCKETS, initial=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+        # Per label values: count per bucket (not cumulative), then sum
+        self._values = {tuple(labels): [0] * (len(self.buckets) + 1) for labels in initial}
+
+    def observe(self, value, *labels):
+        with _lock:
+            counts = self._values.get(labels)
+            if counts is None:
+                counts = self._values[labels] = [0] * (len(self.buckets) + 1)
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            counts[-1] += value
+
+    def count(self, *labels):
+        counts = self._values.get(labels)
+        return sum(counts[:-1]) if counts else 0
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labels, counts in sorted(self._values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                le = f'le="{_number(bound)}"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {_number(counts[-1])}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+class Gauge:
+    def __init__(self, name, help, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values = {} if labelnames else {(): 0}
+
+    def set(self, value, *labels):
+        with _lock:
+            self._values[labels] = value
+
+    def replace(self, values):
+        """Set every label's value at once, dropping labels not in values
+        ({label tuple: value})"""
+        with _lock:
+            self._values = dict(values)
+
+    def value(self, *labels):
+        return self._values.get(labels, 0)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} gauge"]
+        lines += [f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}"
+                  for labels, value in sorted(self._values.items())]
+        return lines
+
+# --- Metrics ---
+REPORTS = Counter("sahayak_reports_total", "Reports built, by report type and outcome", ('report', 'status'),
+                  initial=[(report, status) for report in REPORT_TYPES for status in ('ok', 'error')])
+REPORT_SECONDS = Histogram("sahayak_report_duration_seconds", "Time to build a report, including its calculations",
+                           ('report',), DURATION_BUCKETS, initial=[(report,) for report in REPORT_TYPES])
+REPORT_BYTES = Histogram("sahayak_report_pdf_bytes", "Size of the generated PDFs", ('report',), PDF_BYTE_BUCKETS,
+                         initial=[(report,) for report in REPORT_TYPES])
+CACHE_LOOKUPS = Counter("sahayak_cache_lookups_total", "Cache lookups", ('cache',), initial=[(cache,) for cache in CACHES])
+CACHE_MISSES = Counter("sahayak_cache_misses_total", "Cache lookups that computed the value", ('cache',),
+                       initial=[(cache,) for cache in CACHES])
+
+# Session figures as last sampled by session_store
+SESSIONS = Gauge("sahayak_sessions", "Live app sessions")
+SESSION_BYTES = Gauge("sahayak_session_bytes", "Bytes held by a session's state", ('session',))
+SESSION_KEY_BYTES = Gauge("sahayak_session_key_bytes", "Bytes held under a session_state key across sessions", ('key',))
+
+METRICS = [REPORTS, REPORT_SECONDS, REPORT_BYTES, CACHE_LOOKUPS, CACHE_MISSES, SESSIONS, SESSION_BYTES,
+           SESSION_KEY_BYTES]
+
+def render():
+    """Every metric in the Prometheus text exposition format"""
+    with _lock:
+        lines = [line for metric in METRICS for line in metric.render()]
+    return "\n".join(lines) + "\n"
+
+def write(path):
+    """Write the metrics to a file (renamed into place, as textfile collectors expect)"""
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        f.write(render())
+    os.replace(path + '.tmp', path)
+
+# --- Recording ---
+_active_report = ContextVar("sahayak_report", default=None)
+
+def cache_lookup(cache, hit):
+    CACHE_LOOKUPS.inc(cache)
+    if not hit:
+        CACHE_MISSES.inc(cache)
+
+@contextmanager
+def observe_report(report):
+    """Count and time building one report; set 'pdf_bytes' in the yielded
+    dict to record its size. Inside another report's observation (a CLI
+    report calling the screen's PDF builder) it records nothing."""
+    observation = {}
+    if _active_report.get() is not None:
+        yield observation
+        return
+    token = _active_report.set(report)
+    started = time.perf_counter()
+    status = 'error'
+    try:
+        yield observation
+        status = 'ok'
+    finally:
+        _active_report.reset(token)
+        REPORTS.inc(report, status)
+        REPORT_SECONDS.observe(time.perf_counter() - started, report)
+        if status == 'ok' and 'pdf_bytes' in observation:
+            REPORT_BYTES.observe(observation['pdf_bytes'], report)
+
+def measured_report(report):
+    """Decorator observing a PDF builder that returns the PDF in a BytesIO"""
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with observe_report(report) as observation:
+                pdf = function(*args, **kwargs)
+                observation['pdf_bytes'] = pdf.getbuffer().nbytes
+                return pdf
+        return wrapper
+    return decorate
+
+# --- HTTP endpoint ---
+class MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split('?')[0] not in ('/metrics', '/'):
+            self.send_error(404)
+            return
+        body = render().encode('utf-8')
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format, *args)
+
+def start_server(port, host="127.0.0.1"):
+    """Serve the metrics at http://host:port/metrics from a daemon thread;
+    returns the server (shutdown() stops it)"""
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="sahayak-metrics", daemon=True).start()
+    return server
@@ -0,0 +1,230 @@
+"""On-disk NAV history, read through numpy.memmap.
+
+A store is a directory with two files:
+
+    navs.f8         every scheme's NAVs as float64, one scheme after another
+    manifest.json   per scheme code: name, first date, length and offset
+
+Each scheme's run has one slot per calendar day from its first to its last
+NAV (NaN on days without one), so a date is found by arithmetic and a date
+range is a single contiguous slice of the file. Only the pages a read
+touches are loaded, never the whole universe.
+
+    python -m sahayak.nav_store STORE_DIR NAVAll.txt [more dumps...]
+
+imports AMFI text dumps into a store, merging with what it already holds.
+"""
+import argparse
+import json
+import os
+import sys
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+
+VALUES_FILE = 'navs.f8'
+MANIFEST_FILE = 'manifest.json'
+STORE_VERSION = 1
+
+# Columns of AMFI's ';'-separated NAV files, found by header name since the
+# daily and history downloads order them differently
+AMFI_COLUMNS = {'Scheme Code': 'code', 'Scheme Name': 'name', 'Net Asset Value': 'nav', 'Date': 'date'}
+
+class NavStore:
+    """Read-only view of a NAV store directory"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, MANIFEST_FILE), encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') != STORE_VERSION:
+            raise ValueError(f"unsupported NAV store version {manifest.get('version')} in {directory}")
+        schemes = manifest['schemes']
+        self.codes = [scheme['code'] for scheme in schemes]
+        self.names = {scheme['code']: scheme['name'] for scheme in schemes}
+        self._row = {code: row for row, code in enumerate(self.codes)}
+        self._by_name = {name.lower(): code for code, name in self.names.items() if name}
+        self._offset = np.array([scheme['offset'] for scheme in schemes], dtype=np.int64)
+        self._start = np.array([scheme['start'] for scheme in schemes], dtype='datetime64[D]')
+        self._length = np.array([scheme['length'] for scheme in schemes], dtype=np.int64)
+        total = int(self._length.sum())
+        self._values = np.memmap(os.path.join(directory, VALUES_FILE), dtype='<f8', mode='r', shape=(total,)) \
+            if total else np.zeros(0)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __contains__(self, code):
+        return str(code) in self._row
+
+    def find(self, scheme):
+        """Code of the scheme given by code or exact (case-insensitive) name, or None"""
+        scheme = str(scheme).strip()
+        if scheme in self._row:
+            return scheme
+        return self._by_name.get(scheme.lower())
+
+    def date_range(self, code):
+        """(first, last) date with a NAV slot for code"""
+        row = self._lookup(code)
+        return self._start[row], self._start[row] + self._length[row] - 1
+
+    def values(self, code, start=None, end=None):
+        """(dates, navs) for every calendar day of code's history between
+        start and end inclusive; navs is a read-only view into the file, NaN
+        on days without a NAV"""
+        row = self._lookup(code)
+        first = self._start[row]
+        lo, hi = 0, int(self._length[row])
+        if start is not None:
+            lo = int(np.clip((np.datetime64(start, 'D') - first).astype(np.int64), lo, hi))
+        if end is not None:
+            hi = int(np.clip((np.datetime64(end, 'D') - first).astype(np.int64) + 1, lo, hi))
+        offset = int(self._offset[row])
+        return first + np.arange(lo, hi), self._values[offset + lo:offset + hi]
+
+    def series(self, code, start=None, end=None):
+        """NAVs of code between start and end as a Series on the days that have one"""
+        dates, navs = self.values(code, start, end)
+        present = ~np.isnan(navs)
+        return pd.Series(np.array(navs[present]), index=pd.DatetimeIndex(dates[present]), name=str(code))
+
+    def matrix(self, codes, start, end):
+        """(dates, navs): calendar days from start to end and a (days x codes)
+        array of NAVs, NaN where a scheme has none or isn't in the store"""
+        start, end = np.datetime64(start, 'D'), np.datetime64(end, 'D')
+        dates = np.arange(start, end + 1)
+        navs = np.full((len(dates), len(codes)), np.nan)
+        for column, code in enumerate(codes):
+            if code in self:
+                code_dates, code_navs = self.values(code, start, end)
+                if len(code_dates):
+                    first = (code_dates[0] - start).astype(np.int64)
+                    navs[first:first + len(code_navs), column] = code_navs
+        return dates, navs
+
+    def _lookup(self, code):
+        row = self._row.get(str(code))
+        if row is None:
+            raise KeyError(f"scheme {code} is not in the NAV store")
+        return row
+
+# --- Writing ---
+def write_store(directory, navs, names=None):
+    """Write a store from a DataFrame with code, date and nav columns
+    (a name column, or names {code: name}, labels the schemes). Replaces
+    any store already in directory."""
+    navs = navs.dropna(subset=['code', 'date', 'nav'])
+    code_index, codes = pd.factorize(navs['code'].astype(str), sort=True)
+    codes = codes.to_numpy(dtype=object)
+    days = pd.to_datetime(navs['date']).to_numpy().astype('datetime64[D]')
+    value = navs['nav'].to_numpy(dtype=float)
+
+    first = np.full(len(codes), np.datetime64('9999-12-31', 'D'))
+    last = np.full(len(codes), np.datetime64('0001-01-01', 'D'))
+    np.minimum.at(first, code_index, days)
+    np.maximum.at(last, code_index, days)
+    length = (last - first).astype(np.int64) + 1
+    offset = np.concatenate(([0], np.cumsum(length)[:-1])).astype(np.int64)
+
+    if names is None:
+        names = {}
+        if 'name' in navs:
+            names = dict(zip(codes, navs['name'].astype(str).groupby(code_index).last()))
+
+    os.makedirs(directory, exist_ok=True)
+    # Write beside the live files and swap them in, so readers never see a
+    # half-written store
+    values_path = os.path.join(directory, VALUES_FILE)
+    if length.sum():
+        values = np.memmap(values_path + '.tmp', dtype='<f8', mode='w+', shape=(int(length.sum()),))
+        values[:] = np.nan
+        # Later rows win where a dump repeats a date
+        values[offset[code_index] + (days - first[code_index]).astype(np.int64)] = value
+        values.flush()
+        del values
+    else:
+        open(values_path + '.tmp', 'wb').close()
+
+    manifest = {
+        'version': STORE_VERSION,
+        'schemes': [
+            {'code': str(c), 'name': names.get(c, ""), 'start': str(s), 'length': int(n), 'offset': int(o)}
+            for c, s, n, o in zip(codes, first, length, offset)
+        ],
+    }
+    with open(os.path.join(directory, MANIFEST_FILE) + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+    os.replace(values_path + '.tmp', values_path)
+    os.replace(os.path.join(directory, MANIFEST_FILE) + '.tmp', os.path.join(directory, MANIFEST_FILE))
+
+def store_frame(store):
+    """Everything in a store as a code, name, date, nav DataFrame"""
+    frames = []
+    for code in store.codes:
+        dates, navs = store.values(code)
+        present = ~np.isnan(navs)
+        frames.append(pd.DataFrame({'code': code, 'name': store.names[code], 'date': dates[present],
+                                    'nav': np.array(navs[present])}))
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=['code', 'name', 'date', 'nav'])
+
+# --- AMFI import ---
+def read_amfi(path):
+    """NAV rows (code, name, date, nav) from an AMFI ';'-separated text dump.
+
+    Both the daily NAVAll file and the NAV history report interleave
+    data rows with blank lines and fund house / category headings; only
+    lines with the header's number of fields are read. Rows whose NAV is
+    not a number (e.g. "N.A.") are dropped.
+    """
+    with open(path, encoding='utf-8', errors='replace') as f:
+        lines = f.read().splitlines()
+    header_at = next((i for i, line in enumerate(lines) if 'Scheme Code' in line and ';' in line), None)
+    if header_at is None:
+        raise ValueError(f"{path} is not an AMFI NAV file (no 'Scheme Code' header)")
+    header = [field.strip() for field in lines[header_at].split(';')]
+    missing = [column for column in AMFI_COLUMNS if column not in header]
+    if missing:
+        raise ValueError(f"{path} has no {', '.join(missing)} column")
+
+    fields = len(header)
+    rows = [line for line in lines[header_at + 1:] if line.count(';') == fields - 1]
+    frame = pd.read_csv(StringIO("\n".join(rows)), sep=';', header=None, names=header, dtype=str,
+                        usecols=list(AMFI_COLUMNS)).rename(columns=AMFI_COLUMNS)
+    frame['code'] = frame['code'].str.strip()
+    frame['name'] = frame['name'].str.strip()
+    frame['nav'] = pd.to_numeric(frame['nav'].str.replace(',', ''), errors='coerce')
+    frame['date'] = pd.to_datetime(frame['date'].str.strip(), format='%d-%b-%Y', errors='coerce')
+    return frame.dropna(subset=['code', 'nav', 'date'])[['code', 'name', 'date', 'nav']]
+
+def import_amfi(paths, directory, merge=True):
+    """Import AMFI dumps into the store in directory, keeping its existing
+    history unless merge is False; later files win on repeated dates.
+    Returns the opened store."""
+    frames = [read_amfi(path) for path in paths]
+    if merge and os.path.exists(os.path.join(directory, MANIFEST_FILE)):
+        frames.insert(0, store_frame(NavStore(directory)))
+    navs = pd.concat(frames, ignore_index=True)
+    # Scheme names from the most recent file that has one
+    names = navs[navs['name'] != ""].groupby('code')['name'].last().to_dict()
+    write_store(directory, navs, names)
+    return NavStore(directory)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m sahayak.nav_store", description="Import AMFI NAV text dumps into a NAV store")
+    parser.add_argument("store", help="store directory (created if missing)")
+    parser.add_argument("files", nargs='+', help="AMFI NAV files (NAVAll.txt or NAV history reports)")
+    parser.add_argument("--replace", action='store_true', help="rebuild the store from these files only")
+    args = parser.parse_args(argv)
+
+    try:
+        store = import_amfi(args.files, args.store, merge=not args.replace)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    print(f"{args.store}: {len(store)} schemes")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
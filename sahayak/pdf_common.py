@@ -0,0 +1,185 @@
+import pandas as pd
+from reportlab.lib.pagesizes import A4
+from reportlab.lib import colors
+from reportlab.platypus import Table, TableStyle, Paragraph
+from reportlab.lib.colors import HexColor
+
+from sahayak.utils import format_indian_number
+from sahayak.tracing import span, traced
+from sahayak.resources import LOGO, FOOTER, register_unicode_font, table_cell_style, pdf_image_reader
+
+# Register Unicode font
+UNICODE_FONT = register_unicode_font()
+
+# Common disclaimer text
+DISCLAIMER_TEXT = """Any information provided by Sahayak & their associates does not constitute an investment advice, offer, invitation & inducement to invest in securities or other investments and Sahayak is not soliciting any action based on it. 
+Keep in mind that investing involves risk. The value of your investment will fluctuate over time, and you may gain or lose money / original capital. 
+Guidance provided by Sahayak is purely educational. Sahayak doesn't guarantee that the information disseminated herein would result in any monetary or financial gains or loss as the information is purely educational & based on past returns & performance. 
+Past performance is not a guide for future performance. Future returns are not guaranteed, and loss of original capital may occur. 
+Before acting on any information, investor should consider whether it is suitable for their particular circumstances and if necessary, seek professional investment advice from a Registered Investment Advisor. 
+All investments especially mutual fund investments are subject to market risks. Kindly read the Offer Documents carefully before investing. 
+Sahayak does not provide legal or tax advice. The information herein is general and educational in nature and should not be considered legal or tax advice.
+Tax laws and regulations are complex and subject to change, which can materially impact investment results. 
+Sahayak doesn't guarantee that the information provided herein is accurate, complete, or timely. 
+Sahayak makes no warranties with regard to such information or results obtained by its use, and disclaim any liability arising out of your use of, or any tax position taken in reliance on such information. 
+Sahayak is a distributor of financial products and NOT an investment advisor and NOT Authorized to provide any investment advice by SEBI. 
+Sahayak Associates is an AMFI Registered Mutual Fund Distributor only."""
+
+# --- PDF Helper Functions ---
+@traced("pdf.header_footer")
+def header_footer_with_logos(canvas, doc):
+    canvas.saveState()
+    width, height = A4
+    
+    logo = pdf_image_reader(LOGO)
+    if logo is not None:
+        try:
+            logo_width = 250
+            logo_height = 150
+            logo_x = (width - logo_width) / 2
+            logo_y = height - 160
+            
+            with span("pdf.draw_logo"):
+                canvas.drawImage(logo, logo_x, logo_y, width=logo_width, height=logo_height, preserveAspectRatio=True, mask='auto')
+        except Exception as e:
+            canvas.setFont('Helvetica-Bold', 14)
+            canvas.drawCentredString(width/2.0, height-50, "SAHAYAK ASSOCIATES")
+    else:
+        canvas.setFont('Helvetica-Bold', 14)
+        canvas.drawCentredString(width/2.0, height-50, "SAHAYAK ASSOCIATES")
+    
+    footer = pdf_image_reader(FOOTER)
+    if footer is not None:
+        try:
+            footer_height = 80
+            with span("pdf.draw_footer"):
+                canvas.drawImage(footer, 0, 0, width=width, height=footer_height, preserveAspectRatio=True, mask='auto')
+        except Exception as e:
+            canvas.setFont('Helvetica', 9)
+            canvas.drawCentredString(width/2.0, 30, "Contact: 91-9872804694 | www.sahayakassociates.com")
+    else:
+        canvas.setFont('Helvetica', 9)
+        canvas.drawCentredString(width/2.0, 30, "Contact: 91-9872804694 | www.sahayakassociates.com")
+        
+    page_number_text = "Page %d" % doc.page
+    canvas.setFont('Helvetica', 9)
+    canvas.drawCentredString(width/2.0, 90, page_number_text)
+    
+    canvas.restoreState()
+
+@traced("table.dataframe")
+def dataframe_to_table(df):
+    with span("table.format", rows=len(df)):
+        df = df.fillna('-')
+        for col in df.columns:
+            if df[col].dtype == float:
+                df[col] = df[col].apply(lambda x: format_indian_number(x) if pd.notna(x) and x != '-' else '-')
+
+    cell_style = table_cell_style('TableCell')
+
+    header_data = [Paragraph(col_name, cell_style) for col_name in df.columns]
+    
+    table_data = []
+    with span("table.cells", rows=len(df)):
+        for index, row in df.iterrows():
+            row_data = []
+            for item in row:
+                if 'Amount' in str(item) or (isinstance(item, (int, float)) and item > 999):
+                    formatted_item = format_indian_number(item)
+                    row_data.append(Paragraph(f"Rs.{formatted_item}", cell_style))
+                else:
+                    row_data.append(Paragraph(str(item), cell_style))
+            table_data.append(row_data)
+
+    data = [header_data] + table_data
+
+    table = Table(data, colWidths=None, repeatRows=1) 
+    table.setStyle(TableStyle([
+        ('GRID', (0,0), (-1,-1), 0.5, colors.black),
+        ('BACKGROUND', (0,0), (-1,0), HexColor('#E6F3F8')),
+        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+        ('LEFTPADDING', (0,0), (-1,-1), 4),
+        ('RIGHTPADDING', (0,0), (-1,-1), 4),
+        ('ALIGN', (0,0), (-1,0), 'CENTER'),
+        ('ALIGN', (0,1), (-1,-1), 'LEFT'),
+        ('ALIGN', (-2,1), (-1,-1), 'RIGHT'),
+    ]))
+    return table
+
+@traced("table.fund_performance")
+def fund_performance_table(df):
+    df = df.fillna('-')
+    
+    numerical_cols = ['PE', 'SD', 'SR', 'Beta', 'Alpha', '1Y', '3Y', '5Y', '10Y']
+    for col in numerical_cols:
+        if col in df.columns:
+            df[col] = df[col].apply(lambda x: f"{float(x):.2f}" if pd.notna(x) and x != '-' else '-')
+
+    display_columns = ['Scheme Name', 'PE', 'SD', 'SR', 'Beta', 'Alpha', '1Y', '3Y', '5Y', '10Y']
+    current_columns = df.columns.tolist()
+    final_display_columns = [col for col in display_columns if col in current_columns]
+    df_display = df.reindex(columns=final_display_columns)
+
+    cell_style = table_cell_style('FundPerfCell')
+    
+    header_row1_elements = []
+    header_row2_elements = []
+
+    if 'Scheme Name' in final_display_columns:
+        header_row1_elements.append(Paragraph('', cell_style))
+        header_row2_elements.append(Paragraph('Scheme Name', cell_style))
+    
+    ratio_cols = [col for col in ['PE', 'SD', 'SR', 'Beta', 'Alpha'] if col in final_display_columns]
+    if ratio_cols:
+        header_row1_elements.append(Paragraph('Ratios', cell_style))
+        header_row1_elements.extend([Paragraph('', cell_style)] * (len(ratio_cols) - 1))
+        header_row2_elements.extend([Paragraph(col, cell_style) for col in ratio_cols])
+        
+    return_cols = [col for col in ['1Y', '3Y', '5Y', '10Y'] if col in final_display_columns]
+    if return_cols:
+        header_row1_elements.append(Paragraph('Returns', cell_style))
+        header_row1_elements.extend([Paragraph('', cell_style)] * (len(return_cols) - 1))
+        header_row2_elements.extend([Paragraph(col, cell_style) for col in return_cols])
+
+    table_data_rows = []
+    for index, row in df_display.iterrows():
+        row_data = []
+        for item in row:
+            row_data.append(Paragraph(str(item), cell_style))
+        table_data_rows.append(row_data)
+
+    data = [header_row1_elements, header_row2_elements] + table_data_rows
+
+    table = Table(data, colWidths=None, repeatRows=2) 
+    
+    style_commands = [
+        ('GRID', (0,0), (-1,-1), 0.25, colors.black),
+        ('BACKGROUND', (0,0), (-1,1), HexColor('#E6F3F8')),
+        ('LINEBELOW', (0,0), (-1,1), 1, colors.black),
+        ('LINEABOVE', (0,0), (-1,0), 1, colors.black),
+        ('LINEBELOW', (0,-1), (-1,-1), 1, colors.black),
+        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+        ('ALIGN', (0,0), (-1,1), 'CENTER'),
+    ]
+
+    if 'PE' in final_display_columns and 'Alpha' in final_display_columns:
+        pe_idx = final_display_columns.index('PE')
+        alpha_idx = final_display_columns.index('Alpha')
+        style_commands.append(('SPAN', (pe_idx, 0), (alpha_idx, 0)))
+
+    if '1Y' in final_display_columns and '10Y' in final_display_columns:
+        _1y_idx = final_display_columns.index('1Y')
+        _10y_idx = final_display_columns.index('10Y')
+        style_commands.append(('SPAN', (_1y_idx, 0), (_10y_idx, 0)))
+        
+    first_num_col_idx = -1
+    for col_name in display_columns:
+        if col_name in final_display_columns and col_name != 'Scheme Name':
+            first_num_col_idx = final_display_columns.index(col_name)
+            break
+            
+    if first_num_col_idx != -1:
+        style_commands.append(('ALIGN', (first_num_col_idx, 2), (-1,-1), 'RIGHT'))
+
+    table.setStyle(TableStyle(style_commands))
+    return table
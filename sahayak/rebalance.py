@@ -0,0 +1,245 @@
+"""Switch plans that move a portfolio to a target asset allocation.
+
+Every holding is a lot that can be sold, priced with the analyzer's own tax
+rules: mutual fund rows lot by lot through capital_gains, property and gold
+through their analysers, FDs at no capital gains cost (their interest is
+taxed as it accrues; premature-withdrawal penalties are not modelled).
+Over-allocated classes sell their cheapest lots first, by tax and exit load
+per rupee sold, and the proceeds are switched into the under-allocated
+classes. Lot selection, pricing and switch matching each run on arrays for
+a whole client book at once.
+"""
+import numpy as np
+import pandas as pd
+
+from sahayak.asset_engine import ASSET_CLASSES, analyze_real_estate, analyze_gold
+from sahayak.capital_gains import (EQUITY_STCG_RATE, EQUITY_LTCG_RATE, DEBT_LTCG_RATE, fifo_match, redemption_tax,
+                                   lots_tax, holdings_transactions)
+
+LOT_COLUMNS = ['client', 'asset_class', 'holding', 'value', 'cost', 'divisible', 'gain', 'term', 'equity', 'exit_load']
+
+# Target allocations must add up to 100% within this per asset class, so
+# shares entered to two decimals (3 x 33.33%) are accepted
+_PERCENT_TOLERANCE = 0.005
+
+# --- Lots ---
+def book_lots(portfolios, params):
+    """One row per sellable holding of every client (numbered in order):
+    its value, the estimated tax and exit load of selling all of it, and
+    whether it can be sold in part. Mutual fund rows also carry the gain,
+    term and exit load that price part-sales exactly."""
+    rows = []
+    funds, fund_keys = [], []
+    for client, portfolio in enumerate(portfolios):
+        for i, fund in enumerate(portfolio.get('Mutual Funds', [])):
+            label = f"{fund.scheme_name or 'Scheme'} (row {i + 1})"
+            funds.append(fund)
+            fund_keys.append((client, label))
+            # Undated rows pay no tax or exit load in the analyzer either
+            if (fund.current_value or 0) > 0 and not ((fund.invested_amount or 0) > 0 and pd.notna(fund.investment_date)):
+                rows.append((client, 'Mutual Funds', label, float(fund.current_value), 0.0, True))
+        for i, prop in enumerate(portfolio.get('Real Estate', [])):
+            result = analyze_real_estate([prop], params)
+            if result:
+                rows.append((client, 'Real Estate', f"{prop.property_type} (row {i + 1})", float(result['current_value']),
+                             float(result['tax_impact']), prop.property_type == "REIT"))
+        for i, gold in enumerate(portfolio.get('Gold', [])):
+            result = analyze_gold([gold], params)
+            if result:
+                rows.append((client, 'Gold', f"{gold.gold_type} (row {i + 1})", float(result['current_value']),
+                             float(result['tax_impact']), True))
+        for i, fd in enumerate(portfolio.get('Fixed Deposits', [])):
+            if fd.amount and fd.amount > 0:
+                rows.append((client, 'Fixed Deposits', f"{fd.fd_type} (row {i + 1})", float(fd.amount), 0.0, True))
+
+    lots = pd.DataFrame(rows, columns=LOT_COLUMNS[:6])
+    fund_lots = _fund_lots(funds, fund_keys, params)
+    lots = pd.concat([lots, fund_lots], ignore_index=True) if len(fund_lots) else lots.reindex(columns=LOT_COLUMNS)
+    lots = lots.astype({'client': np.int64, 'value': float, 'cost': float, 'divisible': bool, 'gain': float,
+                        'exit_load': float})
+    return lots.sort_values('client', kind='stable', ignore_index=True)
+
+def _fund_lots(funds, fund_keys, params):
+    """Mutual fund purchase lots (lumpsums and SIP instalments) of the whole
+    book, in FIFO order, priced in one redemption_tax call"""
+    # Rows are keyed by position in the book, so every client's rows are
+    # distinct schemes
+    transactions, schemes = holdings_transactions(funds, keys=list(range(len(funds))), as_of=params.as_of)
+    if transactions.empty:
+        return pd.DataFrame(columns=LOT_COLUMNS)
+    lots, _ = redemption_tax(transactions, schemes, params.as_of, tax_rate=params.tax_rate)
+    lots = lots[lots['sale_value'] > 0]
+
+    # Marginal tax before the LTCG exemption and loss set-off, which the
+    # pricing of the chosen lots applies per client
+    long_term = (lots['term'] == 'LTCG').to_numpy()
+    rate = np.where(lots['equity'], np.where(long_term, EQUITY_LTCG_RATE, EQUITY_STCG_RATE),
+                    np.where(long_term, DEBT_LTCG_RATE, params.tax_rate))
+    owner = [fund_keys[key] for key in lots['scheme']]
+    return pd.DataFrame({
+        'client': [client for client, _ in owner],
+        'asset_class': 'Mutual Funds',
+        'holding': [label for _, label in owner],
+        'value': lots['sale_value'].to_numpy(),
+        'cost': lots['gain'].to_numpy() * rate + lots['exit_load'].to_numpy(),
+        'divisible': True,
+        'gain': lots['gain'].to_numpy(),
+        'term': lots['term'].to_numpy(),
+        'equity': lots['equity'].to_numpy(),
+        'exit_load': lots['exit_load'].to_numpy(),
+    })
+
+# --- Planning ---
+def rebalance_book(portfolios, targets, params):
+    """Switch plans for many clients.
+
+    portfolios is a list of portfolios or a dict of client id -> portfolio
+    (plans keep the ids). targets is one {asset class: %} allocation for
+    every client, or a list/dict of them matching portfolios. Returns one
+    plan per client, as from rebalance_plan.
+    """
+    ids = list(portfolios) if isinstance(portfolios, dict) else list(range(len(portfolios)))
+    holdings = list(portfolios.values()) if isinstance(portfolios, dict) else list(portfolios)
+    if isinstance(targets, dict) and set(targets) <= set(ASSET_CLASSES):
+        targets = [targets] * len(holdings)
+    elif isinstance(targets, dict):
+        targets = [targets[client] for client in ids]
+    n_clients, n_classes = len(holdings), len(ASSET_CLASSES)
+    target_pct = np.array([[_check_target(target).get(asset_class, 0.0) for asset_class in ASSET_CLASSES]
+                           for target in targets], dtype=float).reshape(n_clients, n_classes)
+
+    lots = book_lots(holdings, params)
+    client = lots['client'].to_numpy()
+    value = lots['value'].to_numpy()
+
+    # (client, asset class) grid of current and target values
+    cell = client * n_classes + pd.Categorical(lots['asset_class'], categories=list(ASSET_CLASSES)).codes
+    current = np.bincount(cell, weights=value, minlength=n_clients * n_classes).reshape(n_clients, n_classes)
+    target = target_pct / 100 * current.sum(axis=1, keepdims=True)
+    excess = np.clip(current - target, 0, None)
+
+    # Cheapest lots first within each over-allocated cell. The last lot a
+    # cell needs is sold in part, or whole when it can't be split (a
+    # property), which can leave that class under target. A fund sells its
+    # lots FIFO, so each lot's cost ratio is ironed to the running maximum
+    # of its holding and the stable sort never takes a lot before older ones.
+    ratio = np.divide(lots['cost'].to_numpy(), value, out=np.zeros(len(lots)), where=value > 0)
+    ratio = pd.Series(ratio).groupby([client, lots['holding'].to_numpy()], sort=False).cummax().to_numpy()
+    order = np.lexsort((ratio, cell))
+    sorted_value = value[order]
+    running = np.cumsum(sorted_value)
+    cell_start = np.searchsorted(cell[order], cell[order], side='left')
+    before = running - sorted_value - np.where(cell_start > 0, running[cell_start - 1], 0.0)
+    need = excess.ravel()[cell[order]]
+    fraction = np.clip(np.divide(need - before, sorted_value, out=np.zeros(len(order)), where=sorted_value > 0), 0, 1)
+    fraction = np.where(lots['divisible'].to_numpy()[order], fraction, np.ceil(fraction))
+    sold = np.zeros(len(lots))
+    sold[order] = fraction
+
+    sells = _price_sells(lots[sold > 0], sold[sold > 0], n_clients, params)
+    switches = _switches(sells, np.clip(target - current, 0, None))
+
+    plans = [_client_plan(client_sells, client_switches, current[number], target[number], target_pct[number])
+             for number, (client_sells, client_switches) in enumerate(zip(_split(sells, n_clients), _split(switches, n_clients)))]
+    return dict(zip(ids, plans)) if isinstance(portfolios, dict) else plans
+
+def rebalance_plan(portfolio, target, params):
+    """Switches that move one portfolio to target, {asset class: % of the portfolio}.
+
+    Returns a dict with 'allocation' (current and target value and share per
+    asset class), 'sells' (what to sell, with its tax and exit load),
+    'switches' (amounts moving from one class to another, after tax and
+    exit load) and 'summary' totals.
+    """
+    return rebalance_book([portfolio], target, params)[0]
+
+def target_adds_up(target):
+    """Whether a target allocation's percentages add up to 100"""
+    return abs(sum(target.values()) - 100) <= _PERCENT_TOLERANCE * max(len(target), 1) + 1e-9
+
+def _check_target(target):
+    unknown = [asset_class for asset_class in target if asset_class not in ASSET_CLASSES]
+    if unknown:
+        raise ValueError(f"unknown asset class '{unknown[0]}' (expected one of: {', '.join(ASSET_CLASSES)})")
+    if not target_adds_up(target):
+        raise ValueError(f"target allocation adds up to {sum(target.values()):g}%, not 100%")
+    return target
+
+def _price_sells(lots, fraction, n_clients, params):
+    """Sale value, tax and exit load of selling fraction of each lot"""
+    sells = lots[['client', 'asset_class', 'holding']].reset_index(drop=True)
+    sells['sale_value'] = lots['value'].to_numpy() * fraction
+    sells['tax'] = lots['cost'].to_numpy() * fraction
+    sells['exit_load'] = 0.0
+
+    # Fund sales are priced exactly: each lot is a single purchase (a
+    # lumpsum or SIP instalment), so its gain and load scale with the part
+    # sold, and each client gets their own loss set-off and LTCG exemption
+    funds = lots['gain'].notna().to_numpy()
+    if funds.any():
+        parts = lots[funds][['gain', 'term', 'equity']].copy()
+        parts['gain'] *= fraction[funds]
+        sells.loc[funds, 'tax'] = lots_tax(parts, lots['client'].to_numpy()[funds], n_clients, params.tax_rate)
+        sells.loc[funds, 'exit_load'] = lots['exit_load'].to_numpy()[funds] * fraction[funds]
+    sells['net_proceeds'] = sells['sale_value'] - sells['tax'] - sells['exit_load']
+    # One row per holding, however many of its lots were sold
+    return sells.groupby(['client', 'asset_class', 'holding'], sort=False, as_index=False).sum()
+
+def _switches(sells, shortfall):
+    """Each client's sale proceeds split across their under-allocated
+    classes in proportion to the shortfall: (client, from, to, amount)"""
+    n_clients, n_classes = shortfall.shape
+    source_cell = sells['client'].to_numpy() * n_classes \
+        + pd.Categorical(sells['asset_class'], categories=list(ASSET_CLASSES)).codes
+    proceeds = np.bincount(source_cell, weights=sells['net_proceeds'].to_numpy(), minlength=n_clients * n_classes)
+    proceeds = np.clip(proceeds, 0, None).reshape(n_clients, n_classes)
+    total_shortfall = shortfall.sum(axis=1, keepdims=True)
+    invest = shortfall * np.divide(proceeds.sum(axis=1, keepdims=True), total_shortfall,
+                                   out=np.zeros_like(total_shortfall), where=total_shortfall > 0)
+
+    # Lay each client's proceeds and purchases on one axis and pair the
+    # overlapping stretches, as FIFO matching does with units
+    source, destination = np.flatnonzero(proceeds), np.flatnonzero(invest)
+    if not len(source) or not len(destination):
+        return pd.DataFrame({'client': np.zeros(0, dtype=np.int64), 'from': np.zeros(0, dtype=object),
+                             'to': np.zeros(0, dtype=object), 'amount': np.zeros(0)})
+    start, end, amount = fifo_match(source // n_classes, proceeds.ravel()[source],
+                                    destination // n_classes, invest.ravel()[destination] * (1 - 1e-12))
+    matched = end >= 0
+    classes = np.array(list(ASSET_CLASSES), dtype=object)
+    return pd.DataFrame({
+        'client': source[start[matched]] // n_classes,
+        'from': classes[source[start[matched]] % n_classes],
+        'to': classes[destination[end[matched]] % n_classes],
+        'amount': amount[matched],
+    })
+
+def _split(frame, n_clients):
+    """frame (in client order) as one DataFrame per client, without the
+    client column"""
+    bounds = np.searchsorted(frame['client'].to_numpy(), np.arange(n_clients + 1))
+    columns = {name: frame[name].to_numpy() for name in frame.columns if name != 'client'}
+    return [pd.DataFrame({name: values[start:end] for name, values in columns.items()})
+            for start, end in zip(bounds[:-1], bounds[1:])]
+
+def _client_plan(sells, switches, current, target, target_pct):
+    total = current.sum()
+    allocation = pd.DataFrame({
+        'current_value': current,
+        'current_pct': current / total * 100 if total else np.zeros(len(current)),
+        'target_pct': target_pct,
+        'target_value': target,
+    }, index=pd.Index(list(ASSET_CLASSES), name='asset_class'))
+    allocation['change'] = allocation['target_value'] - allocation['current_value']
+
+    return {
+        'allocation': allocation,
+        'sells': sells,
+        'switches': switches,
+        'summary': {
+            'sale_value': sells['sale_value'].sum(),
+            'tax': sells['tax'].sum(),
+            'exit_load': sells['exit_load'].sum(),
+            'net_proceeds': sells['net_proceeds'].sum(),
+        },
+    }
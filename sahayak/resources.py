@@ -0,0 +1,178 @@
+import os
+
+import streamlit as st
+import pandas as pd
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+
+from sahayak import metrics, session_store
+from sahayak.client_store import ClientStore
+from sahayak.nav_store import MANIFEST_FILE, NavStore
+from sahayak.scheme_search import SchemeIndex
+
+# Static assets live next to the app entry point, not the current directory
+ASSET_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LOGO = os.path.join(ASSET_DIR, "logo.png")
+FOOTER = os.path.join(ASSET_DIR, "footer.png")
+UNICODE_FONT_FILE = os.path.join(ASSET_DIR, "NotoSans-Regular.ttf")
+# Imported NAV history (python -m sahayak.nav_store), if any
+NAV_STORE_DIR = os.environ.get("SAHAYAK_NAV_STORE", os.path.join(ASSET_DIR, "nav_store"))
+# Saved clients and their screens
+CLIENT_DB = os.environ.get("SAHAYAK_CLIENT_DB", os.path.join(ASSET_DIR, "clients.db"))
+# Local metrics endpoint (see sahayak.metrics); off unless a port is given
+METRICS_PORT = os.environ.get("SAHAYAK_METRICS_PORT")
+METRICS_HOST = os.environ.get("SAHAYAK_METRICS_HOST", "127.0.0.1")
+
+# --- Process-wide resources ---
+# Created once per server process and shared by every session. Callers must
+# treat them as read-only.
+
+@st.cache_resource(show_spinner=False)
+def register_unicode_font():
+    """Register the Unicode font with reportlab and return the font name to use"""
+    try:
+        pdfmetrics.registerFont(TTFont('NotoSans', UNICODE_FONT_FILE))
+        return 'NotoSans'
+    except:
+        return 'Helvetica'
+
+@st.cache_resource(show_spinner=False)
+def get_stylesheet():
+    return getSampleStyleSheet()
+
+@st.cache_resource(show_spinner=False)
+def table_cell_style(name):
+    """Wrapped 9pt cell style shared by the dataframe tables in every report"""
+    return ParagraphStyle(name=name, parent=get_stylesheet()['Normal'], fontSize=9, leading=10,
+                          wordWrap='CJK', fontName=register_unicode_font())
+
+@st.cache_resource(show_spinner=False)
+def load_logo_bytes():
+    """Raw logo image for the app header, or None when the file is missing"""
+    try:
+        with open(LOGO, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+def pdf_image_reader(path):
+    """Decoded image for drawing on PDF pages, or None when it can't be read"""
+    metrics.CACHE_LOOKUPS.inc('pdf_image')
+    return _read_pdf_image(path)
+
+@st.cache_resource(show_spinner=False)
+def _read_pdf_image(path):
+    metrics.CACHE_MISSES.inc('pdf_image')
+    if not os.path.exists(path):
+        return None
+    try:
+        reader = ImageReader(path)
+        reader.getSize()
+        return reader
+    except Exception:
+        return None
+
+def _nav_store_version():
+    # The manifest's time, so caches pick up a fresh import
+    try:
+        return os.path.getmtime(os.path.join(NAV_STORE_DIR, MANIFEST_FILE))
+    except OSError:
+        return None
+
+def load_nav_store():
+    """The NAV history store, or None when none has been imported"""
+    modified = _nav_store_version()
+    if modified is None:
+        return None
+    metrics.CACHE_LOOKUPS.inc('nav_store')
+    return _open_nav_store(NAV_STORE_DIR, modified)
+
+def load_scheme_index():
+    """Search index over the NAV store's schemes, or None when none has been imported"""
+    modified = _nav_store_version()
+    if modified is None:
+        return None
+    metrics.CACHE_LOOKUPS.inc('scheme_index')
+    return _build_scheme_index(NAV_STORE_DIR, modified)
+
+# The cached functions count their misses; the loaders above count lookups
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _open_nav_store(directory, modified):
+    metrics.CACHE_MISSES.inc('nav_store')
+    return NavStore(directory)
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _build_scheme_index(directory, modified):
+    metrics.CACHE_MISSES.inc('scheme_index')
+    metrics.CACHE_LOOKUPS.inc('nav_store')
+    return SchemeIndex(_open_nav_store(directory, modified).names)
+
+@st.cache_resource(show_spinner=False)
+def _metrics_server(host, port):
+    try:
+        return metrics.start_server(port, host)
+    except OSError as e:
+        # Cached too, so a busy port is reported once rather than on every rerun
+        metrics.logger.warning(f"metrics endpoint not started on {host}:{port}: {e}")
+        return None
+
+def start_metrics_endpoint():
+    """Serve the process's metrics when SAHAYAK_METRICS_PORT is set; the
+    server is started once and shared by every session"""
+    if METRICS_PORT:
+        return _metrics_server(METRICS_HOST, int(METRICS_PORT))
+
+@st.cache_resource(show_spinner=False)
+def start_session_sweeper():
+    """Evict idle sessions' derived state in the background; started once
+    per server process"""
+    return session_store.start_sweeper()
+
+@st.cache_resource(show_spinner=False)
+def load_client_store(path=CLIENT_DB):
+    """The client database, created on first use"""
+    return ClientStore(path)
+
+# --- Default tables ---
+# st.cache_data hands every caller its own copy, so sessions can edit them.
+DEFAULT_TABLES = {
+    'current_assets': {
+        'Asset Class': ['Equity', 'Debt', 'Gold', 'Real Estate', 'Others'],
+        'Expected Returns (%)': [12.0, 7.0, 8.0, 10.0, 5.0],
+        'Current Value (Rs.)': [0, 0, 0, 0, 0]
+    },
+    'lumpsum': [{"Category": "Equity", "SubCategory": "Mid Cap", "Scheme Name": "HDFC Mid Cap Fund", "Allocation (%)": 50.00, "Amount": 100000.00}],
+    'sip': [{"Category": "Equity", "SubCategory": "Small Cap", "Scheme Name": "SBI Small Cap Fund", "Allocation (%)": 50.00, "Amount": 5000.00}],
+    'fund_perf': [{"Scheme Name": "HDFC Mid Cap Fund", "PE": 25.50, "SD": 15.00, "SR": 1.20, "Beta": 0.90, "Alpha": 1.50, "1Y": 12.30, "3Y": 15.60, "5Y": 17.80, "10Y": 19.20}],
+    'stp_allocation': [{"Category": "", "SubCategory": "", "Scheme Name": "", "Allocation (%)": 0.0, "Amount": 0.0}],
+    'mom_asset_allocation': {
+        'Category': ['Equity', 'Debt', 'Total'],
+        'Percentage': [0.00, 0.00, 100],
+        'Amount (Rs.)': [0.00, 0.00, 0.00]
+    },
+    'mom_investment': {
+        'Sr. No.': [1, 2, 3, 4],
+        'Scheme Type': ['EQUITY', 'DEBT', 'HYBRID', 'ARBITRAGE'],
+        'Scheme Name': ['', '', '', ''],
+        'Allocation (%)': [0.00, 0.00, 0.00, 0.00],
+        'Amount (Rs.)': [0.00, 0.00, 0.00, 0.00]
+    },
+}
+
+@st.cache_data(show_spinner=False)
+def default_table(name):
+    return pd.DataFrame(DEFAULT_TABLES[name])
+
+@st.cache_data(show_spinner=False)
+def default_mf_schemes(investment_date):
+    # Keyed on the date so the default row rolls over at midnight
+    return pd.DataFrame({
+        'Scheme Name': [''],
+        'Category': ['Equity Large Cap'],
+        'Invested Amount (Rs.)': [0],
+        'Current Value (Rs.)': [0],
+        'Investment Date': [investment_date],
+        'Monthly SIP (Rs.)': [0]
+    })
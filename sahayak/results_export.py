@@ -0,0 +1,202 @@
+"""Columnar export of goal plan and asset analysis results.
+
+An export is a directory of part files, each holding one batch of rows of
+one table as typed columns (text, dates as datetime64[D], figures as
+float64):
+
+    goals-20250131T020000.123456789-4711.feather
+    assets-20250131T020000.123457012-4711.feather
+    ...
+
+Part names start with the UTC time the part was written, to the
+nanosecond and strictly increasing within a process, then the writing
+process's id; read_results reads the parts in name order, which is the
+order they were written in even when several writers share a directory.
+
+Parts are only ever added, never rewritten, so appending to an export is
+writing one more part and a run can stream many clients through a small
+buffer. Parts are Feather (Arrow IPC) files when pyarrow is installed and
+NumPy .npz archives otherwise; read_results reads either. Analytics tools
+that read Arrow can also open the .feather parts directly as one dataset.
+"""
+import glob
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:
+    pa = None
+
+# Columns of each table with their dtypes ('U' is text of any length)
+TABLES = {
+    'goals': {
+        'client': 'U', 'as_of': 'datetime64[D]', 'report_date': 'datetime64[D]', 'risk_profile': 'U',
+        'current_age': 'float64', 'goal': 'U', 'target_value': 'float64', 'already_saved': 'float64',
+        'progress': 'float64', 'deficit': 'float64', 'monthly_sip': 'float64', 'stepup_sip': 'float64',
+        'lumpsum': 'float64',
+    },
+    'assets': {
+        'client': 'U', 'as_of': 'datetime64[D]', 'horizon_years': 'float64', 'tax_rate': 'float64',
+        'inflation': 'float64', 'asset_class': 'U', 'current_value': 'float64', 'invested_amount': 'float64',
+        'current_gains': 'float64', 'tax_impact': 'float64', 'exit_load': 'float64', 'net_proceeds': 'float64',
+        'future_value': 'float64', 'expected_return': 'float64', 'xirr': 'float64', 'liquidity': 'U',
+        'risk_level': 'U',
+    },
+}
+
+# Result row fields of calculate_goal, by export column
+GOAL_RESULT_FIELDS = {
+    'goal': 'Goal', 'target_value': 'Target Value', 'already_saved': 'Already Saved', 'progress': 'Progress',
+    'deficit': 'Deficit', 'monthly_sip': 'Monthly SIP', 'stepup_sip': 'Step-up SIP', 'lumpsum': 'Lumpsum',
+}
+
+# Asset table columns taken from each asset class's result
+RESULT_COLUMNS = list(TABLES['assets'])[6:]
+
+ROWS_PER_PART = 50000
+
+_stamp_lock = threading.Lock()
+_last_stamp = 0
+
+def _part_stamp():
+    """Write time of a part as a sortable UTC string, later for every call
+    in this process even when the clock stands still or steps back"""
+    global _last_stamp
+    with _stamp_lock:
+        _last_stamp = max(time.time_ns(), _last_stamp + 1)
+        stamp = _last_stamp
+    seconds, nanoseconds = divmod(stamp, 10 ** 9)
+    return f"{datetime.fromtimestamp(seconds, timezone.utc):%Y%m%dT%H%M%S}.{nanoseconds:09d}"
+
+def _date(value):
+    """datetime64[D] of a date, or of a dd-mm-yyyy (report) or ISO date
+    string; NaT when there is none"""
+    if isinstance(value, str):
+        for pattern in ('%d-%m-%Y', '%Y-%m-%d'):
+            try:
+                return np.datetime64(datetime.strptime(value.strip(), pattern).date(), 'D')
+            except ValueError:
+                pass
+        return np.datetime64('NaT', 'D')
+    if value is None or pd.isna(value):
+        return np.datetime64('NaT', 'D')
+    return np.datetime64(pd.Timestamp(value).date(), 'D')
+
+def _number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+class ResultsWriter:
+    """Buffers result rows and appends them to an export directory, one
+    part file per rows_per_part rows of a table. close() (or leaving a
+    with block) writes what is left."""
+
+    def __init__(self, directory, rows_per_part=ROWS_PER_PART, format=None):
+        self.directory = directory
+        self.rows_per_part = rows_per_part
+        self.format = format or ('feather' if pa is not None else 'npz')
+        if self.format == 'feather' and pa is None:
+            raise ValueError("Feather export needs pyarrow (pip install pyarrow); use the npz format instead")
+        if self.format not in ('feather', 'npz'):
+            raise ValueError(f"unknown export format '{self.format}' (expected feather or npz)")
+        self._rows = {table: {column: [] for column in columns} for table, columns in TABLES.items()}
+        os.makedirs(directory, exist_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def add_goals(self, results, client=None, as_of=None):
+        """Rows of a goal plan (the goal planner's goal_calculations dict),
+        one per calculated goal"""
+        columns = self._rows['goals']
+        plan = [str(client or results.get('client_name') or ""), _date(as_of or datetime.now().date()),
+                _date(results.get('date_field')), str(results.get('risk_profile') or ""),
+                _number(results.get('current_age'))]
+        for goal in results.get('calculated_goals', []):
+            for column, value in zip(('client', 'as_of', 'report_date', 'risk_profile', 'current_age'), plan):
+                columns[column].append(value)
+            for column, field in GOAL_RESULT_FIELDS.items():
+                columns[column].append(str(goal[field]) if column == 'goal' else _number(goal[field]))
+        self._flush_full('goals')
+
+    def add_asset_analysis(self, results, client="", as_of=None, params=None):
+        """Rows of an asset analysis ({asset class: result}, as from
+        asset_engine.analyze_portfolio), one per asset class; params are
+        the AnalysisParams it ran with, if known"""
+        columns = self._rows['assets']
+        analysis = [str(client or ""), _date(as_of or (params.as_of if params is not None else None) or datetime.now().date())]
+        analysis += [_number(getattr(params, field)) if params is not None else np.nan
+                     for field in ('horizon_years', 'tax_rate', 'inflation')]
+        for asset_class, result in results.items():
+            if not result:
+                continue
+            for column, value in zip(('client', 'as_of', 'horizon_years', 'tax_rate', 'inflation'), analysis):
+                columns[column].append(value)
+            columns['asset_class'].append(str(asset_class))
+            for column in RESULT_COLUMNS:
+                value = result.get(column)
+                columns[column].append(str(value or "") if TABLES['assets'][column] == 'U' else _number(value))
+        self._flush_full('assets')
+
+    def flush(self):
+        """Write every table's buffered rows as new parts"""
+        for table in TABLES:
+            self._write_part(table)
+
+    def close(self):
+        self.flush()
+
+    def _flush_full(self, table):
+        if len(self._rows[table]['client']) >= self.rows_per_part:
+            self._write_part(table)
+
+    def _write_part(self, table):
+        rows = self._rows[table]
+        if not rows['client']:
+            return
+        arrays = {column: np.array(values, dtype=str if dtype == 'U' else dtype)
+                  for (column, values), dtype in zip(rows.items(), TABLES[table].values())}
+        # Unique across writers and processes, so concurrent runs can share a directory
+        path = os.path.join(self.directory, f"{table}-{_part_stamp()}-{os.getpid()}.{self.format}")
+        # Written beside its final name and renamed, so readers never see a partial part
+        if self.format == 'feather':
+            feather.write_feather(pa.table({column: pa.array(values) for column, values in arrays.items()}),
+                                  path + '.tmp', compression='lz4')
+        else:
+            with open(path + '.tmp', 'wb') as f:
+                np.savez_compressed(f, **arrays)
+        os.replace(path + '.tmp', path)
+        for values in rows.values():
+            values.clear()
+
+def read_results(directory, table):
+    """Every part of one table in an export as a DataFrame, in the order
+    the parts were written"""
+    if table not in TABLES:
+        raise ValueError(f"unknown results table '{table}' (expected one of: {', '.join(TABLES)})")
+    frames = []
+    for path in sorted(glob.glob(os.path.join(directory, f"{table}-*.feather")) +
+                       glob.glob(os.path.join(directory, f"{table}-*.npz"))):
+        if path.endswith('.feather'):
+            if pa is None:
+                raise ValueError(f"{path} needs pyarrow to read (pip install pyarrow)")
+            frames.append(feather.read_table(path).to_pandas(date_as_object=False))
+        else:
+            with np.load(path, allow_pickle=False) as part:
+                frames.append(pd.DataFrame({column: part[column] for column in part.files}))
+    if not frames:
+        return pd.DataFrame({column: np.array([], dtype=str if dtype == 'U' else dtype)
+                             for column, dtype in TABLES[table].items()})
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,117 @@
+"""Rolling returns of mutual fund schemes from their NAV history.
+
+A rolling N-year return is the CAGR of every N-year holding period in a
+scheme's history, one ending on each day with a NAV. With log NAVs on a
+calendar-day grid (forward-filled over holidays, see
+fund_metrics.sample_navs) each one is a difference of two rows, so every
+window of every scheme comes from a single subtraction. Percentiles come
+from one sort along the time axis. Schemes are read from the store in
+passes of SCHEMES_PER_PASS to bound memory over long histories.
+"""
+import numpy as np
+import pandas as pd
+
+from sahayak.fund_metrics import SCHEMES_PER_PASS, sample_navs
+from sahayak.tracing import traced
+from sahayak.xirr import instalment_dates
+
+ROLLING_WINDOWS = {'1Y': 1, '3Y': 3, '5Y': 5}
+PERCENTILES = (5, 25, 50, 75, 95)
+SUMMARY_COLUMNS = ['Periods', 'Min'] + [f"P{q}" for q in PERCENTILES] + ['Max', 'Mean', 'Positive (%)']
+
+# --- Vectorized core ---
+def rolling_cagr(dates, navs, years):
+    """CAGR (%) of the `years` ending on each row of a (calendar days x
+    schemes) NAV matrix; NaN on days without a NAV or a start price"""
+    filled = sample_navs(navs, np.arange(len(navs)))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_nav = np.log(filled)
+    start = (instalment_dates(dates, -12 * years) - dates[0]).astype(np.int64)
+    ends = np.flatnonzero(start >= 0)
+    growth = np.full(navs.shape, np.nan)
+    growth[ends] = log_nav[ends] - log_nav[start[ends]]
+    growth[np.isnan(navs)] = np.nan
+    return np.expm1(growth / years) * 100
+
+def summarize_rolling(cagr):
+    """SUMMARY_COLUMNS of each column of rolling CAGRs, as a dict of arrays"""
+    ordered = np.sort(cagr, axis=0)                     # NaN sorts last
+    periods = (~np.isnan(cagr)).sum(axis=0)
+    stats = {'Periods': periods}
+    last = np.maximum(periods - 1, 0)
+    for label, q in [('Min', 0)] + [(f"P{q}", q) for q in PERCENTILES] + [('Max', 100)]:
+        # Linear interpolation between order statistics, as np.percentile
+        rank = q / 100 * last
+        below = np.floor(rank).astype(np.int64)
+        above = np.minimum(below + 1, last)
+        low = np.take_along_axis(ordered, below[None, :], axis=0)[0]
+        high = np.take_along_axis(ordered, above[None, :], axis=0)[0]
+        stats[label] = np.where(periods > 0, low + (high - low) * (rank - below), np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        stats['Mean'] = np.nansum(cagr, axis=0) / periods
+        stats['Positive (%)'] = (cagr > 0).sum(axis=0) / periods * 100
+    stats['Mean'] = np.where(periods > 0, stats['Mean'], np.nan)
+    stats['Positive (%)'] = np.where(periods > 0, stats['Positive (%)'], np.nan)
+    return stats
+
+# --- From the NAV store ---
+def _history_range(store, codes, start, end):
+    ranges = [store.date_range(code) for code in codes]
+    if start is None:
+        start = min(first for first, _ in ranges) if ranges else np.datetime64('today', 'D')
+    if end is None:
+        end = max(last for _, last in ranges) if ranges else np.datetime64('today', 'D')
+    return np.datetime64(start, 'D'), np.datetime64(end, 'D')
+
+def rolling_returns(store, codes, windows=ROLLING_WINDOWS, start=None, end=None):
+    """Rolling return summary per scheme code and window ({label: years})
+    as a DataFrame with code, window and SUMMARY_COLUMNS. Periods end
+    between start and end (default: all of the schemes' history)."""
+    codes = list(dict.fromkeys(str(code) for code in codes if str(code) in store))
+    start, end = _history_range(store, codes, start, end)
+    frames = []
+    for first in range(0, len(codes), SCHEMES_PER_PASS):
+        batch = codes[first:first + SCHEMES_PER_PASS]
+        longest = max(windows.values())
+        # Read back far enough for the first period's start price
+        dates, navs = store.matrix(batch, instalment_dates(start, -12 * longest) - 1, end)
+        inside = dates >= start
+        for label, years in windows.items():
+            stats = summarize_rolling(rolling_cagr(dates, navs, years)[inside])
+            frames.append(pd.DataFrame({'code': batch, 'window': label, **stats}))
+    if not frames:
+        return pd.DataFrame(columns=['code', 'window'] + SUMMARY_COLUMNS)
+    summary = pd.concat(frames, ignore_index=True)
+    # Scheme by scheme, windows in the order given
+    position = summary['code'].map({code: i for i, code in enumerate(codes)}).to_numpy() * len(windows) \
+        + summary['window'].map({label: i for i, label in enumerate(windows)}).to_numpy()
+    return summary.iloc[np.argsort(position, kind='stable')].reset_index(drop=True)
+
+def rolling_series(store, codes, years, start=None, end=None):
+    """Rolling `years` CAGR (%) of each code over time, as a DataFrame with
+    a column per code and a row per date on which any of them has one"""
+    codes = list(dict.fromkeys(str(code) for code in codes if str(code) in store))
+    start, end = _history_range(store, codes, start, end)
+    dates, navs = store.matrix(codes, instalment_dates(start, -12 * years) - 1, end)
+    cagr = rolling_cagr(dates, navs, years)
+    keep = (dates >= start) & ~np.isnan(cagr).all(axis=1)
+    return pd.DataFrame(cagr[keep], index=pd.DatetimeIndex(dates[keep]), columns=codes)
+
+@traced("calc.rolling_returns")
+def scheme_rolling_returns(store, schemes, chart_window='3Y', windows=ROLLING_WINDOWS):
+    """Rolling returns of schemes given by code or name, for the Investment
+    Sheet: {'summary': rolling_returns labelled by Scheme Name, 'series':
+    rolling_series of chart_window per scheme, 'window': chart_window}, or
+    None when none of them is in the store"""
+    found = {}
+    for scheme in schemes:
+        code = store.find(scheme) if str(scheme).strip() else None
+        if code and code not in found.values():
+            found[str(scheme).strip()] = code
+    if not found:
+        return None
+    names = {code: scheme for scheme, code in found.items()}
+    summary = rolling_returns(store, list(found.values()), windows)
+    summary.insert(0, 'Scheme Name', summary.pop('code').map(names))
+    series = rolling_series(store, list(found.values()), windows[chart_window]).rename(columns=names)
+    return {'summary': summary, 'series': series, 'window': chart_window}
@@ -0,0 +1,149 @@
+"""Scheme-name search over the scheme master.
+
+Names are normalized (lower case, punctuation to spaces) and indexed two
+ways:
+
+    prefix   every word-start suffix of every name in one sorted list, so
+             "mid cap" finds "HDFC Mid Cap Fund" with two bisections
+    fuzzy    trigram postings in one flat array (CSR layout); a single
+             bincount over the postings of a query's trigrams counts what
+             each name shares with it. Names are scored by the share of the
+             query's trigrams they contain, so "hdfc midcap" still matches
+             the full "... - Direct Plan - Growth" name, with ties going to
+             the closer (trigram Jaccard) name
+
+The index is built once per process from the NAV store's scheme codes and
+names (see resources.load_scheme_index).
+"""
+import re
+from bisect import bisect_left
+
+import numpy as np
+import pandas as pd
+
+# Fuzzy matches containing less of the query's trigrams than this are not
+# offered as corrections
+MIN_MATCH_SCORE = 0.6
+
+def normalize(name):
+    return " ".join(re.sub(r"[^0-9a-z]+", " ", str(name).lower()).split())
+
+def _trigrams(normalized):
+    padded = f"  {normalized} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class SchemeIndex:
+    """Prefix and fuzzy search over {code: name}"""
+
+    def __init__(self, schemes):
+        self.codes = np.array([str(code) for code in schemes], dtype=object)
+        self.names = np.array([str(name) for name in schemes.values()], dtype=object)
+        normalized = [normalize(name) for name in self.names]
+        self._lengths = np.array([len(name) for name in self.names], dtype=np.int64)
+        self._row = {code: row for row, code in enumerate(self.codes)}
+        self._canonical = set(self.names)
+        self._exact = {}
+        for row, key in enumerate(normalized):
+            self._exact.setdefault(key, row)
+
+        # Prefix keys: each name from every word on, sorted
+        keys, owners = [], []
+        for row, key in enumerate(normalized):
+            words = key.split(" ")
+            for start in range(len(words)):
+                keys.append(" ".join(words[start:]))
+                owners.append(row)
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self._keys = [keys[i] for i in order]
+        self._owners = np.array(owners, dtype=np.int64)[order] if keys else np.zeros(0, dtype=np.int64)
+        self._whole = np.array([keys[i] == normalized[owners[i]] for i in order], dtype=bool)
+
+        # Trigram postings: rows of names containing gram g are
+        # _postings[_gram_start[g]:_gram_start[g + 1]]
+        grams = [_trigrams(key) for key in normalized]
+        self._gram_id = {}
+        gram_rows = []
+        for row, name_grams in enumerate(grams):
+            for gram in name_grams:
+                gram_rows.append((self._gram_id.setdefault(gram, len(self._gram_id)), row))
+        pairs = np.array(gram_rows, dtype=np.int64).reshape(-1, 2)
+        pairs = pairs[np.argsort(pairs[:, 0], kind='stable')]
+        self._postings = pairs[:, 1]
+        self._gram_start = np.searchsorted(pairs[:, 0], np.arange(len(self._gram_id) + 1))
+        self._gram_count = np.array([len(name_grams) for name_grams in grams], dtype=np.int64)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def prefix(self, query, limit=10):
+        """Rows of names with a word sequence starting with query; names
+        that start with it first, then shorter names"""
+        query = normalize(query)
+        if not query:
+            return np.zeros(0, dtype=np.int64)
+        lo = bisect_left(self._keys, query)
+        hi = bisect_left(self._keys, query + "\x7f")
+        rows, whole = self._owners[lo:hi], self._whole[lo:hi]
+        # One entry per name, flagged if the name itself starts with query
+        order = np.lexsort((~whole, rows))
+        rows, whole = rows[order], whole[order]
+        first = np.ones(len(rows), dtype=bool)
+        first[1:] = rows[1:] != rows[:-1]
+        rows, whole = rows[first], whole[first]
+        return rows[np.lexsort((self._lengths[rows], ~whole))][:limit]
+
+    def fuzzy(self, query, limit=10):
+        """(rows, scores) of the names best matching query; score is the
+        share of the query's trigrams found in the name"""
+        grams = _trigrams(normalize(query))
+        ids = [self._gram_id[gram] for gram in grams if gram in self._gram_id]
+        if not ids or not len(self.codes):
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+        ids = np.array(ids)
+        postings = np.concatenate([self._postings[self._gram_start[g]:self._gram_start[g + 1]] for g in ids])
+        shared = np.bincount(postings, minlength=len(self.codes))
+        candidates = np.flatnonzero(shared)
+        common = shared[candidates]
+        scores = common / len(grams)
+        jaccard = common / (len(grams) + self._gram_count[candidates] - common)
+        best = np.lexsort((-jaccard, -scores))[:limit]
+        return candidates[best], scores[best]
+
+    def search(self, query, limit=10):
+        """Matches for query as a DataFrame of code, name and score: prefix
+        matches (score 1) first, then fuzzy ones"""
+        rows = self.prefix(query, limit)
+        scores = np.ones(len(rows))
+        if len(rows) < limit:
+            fuzzy_rows, fuzzy_scores = self.fuzzy(query, limit)
+            new = ~np.isin(fuzzy_rows, rows)
+            rows = np.concatenate((rows, fuzzy_rows[new]))[:limit]
+            scores = np.concatenate((scores, fuzzy_scores[new]))[:limit]
+        return pd.DataFrame({'code': self.codes[rows], 'name': self.names[rows], 'score': scores})
+
+    def resolve(self, name, min_score=MIN_MATCH_SCORE):
+        """(code, canonical name) for a scheme code or typed name: an exact
+        match after normalizing, else the closest fuzzy match scoring at
+        least min_score; None when nothing is close"""
+        name = str(name).strip()
+        if name in self._row:
+            row = self._row[name]
+        else:
+            row = self._exact.get(normalize(name))
+            if row is None:
+                rows, scores = self.fuzzy(name, 1)
+                if not len(rows) or scores[0] < min_score:
+                    return None
+                row = rows[0]
+        return self.codes[row], self.names[row]
+
+    def suggestions(self, names, min_score=MIN_MATCH_SCORE):
+        """{typed name: (code, canonical name)} for the names that aren't
+        already canonical and have a match"""
+        found = {}
+        for name in dict.fromkeys(str(name).strip() for name in names):
+            if name and name not in self._canonical:
+                match = self.resolve(name, min_score)
+                if match is not None and match[1] != name:
+                    found[name] = match
+        return found
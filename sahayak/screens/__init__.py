@@ -0,0 +1,18 @@
+import importlib
+
+# app_mode -> (module, screen function). Modules are imported on first use
+# and cached in sys.modules, so a rerun only executes the active screen.
+SCREENS = {
+    None: ("sahayak.screens.main_menu", "show_main_screen"),
+    "investment": ("sahayak.screens.investment_sheet", "show_investment_sheet"),
+    "goal_planner": ("sahayak.screens.goal_planner", "show_financial_goal_planner"),
+    "mom": ("sahayak.screens.minutes_of_meeting", "show_minutes_of_meeting"),
+    "checklist": ("sahayak.screens.meeting_checklist", "show_meeting_checklist"),
+    "decision_analyzer": ("sahayak.screens.asset_analyzer", "show_asset_decision_analyzer"),
+}
+
+def load_screen(app_mode):
+    """Import the module for app_mode and return its screen function"""
+    module_name, function_name = SCREENS.get(app_mode, SCREENS[None])
+    module = importlib.import_module(module_name)
+    return getattr(module, function_name)
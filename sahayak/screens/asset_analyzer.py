@@ -0,0 +1,854 @@
+from io import BytesIO
+from datetime import datetime
+
+import streamlit as st
+import pandas as pd
+from reportlab.lib.pagesizes import A4
+from reportlab.lib import colors
+from reportlab.platypus import Table, TableStyle, SimpleDocTemplate, Paragraph, Spacer, PageBreak, Image
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.colors import HexColor
+from reportlab.lib.units import cm
+from reportlab.lib.enums import TA_CENTER
+import matplotlib.pyplot as plt
+
+from sahayak.utils import format_indian_number
+from sahayak.pdf_common import UNICODE_FONT, DISCLAIMER_TEXT, header_footer_with_logos
+from sahayak.metrics import measured_report
+from sahayak.tracing import span, traced
+from sahayak.resources import get_stylesheet, default_mf_schemes
+from sahayak.session_store import CompactTable, fragment, store_table
+from sahayak.asset_engine import (PropertyHolding, GoldHolding, FixedDeposit, FD_COMPOUNDING, mutual_fund_holdings,
+                                  parse_analysis_params, analyze_portfolio, scenario_cube)
+from sahayak.capital_gains import LTCG_EXEMPTION, harvest_plan, holdings_transactions
+from sahayak.rebalance import rebalance_plan, target_adds_up
+from sahayak.ui import show_header, show_back_button, scheme_name_helper, client_records_panel
+
+# Session values saved per client (see ui.client_records_panel)
+CLIENT_RECORD_KEYS = [
+    'asset_client_name', 'include_mutual_funds', 'include_real_estate', 'include_gold', 'include_fd',
+    'mf_schemes', 'harvest_exemption_used',
+    'prop_purchase', 'prop_current', 'prop_date', 'rental_income', 'prop_type', 'maintenance',
+    'gold_type', 'gold_purchase_price', 'gold_qty', 'gold_current_price', 'gold_date', 'gold_storage',
+    'fd_amount', 'fd_rate', 'fd_tenure', 'fd_type', 'fd_compounding',
+    'horizon', 'client_age', 'tax_bracket', 'inflation', 'risk_tolerance', 'liquidity',
+    'asset_analysis_results',
+]
+
+# --- 5. Multi-Asset Class Decision Analyzer ---
+# Input sections, parameters and each results panel are fragments, so editing
+# one holding doesn't rerender the other editors or redraw the charts.
+def show_asset_decision_analyzer():
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+    
+    show_header()
+    show_back_button("back_decision_analyzer")
+    
+    st.markdown("""
+    <div class="goal-section">
+        <h2>Multi-Asset Class Decision Analyzer</h2>
+        <p>Real-time comparison across major asset classes to make informed investment decisions</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    client_records_panel("asset_analyzer", CLIENT_RECORD_KEYS, name_key="asset_client_name")
+    
+    # Initialize session state for this module
+    if 'asset_analysis_results' not in st.session_state:
+        st.session_state.asset_analysis_results = {}
+    
+    tab1, tab2, tab3, tab4 = st.tabs(["🎯 Select Assets", "📊 Portfolio Input", "⚙️ Parameters", "📈 Analysis"])
+    
+    with tab1:
+        st.markdown('### Select Asset Classes to Compare')
+        st.markdown('<div class="info-card"><p>Choose the asset classes you want to compare for your investment decision</p></div>', unsafe_allow_html=True)
+        
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            include_mutual_funds = st.checkbox("📊 Mutual Funds", value=True, key="include_mutual_funds", help="Equity, Debt, Hybrid mutual funds")
+        with col2:
+            include_real_estate = st.checkbox("🏠 Real Estate", key="include_real_estate", help="Property investments, REITs")
+        with col3:
+            include_gold = st.checkbox("🥇 Gold", key="include_gold", help="Physical gold, Gold ETFs, Digital gold")
+        with col4:
+            include_fd = st.checkbox("🏦 Fixed Deposits", key="include_fd", help="Bank FDs, Corporate FDs with accrual tax")
+    
+    with tab2:
+        st.markdown('### Current Portfolio Details')
+        
+        if include_mutual_funds:
+            mutual_fund_input_fragment()
+            tax_harvest_fragment()
+        if include_real_estate:
+            real_estate_input_fragment()
+        if include_gold:
+            gold_input_fragment()
+        if include_fd:
+            fd_input_fragment()
+    
+    with tab3:
+        analysis_parameters_fragment()
+    
+    with tab4:
+        st.markdown('### Investment Decision Analysis')
+        
+        # Check if at least one asset class is selected
+        selected_assets = []
+        if include_mutual_funds:
+            selected_assets.append("Mutual Funds")
+        if include_real_estate:
+            selected_assets.append("Real Estate")
+        if include_gold:
+            selected_assets.append("Gold")
+        if include_fd:
+            selected_assets.append("Fixed Deposits")
+        
+        if not selected_assets:
+            st.warning("Please select at least one asset class to compare.")
+        else:
+            st.info(f"Selected for comparison: {', '.join(selected_assets)}")
+            
+            st.markdown('<div class="calculate-button">', unsafe_allow_html=True)
+            if st.button("🔄 Analyze Investment Options", use_container_width=True):
+                with st.spinner("⚡ Analyzing your investment options..."):
+                    
+                    # Perform calculations
+                    analysis_results = perform_comprehensive_asset_analysis(
+                        include_mutual_funds, include_real_estate, include_gold, include_fd,
+                        st.session_state.horizon, st.session_state.tax_bracket, st.session_state.inflation
+                    )
+                    
+                    # Store results in session state
+                    st.session_state.asset_analysis_results = analysis_results
+                    
+                    st.success("✅ Analysis completed successfully!")
+            st.markdown('</div>', unsafe_allow_html=True)
+            
+            # Display results if analysis is done
+            if st.session_state.asset_analysis_results:
+                display_comprehensive_analysis_results(st.session_state.asset_analysis_results, selected_assets)
+            
+            scenario_comparison_fragment(include_mutual_funds, include_real_estate, include_gold, include_fd)
+            rebalance_fragment(include_mutual_funds, include_real_estate, include_gold, include_fd)
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+@fragment
+def mutual_fund_input_fragment():
+    # Mutual Funds Section
+    with st.expander("📊 Mutual Fund Portfolio", expanded=True):
+        st.markdown("**Current Mutual Fund Holdings**")
+        
+        # Initialize MF data in session state
+        if 'mf_schemes' not in st.session_state:
+            st.session_state.mf_schemes = CompactTable.from_frame(default_mf_schemes(datetime.now().date()))
+        
+        # Editable MF schemes table
+        edited_mf = st.data_editor(
+            st.session_state.mf_schemes.to_frame(),
+            num_rows="dynamic",
+            use_container_width=True,
+            column_config={
+                "Category": st.column_config.SelectboxColumn(
+                    "Category",
+                    options=["Equity Large Cap", "Equity Mid Cap", "Equity Small Cap", 
+                           "Debt Fund", "Hybrid Fund", "ELSS"],
+                    required=True
+                ),
+                "Invested Amount (Rs.)": st.column_config.NumberColumn(
+                    "Invested Amount (Rs.)", min_value=0, step=1000, format="%d"
+                ),
+                "Current Value (Rs.)": st.column_config.NumberColumn(
+                    "Current Value (Rs.)", min_value=0, step=1000, format="%d"
+                ),
+                "Investment Date": st.column_config.DateColumn("Investment Date"),
+                "Monthly SIP (Rs.)": st.column_config.NumberColumn(
+                    "Monthly SIP (Rs.)", min_value=0, step=500, format="%d"
+                )
+            },
+            hide_index=True
+        )
+        store_table('mf_schemes', edited_mf)
+        fixed = scheme_name_helper(edited_mf, "mf_schemes")
+        if fixed is not None:
+            store_table('mf_schemes', fixed)
+            st.rerun()
+
+@fragment
+def tax_harvest_fragment():
+    # LTCG harvesting: book equity gains up to this year's exemption without
+    # paying STCG or exit load
+    with st.expander("✂️ Tax Harvesting Plan", expanded=False):
+        st.markdown('<div class="info-card"><p>Redeem and reinvest long-term equity units so gains up to the Rs. 1 lakh LTCG exemption are booked tax-free this year, raising the cost basis for later redemptions.</p></div>', unsafe_allow_html=True)
+        st.number_input("LTCG already booked this financial year (Rs.)", min_value=0, max_value=LTCG_EXEMPTION, value=0,
+                        step=5000, key="harvest_exemption_used")
+
+        if st.button("Plan Tax Harvesting", key="plan_harvest"):
+            transactions, schemes = holdings_transactions(mutual_fund_holdings(st.session_state.mf_schemes.to_frame()))
+            st.session_state.harvest_result = harvest_plan(transactions, schemes, exemption_used=st.session_state.harvest_exemption_used)
+
+        if 'harvest_result' in st.session_state:
+            plan, summary = st.session_state.harvest_result
+            if plan.empty:
+                st.info("No long-term equity gains can be harvested without tax or exit load.")
+                return
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Gain Harvested", f"Rs. {format_indian_number(summary['gain_harvested'])}")
+            col2.metric("Redeem & Reinvest", f"Rs. {format_indian_number(summary['sale_value'])}")
+            col3.metric("Future Tax Saved", f"Rs. {format_indian_number(summary['tax_saved'])}")
+            st.dataframe(pd.DataFrame({
+                'Scheme': plan['scheme'],
+                'Redeem (Rs.)': [format_indian_number(v) for v in plan['sale_value']],
+                'Gain Booked (Rs.)': [format_indian_number(v) for v in plan['gain']],
+            }), hide_index=True, use_container_width=True)
+
+@fragment
+def real_estate_input_fragment():
+    # Real Estate Section
+    with st.expander("🏠 Real Estate Portfolio", expanded=False):
+        col1, col2 = st.columns(2)
+        with col1:
+            st.number_input("Property Purchase Value (Rs.)", min_value=0, value=0, key="prop_purchase")
+            st.number_input("Current Market Value (Rs.)", min_value=0, value=0, key="prop_current")
+            st.date_input("Purchase Date", key="prop_date")
+        with col2:
+            st.number_input("Monthly Rental Income (Rs.)", min_value=0, value=0, key="rental_income")
+            st.selectbox("Property Type", ["Residential", "Commercial", "REIT"], key="prop_type")
+            st.number_input("Annual Maintenance Cost (Rs.)", min_value=0, value=0, key="maintenance")
+
+@fragment
+def gold_input_fragment():
+    # Gold Section
+    with st.expander("🥇 Gold Investment", expanded=False):
+        col1, col2 = st.columns(2)
+        with col1:
+            st.selectbox("Gold Investment Type", 
+                         ["Physical Gold", "Gold ETF", "Digital Gold"], key="gold_type")
+            st.number_input("Purchase Price per gram (Rs.)", min_value=0.0, value=0.0, key="gold_purchase_price")
+            st.number_input("Quantity (grams)", min_value=0.0, value=0.0, key="gold_qty")
+        with col2:
+            st.number_input("Current Gold Price per gram (Rs.)", min_value=0.0, value=6500.0, key="gold_current_price")
+            st.date_input("Purchase Date", key="gold_date")
+            st.number_input("Annual Storage/Management Cost (Rs.)", min_value=0, value=0, key="gold_storage")
+
+@fragment
+def fd_input_fragment():
+    # Fixed Deposits Section
+    with st.expander("🏦 Fixed Deposit Options", expanded=False):
+        st.info("💡 **Accrual Tax Impact**: Unlike mutual funds where tax is paid only on redemption, FD interest is taxed every year, reducing the effective compounding benefit.")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.number_input("Amount to Invest in FD (Rs.)", min_value=0, value=0, key="fd_amount")
+            st.number_input("FD Interest Rate (% per annum)", min_value=0.0, max_value=15.0, value=7.5, step=0.25, key="fd_rate",
+                            help="Interest rate per annum. Note: FD interest is subject to annual accrual tax, which means tax is deducted yearly on interest earned, reducing effective compounded returns.")
+        with col2:
+            st.number_input("FD Tenure (Years)", min_value=1, max_value=10, value=3, key="fd_tenure")
+            st.selectbox("FD Type", ["Regular FD", "Tax Saving FD", "Senior Citizen FD"], key="fd_type")
+            st.selectbox("Interest Compounding", list(FD_COMPOUNDING), key="fd_compounding")
+
+@fragment
+def analysis_parameters_fragment():
+    st.markdown('### Analysis Parameters')
+    st.markdown('<div class="info-card"><p>Set your investment preferences and tax details for accurate comparison</p></div>', unsafe_allow_html=True)
+    
+    st.text_input("Client Name", placeholder="Enter client name", key="asset_client_name")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.selectbox("Investment Horizon", 
+                     ["1 Year", "3 Years", "5 Years", "10 Years"], 
+                     index=2, key="horizon")
+        st.number_input("Your Current Age", min_value=18, max_value=80, value=35, key="client_age")
+    
+    with col2:
+        st.selectbox("Tax Bracket", 
+                     ["5%", "20%", "30%"], 
+                     index=2, key="tax_bracket")
+        st.number_input("Expected Inflation Rate (%)", min_value=0.0, max_value=15.0, value=6.0, step=0.5, key="inflation")
+    
+    with col3:
+        st.selectbox("Risk Tolerance", 
+                     ["Conservative", "Moderate", "Aggressive"], 
+                     index=1, key="risk_tolerance")
+        st.selectbox("Liquidity Requirement", 
+                     ["High", "Medium", "Low"], 
+                     index=1, key="liquidity")
+
+# Helper functions for asset analysis calculations
+def session_portfolio(include_mf, include_re, include_gold, include_fd):
+    """Holdings entered on this screen, as an asset_engine portfolio"""
+    state = st.session_state
+    today = datetime.now().date()
+    portfolio = {}
+    
+    if include_mf and not state.mf_schemes.empty:
+        portfolio['Mutual Funds'] = mutual_fund_holdings(state.mf_schemes.to_frame())
+    
+    if include_re and state.get('prop_purchase', 0) > 0:
+        portfolio['Real Estate'] = [PropertyHolding(
+            state.get('prop_purchase', 0), state.get('prop_current', 0), state.get('prop_date', today),
+            state.get('rental_income', 0), state.get('maintenance', 0), state.get('prop_type', "Residential")
+        )]
+    
+    if include_gold and state.get('gold_qty', 0) > 0:
+        portfolio['Gold'] = [GoldHolding(
+            state.get('gold_purchase_price', 0), state.get('gold_qty', 0), state.get('gold_current_price', 0),
+            state.get('gold_date', today), state.get('gold_storage', 0), state.get('gold_type', "Physical Gold")
+        )]
+    
+    if include_fd and state.get('fd_amount', 0) > 0:
+        portfolio['Fixed Deposits'] = [FixedDeposit(
+            state.get('fd_amount', 0), state.get('fd_rate', 7.5), state.get('fd_tenure', 3), state.get('fd_type', "Regular FD"),
+            FD_COMPOUNDING[state.get('fd_compounding', "Yearly")]
+        )]
+    
+    return portfolio
+
+def perform_comprehensive_asset_analysis(include_mf, include_re, include_gold, include_fd, horizon, tax_bracket, inflation):
+    return analyze_portfolio(
+        session_portfolio(include_mf, include_re, include_gold, include_fd),
+        parse_analysis_params(horizon, tax_bracket, inflation)
+    )
+
+def build_comparison_data(results):
+    """Formatted comparison rows, one per analysed asset class"""
+    comparison_data = []
+    for asset_class, data in results.items():
+        if data:
+            comparison_data.append({
+                'Asset Class': asset_class,
+                'Current Value': f"Rs.{format_indian_number(data['current_value'])}",
+                'Current Gains/Loss': f"Rs.{format_indian_number(data['current_gains'])}",
+                'Tax Impact': f"Rs.{format_indian_number(data['tax_impact'])}",
+                'Net Proceeds Today': f"Rs.{format_indian_number(data['net_proceeds'])}",
+                'Future Value': f"Rs.{format_indian_number(data['future_value'])}",
+                'Expected Return': f"{data['expected_return']:.1f}%",
+                'Liquidity': data['liquidity'],
+                'Risk Level': data['risk_level']
+            })
+    return comparison_data
+
+def display_comprehensive_analysis_results(results, selected_assets):
+    st.markdown("## 📊 Investment Analysis Results")
+    
+    if build_comparison_data(results):
+        analysis_table_fragment()
+        analysis_charts_fragment()
+        analysis_recommendations_fragment()
+        asset_pdf_fragment(selected_assets)
+
+@fragment
+def analysis_table_fragment():
+    # Create comparison table
+    comparison_data = build_comparison_data(st.session_state.asset_analysis_results)
+    df = pd.DataFrame(comparison_data)
+    st.dataframe(df, use_container_width=True, hide_index=True)
+
+    # Mutual fund asset mix by value, and realised returns from the
+    # SIP/lumpsum history
+    mf_results = st.session_state.asset_analysis_results.get('Mutual Funds') or {}
+    if mf_results.get('asset_mix'):
+        st.markdown("**Mutual Fund Asset Mix:** " + " · ".join(
+            f"{bucket} {share:.1f}%" for bucket, share in mf_results['asset_mix'].items() if share > 0))
+    if mf_results.get('scheme_xirr'):
+        portfolio_xirr = mf_results.get('xirr')
+        st.markdown(f"**Mutual Fund XIRR:** {'N/A' if portfolio_xirr is None else f'{portfolio_xirr:.2f}%'}")
+        st.dataframe(pd.DataFrame({
+            'Scheme': list(mf_results['scheme_xirr']),
+            'XIRR': ['N/A' if rate is None else f"{rate:.2f}%" for rate in mf_results['scheme_xirr'].values()],
+        }), use_container_width=True, hide_index=True)
+
+@fragment
+def analysis_charts_fragment():
+    comparison_data = build_comparison_data(st.session_state.asset_analysis_results)
+    
+    # Create visualizations
+    st.markdown("### 📈 Visual Comparison")
+    
+    # Future value comparison chart
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+    
+    # Chart 1: Current vs Future Value
+    asset_names = [data['Asset Class'] for data in comparison_data]
+    current_values = [float(data['Current Value'].replace('Rs.', '').replace(',', '')) for data in comparison_data]
+    future_values = [float(data['Future Value'].replace('Rs.', '').replace(',', '')) for data in comparison_data]
+    
+    x = range(len(asset_names))
+    width = 0.35
+    
+    ax1.bar([i - width/2 for i in x], current_values, width, label='Current Value', color='#4facfe', alpha=0.7)
+    ax1.bar([i + width/2 for i in x], future_values, width, label='Future Value', color='#00f2fe', alpha=0.7)
+    
+    ax1.set_xlabel('Asset Classes')
+    ax1.set_ylabel('Value (Rs.)')
+    ax1.set_title('Current vs Future Value Comparison')
+    ax1.set_xticks(x)
+    ax1.set_xticklabels(asset_names, rotation=45)
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+    
+    # Chart 2: Expected Returns
+    returns = [float(data['Expected Return'].replace('%', '')) for data in comparison_data]
+    colors = ['#ff6b6b', '#4ecdc4', '#45b7d1', '#96ceb4'][:len(asset_names)]
+    
+    ax2.bar(asset_names, returns, color=colors, alpha=0.7)
+    ax2.set_xlabel('Asset Classes')
+    ax2.set_ylabel('Expected Return (%)')
+    ax2.set_title('Expected Annual Returns')
+    ax2.set_xticklabels(asset_names, rotation=45)
+    ax2.grid(True, alpha=0.3)
+    
+    plt.tight_layout()
+    st.pyplot(fig)
+    plt.close()
+
+@fragment
+def analysis_recommendations_fragment():
+    comparison_data = build_comparison_data(st.session_state.asset_analysis_results)
+    
+    # Investment Recommendations
+    st.markdown("### 💡 Investment Recommendations")
+    
+    best_return = max(comparison_data, key=lambda x: float(x['Expected Return'].replace('%', '')))
+    
+    risk_mapping = {'Very Low': 1, 'Low': 2, 'Low to Medium': 2.5, 'Medium': 3, 'Medium to High': 4, 'High': 5}
+    lowest_risk = min(comparison_data, key=lambda x: risk_mapping.get(x['Risk Level'], 3))
+    
+    liquidity_mapping = {'Low': 1, 'Medium': 2, 'High': 3}
+    highest_liquidity = max(comparison_data, key=lambda x: liquidity_mapping.get(x['Liquidity'], 2))
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="metric-label">Highest Return Potential</div>
+            <div class="metric-value">{best_return['Asset Class']}</div>
+            <div class="metric-label">{best_return['Expected Return']} Expected Return</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="metric-label">Lowest Risk Option</div>
+            <div class="metric-value">{lowest_risk['Asset Class']}</div>
+            <div class="metric-label">{lowest_risk['Risk Level']} Risk</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="metric-label">Highest Liquidity</div>
+            <div class="metric-value">{highest_liquidity['Asset Class']}</div>
+            <div class="metric-label">{highest_liquidity['Liquidity']} Liquidity</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+# Figures the scenario table can show, as (label, cube column)
+SCENARIO_METRICS = {
+    "Future Value": 'future_value',
+    "Future Value (Today's Money)": 'real_future_value',
+    "Net Proceeds Today": 'net_proceeds',
+    "Tax Impact": 'tax_impact',
+}
+
+@fragment
+def scenario_comparison_fragment(include_mf, include_re, include_gold, include_fd):
+    # Every selected asset class across horizons, tax brackets and inflation
+    # rates in one pass, instead of rerunning the analysis per combination
+    with st.expander("🧮 Scenario Comparison", expanded=False):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            horizons = st.multiselect("Horizons (Years)", [1, 3, 5, 10, 15, 20], default=[1, 3, 5, 10], key="scenario_horizons")
+        with col2:
+            tax_brackets = st.multiselect("Tax Brackets", ["5%", "20%", "30%"], default=["5%", "20%", "30%"], key="scenario_tax")
+        with col3:
+            inflations = st.multiselect("Inflation Rates (%)", [4.0, 5.0, 6.0, 7.0, 8.0], default=[4.0, 6.0, 8.0], key="scenario_inflation")
+        
+        if st.button("Run Scenarios", key="run_scenarios", disabled=not (horizons and tax_brackets and inflations)):
+            st.session_state.asset_scenarios = scenario_cube(
+                session_portfolio(include_mf, include_re, include_gold, include_fd),
+                sorted(horizons), sorted(float(bracket.strip('%')) / 100 for bracket in tax_brackets), sorted(inflations)
+            )
+        
+        cube = st.session_state.get('asset_scenarios')
+        if cube is None:
+            return
+        if cube.empty:
+            st.warning("None of the selected holdings could be analysed.")
+            return
+        
+        metric = st.selectbox("Show", list(SCENARIO_METRICS), key="scenario_metric")
+        column = SCENARIO_METRICS[metric]
+        table = cube.assign(
+            Scenario=[f"Tax {tax:.0%} · Inflation {inflation:g}%" for tax, inflation in zip(cube['tax_rate'], cube['inflation'])]
+        ).pivot_table(index=['asset_class', 'horizon_years'], columns='Scenario', values=column, sort=False)
+        table.index.names = ['Asset Class', 'Horizon (Years)']
+        st.dataframe(table.map(lambda value: f"Rs.{format_indian_number(value)}"), use_container_width=True)
+        
+        # Chart the first scenario's figure against the horizon
+        first = cube[(cube['tax_rate'] == cube['tax_rate'].iloc[0]) & (cube['inflation'] == cube['inflation'].iloc[0])]
+        st.caption(f"{metric} by horizon at tax {first['tax_rate'].iloc[0]:.0%}, inflation {first['inflation'].iloc[0]:g}%")
+        st.line_chart(first.pivot(index='horizon_years', columns='asset_class', values=column))
+
+@fragment
+def rebalance_fragment(include_mf, include_re, include_gold, include_fd):
+    # Switches to a target allocation, selling the holdings that cost the
+    # least tax and exit load first
+    with st.expander("⚖️ Rebalancing Plan", expanded=False):
+        asset_classes = [asset_class for asset_class, included in
+                         [("Mutual Funds", include_mf), ("Real Estate", include_re), ("Gold", include_gold), ("Fixed Deposits", include_fd)]
+                         if included]
+        st.markdown("**Target Allocation (%)**")
+        columns = st.columns(len(asset_classes))
+        # Equal shares by default, the last taking the rounding remainder;
+        # keyed on the number of classes so a new selection starts from them
+        defaults = [round(100 / len(asset_classes), 2)] * len(asset_classes)
+        defaults[-1] = round(100.0 - sum(defaults[:-1]), 2)
+        target = {}
+        for column, asset_class, default in zip(columns, asset_classes, defaults):
+            with column:
+                target[asset_class] = st.number_input(asset_class, min_value=0.0, max_value=100.0,
+                                                      value=default, step=5.0,
+                                                      key=f"target_{len(asset_classes)}_{asset_class}")
+        
+        if not target_adds_up(target):
+            st.warning(f"Target allocation adds up to {sum(target.values()):g}%; it must add up to 100%.")
+        elif st.button("Plan Switches", key="plan_rebalance"):
+            st.session_state.rebalance_plan = rebalance_plan(
+                session_portfolio(include_mf, include_re, include_gold, include_fd), target,
+                parse_analysis_params(st.session_state.horizon, st.session_state.tax_bracket, st.session_state.inflation)
+            )
+        
+        plan = st.session_state.get('rebalance_plan')
+        if plan is None:
+            return
+        allocation = plan['allocation'][plan['allocation']['current_value'].gt(0) | plan['allocation']['target_pct'].gt(0)]
+        st.dataframe(pd.DataFrame({
+            'Asset Class': allocation.index,
+            'Current': [f"Rs.{format_indian_number(v)} ({p:.1f}%)" for v, p in zip(allocation['current_value'], allocation['current_pct'])],
+            'Target': [f"Rs.{format_indian_number(v)} ({p:.1f}%)" for v, p in zip(allocation['target_value'], allocation['target_pct'])],
+            'Change': [f"Rs.{format_indian_number(v)}" for v in allocation['change']],
+        }), use_container_width=True, hide_index=True)
+        
+        if plan['sells'].empty:
+            st.success("The portfolio is already at its target allocation.")
+            return
+        summary = plan['summary']
+        col1, col2, col3 = st.columns(3)
+        col1.metric("To Sell", f"Rs. {format_indian_number(summary['sale_value'])}")
+        col2.metric("Tax + Exit Load", f"Rs. {format_indian_number(summary['tax'] + summary['exit_load'])}")
+        col3.metric("Available to Switch", f"Rs. {format_indian_number(summary['net_proceeds'])}")
+        
+        st.markdown("**Sell**")
+        st.dataframe(pd.DataFrame({
+            'Asset Class': plan['sells']['asset_class'],
+            'Holding': plan['sells']['holding'],
+            'Sell (Rs.)': [format_indian_number(v) for v in plan['sells']['sale_value']],
+            'Tax (Rs.)': [format_indian_number(v) for v in plan['sells']['tax']],
+            'Exit Load (Rs.)': [format_indian_number(v) for v in plan['sells']['exit_load']],
+        }), use_container_width=True, hide_index=True)
+        st.markdown("**Switch**")
+        st.dataframe(pd.DataFrame({
+            'From': plan['switches']['from'],
+            'To': plan['switches']['to'],
+            'Amount (Rs.)': [format_indian_number(v) for v in plan['switches']['amount']],
+        }), use_container_width=True, hide_index=True)
+
+@fragment
+def asset_pdf_fragment(selected_assets):
+    results = st.session_state.asset_analysis_results
+    
+    # PDF Generation
+    st.markdown('<div class="calculate-button">', unsafe_allow_html=True)
+    if st.button("📄 Generate Asset Comparison Report"):
+        buffer = generate_comprehensive_asset_pdf(results, build_comparison_data(results), selected_assets)
+
+        # Streamlit download interface
+        st.success("Asset Comparison Report generated successfully!")
+        st.download_button(
+            label="✅ Download Asset Comparison Report PDF",
+            data=buffer,
+            file_name=f"Asset_Comparison_Report_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf",
+            mime="application/pdf",
+            use_container_width=True
+        )
+    st.markdown('</div>', unsafe_allow_html=True)
+
+@traced("chart.asset_comparison")
+def asset_comparison_chart(comparison_data):
+    """Value and expected return charts of the compared asset classes as a
+    PDF image"""
+    # Create enhanced matplotlib charts - VERTICALLY STACKED
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
+
+    # Extract chart data
+    asset_names = [data['Asset Class'] for data in comparison_data]
+    current_values = [float(data['Current Value'].replace('Rs.', '').replace(',', '')) for data in comparison_data]
+    future_values = [float(data['Future Value'].replace('Rs.', '').replace(',', '')) for data in comparison_data]
+    returns = [float(data['Expected Return'].replace('%', '')) for data in comparison_data]
+
+    # Define attractive color palettes
+    current_colors = ['#3498db', '#e74c3c', '#f39c12', '#9b59b6'][:len(asset_names)]
+    future_colors = ['#5dade2', '#ec7063', '#f8c471', '#bb8fce'][:len(asset_names)]
+    return_colors = ['#e8f8f5', '#fdedec', '#fef9e7', '#f4ecf7'][:len(asset_names)]
+    return_edge_colors = ['#27ae60', '#e74c3c', '#f39c12', '#8e44ad'][:len(asset_names)]
+
+    # Chart 1: Current vs Future Value (Enhanced horizontal bars)
+    y_pos = range(len(asset_names))
+    bar_height = 0.35
+
+    # Create horizontal bars
+    current_bars = ax1.barh([i - bar_height/2 for i in y_pos], current_values, 
+                           bar_height, label='Current Value', 
+                           color=current_colors, alpha=0.8, edgecolor='black', linewidth=1)
+
+    future_bars = ax1.barh([i + bar_height/2 for i in y_pos], future_values, 
+                          bar_height, label='Future Value', 
+                          color=future_colors, alpha=0.8, edgecolor='black', linewidth=1)
+
+    # Add value labels on bars
+    for i, (cv, fv) in enumerate(zip(current_values, future_values)):
+        ax1.text(cv + max(current_values) * 0.02, i - bar_height/2, 
+                 f'₹{cv:,.0f}', va='center', ha='left', fontweight='bold', fontsize=9)
+        ax1.text(fv + max(future_values) * 0.02, i + bar_height/2, 
+                 f'₹{fv:,.0f}', va='center', ha='left', fontweight='bold', fontsize=9)
+
+    ax1.set_yticks(y_pos)
+    ax1.set_yticklabels(asset_names, fontweight='bold', fontsize=10)
+    ax1.invert_yaxis()
+    ax1.set_xlabel('Value (Rs.)', fontweight='bold', fontsize=11)
+    ax1.set_title('Current vs Future Value Comparison', fontweight='bold', fontsize=14, pad=20)
+    ax1.legend(loc='lower right', framealpha=0.9)
+    ax1.grid(axis='x', linestyle='--', alpha=0.7)
+    ax1.spines['top'].set_visible(False)
+    ax1.spines['right'].set_visible(False)
+
+    # Chart 2: Expected Returns (Enhanced vertical bars)
+    bars = ax2.bar(asset_names, returns, 
+                   color=return_colors, 
+                   edgecolor=return_edge_colors, 
+                   linewidth=2, 
+                   alpha=0.9)
+
+    # Add value labels on top of bars
+    for bar, value in zip(bars, returns):
+        height = bar.get_height()
+        ax2.text(bar.get_x() + bar.get_width()/2, height + 0.1, 
+                 f'{value:.1f}%', ha='center', va='bottom', fontweight='bold', fontsize=10)
+
+    ax2.set_ylabel('Expected Return (%)', fontweight='bold', fontsize=11)
+    ax2.set_title('Expected Annual Returns', fontweight='bold', fontsize=14, pad=20)
+    ax2.set_xticks(range(len(asset_names)))
+    ax2.set_xticklabels(asset_names, rotation=45, ha='right', fontweight='bold')
+    ax2.grid(axis='y', linestyle='--', alpha=0.7)
+    ax2.spines['top'].set_visible(False)
+    ax2.spines['right'].set_visible(False)
+    ax2.set_ylim(0, max(returns) * 1.2)
+
+    # Professional styling
+    fig.patch.set_facecolor('#fafafa')
+    ax1.set_facecolor('#ffffff')
+    ax2.set_facecolor('#ffffff')
+
+    plt.tight_layout(pad=3.0)
+
+    # Save chart to buffer
+    chart_buffer = BytesIO()
+    plt.savefig(chart_buffer, format='png', bbox_inches='tight', dpi=300, 
+                facecolor='#fafafa', edgecolor='none')
+    plt.close(fig)
+    chart_buffer.seek(0)
+
+    return Image(chart_buffer, width=15*cm, height=12*cm)
+
+@measured_report("asset_analysis")
+@traced("pdf.asset_analysis", is_request=True)
+def generate_comprehensive_asset_pdf(results, comparison_data, selected_assets):
+    """Generate comprehensive PDF report for asset comparison with proper formatting"""
+    buffer = BytesIO()
+    styles = get_stylesheet()
+    
+    # Define styles
+    heading_style = ParagraphStyle(
+        name='ReportHeading', 
+        fontSize=20, 
+        leading=24, 
+        alignment=TA_CENTER,
+        spaceAfter=20, 
+        fontName='Helvetica-Bold',
+        textColor=colors.black
+    )
+    
+    subheading_style = ParagraphStyle(
+        name='SubHeading',
+        fontSize=14,
+        leading=18,
+        spaceAfter=10,
+        spaceBefore=15,
+        fontName='Helvetica-Bold',
+        textColor=colors.black
+    )
+    
+    normal_style = ParagraphStyle(
+        name='Normal', 
+        parent=styles['Normal'], 
+        fontSize=10, 
+        leading=14,
+        fontName=UNICODE_FONT
+    )
+    
+    # Table styles with word wrapping
+    header_cell_style = ParagraphStyle(
+        name='HeaderCell',
+        parent=styles['Normal'],
+        fontSize=9,
+        leading=11,
+        alignment=1,  # Center alignment
+        fontName='Helvetica-Bold',
+        wordWrap='CJK'
+    )
+    
+    body_cell_style = ParagraphStyle(
+        name='BodyCell',
+        parent=styles['Normal'],
+        fontSize=9,
+        leading=11,
+        fontName=UNICODE_FONT
+    )
+    
+    elements = []
+    
+    # SECTION 1: Title and Executive Summary
+    elements.append(Paragraph("Multi-Asset Class Investment Analysis Report", heading_style))
+    elements.append(Paragraph(f"Generated on: {datetime.now().strftime('%d-%m-%Y %H:%M')}", normal_style))
+    elements.append(Spacer(1, 20))
+    
+    elements.append(Paragraph("Executive Summary", subheading_style))
+    elements.append(Paragraph(f"This report analyzes {len(selected_assets)} asset classes: {', '.join(selected_assets)}.", normal_style))
+    elements.append(Spacer(1, 15))
+    
+    # SECTION 2: Asset Comparison Table
+    elements.append(Paragraph("Asset Class Comparison", subheading_style))
+    
+    # Build table with proper headers and data
+    table_data = []
+    
+    # Header row with wrapped text
+    header_row = [
+        Paragraph("Asset Class", header_cell_style),
+        Paragraph("Current Value", header_cell_style),
+        Paragraph("Net Proceeds Today", header_cell_style),
+        Paragraph("Future Value", header_cell_style),
+        Paragraph("Expected Return", header_cell_style),
+        Paragraph("Risk Level", header_cell_style)
+    ]
+    table_data.append(header_row)
+    
+    # Data rows
+    for data in comparison_data:
+        table_data.append([
+            Paragraph(data['Asset Class'], body_cell_style),
+            Paragraph(data['Current Value'], body_cell_style),
+            Paragraph(data['Net Proceeds Today'], body_cell_style),
+            Paragraph(data['Future Value'], body_cell_style),
+            Paragraph(data['Expected Return'], body_cell_style),
+            Paragraph(data['Risk Level'], body_cell_style)
+        ])
+    
+    # Create table with fixed column widths to prevent overflow
+    comparison_table = Table(table_data, colWidths=[2.8*cm, 2.5*cm, 2.5*cm, 2.5*cm, 2.2*cm, 2.5*cm])
+    comparison_table.setStyle(TableStyle([
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+        ('BACKGROUND', (0, 0), (-1, 0), HexColor('#E6F3F8')),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('LEFTPADDING', (0, 0), (-1, -1), 3),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 3),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+        ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),  # Right align values
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ]))
+    
+    elements.append(comparison_table)
+    elements.append(Spacer(1, 20))
+    
+    # SECTION 3: Investment Recommendations
+    elements.append(Paragraph("Investment Recommendations", subheading_style))
+    
+    best_return = max(comparison_data, key=lambda x: float(x['Expected Return'].replace('%', '')))
+    elements.append(Paragraph(f"• <b>Highest Return Potential:</b> {best_return['Asset Class']} with {best_return['Expected Return']} expected annual return", normal_style))
+    
+    risk_mapping = {'Very Low': 1, 'Low': 2, 'Low to Medium': 2.5, 'Medium': 3, 'Medium to High': 4, 'High': 5}
+    lowest_risk = min(comparison_data, key=lambda x: risk_mapping.get(x['Risk Level'], 3))
+    elements.append(Paragraph(f"• <b>Lowest Risk Option:</b> {lowest_risk['Asset Class']} with {lowest_risk['Risk Level']} risk profile", normal_style))
+    
+    liquidity_mapping = {'Low': 1, 'Medium': 2, 'High': 3}
+    highest_liquidity = max(comparison_data, key=lambda x: liquidity_mapping.get(x['Liquidity'], 2))
+    elements.append(Paragraph(f"• <b>Highest Liquidity:</b> {highest_liquidity['Asset Class']} offers {highest_liquidity['Liquidity']} liquidity", normal_style))
+    
+    elements.append(Spacer(1, 20))
+    
+    # SECTION 4: Tax Considerations
+    elements.append(Paragraph("Important Tax Considerations", subheading_style))
+    elements.append(Paragraph("• <b>Accrual Tax on Fixed Deposits:</b> FD interest is taxed annually, reducing effective compounding returns", normal_style))
+    elements.append(Paragraph("• Mutual fund taxes are deferred until redemption (STCG/LTCG applicable)", normal_style))
+    elements.append(Paragraph("• Real estate enjoys indexation benefits for LTCG after 2 years", normal_style))
+    elements.append(Paragraph("• Gold has LTCG benefits after 3 years of holding", normal_style))
+
+    # SECTION 5: Visual Analysis (New Page)
+    elements.append(PageBreak())
+    elements.append(Paragraph("Visual Analysis", subheading_style))
+    
+    chart_image = asset_comparison_chart(comparison_data)
+    elements.append(chart_image)
+    elements.append(Spacer(1, 20))
+    
+    # SECTION 6: Disclaimer (New Page)
+    elements.append(PageBreak())
+    
+    elements.append(Spacer(1, 30))
+    elements.append(Paragraph("DISCLAIMER", ParagraphStyle(
+        name='DisclaimerHeading', 
+        fontSize=16, 
+        leading=24, 
+        alignment=TA_CENTER,
+        spaceAfter=25, 
+        fontName='Helvetica-Bold'
+    )))
+    
+    disclaimer_style = ParagraphStyle(
+        name='DisclaimerStyle', 
+        parent=styles['Normal'], 
+        fontSize=9, 
+        leading=11,
+        fontName=UNICODE_FONT
+    )
+    
+    # Special note about FD accrual tax
+    elements.append(Paragraph("*Important: Fixed Deposit (FD) interest is subject to annual accrual tax which reduces compounding returns. This means tax is deducted yearly on interest earned, significantly impacting the final maturity amount compared to investments where tax is deferred until redemption.", disclaimer_style))
+    elements.append(Spacer(1, 10))
+    
+    # Standard disclaimer
+    disclaimer_paragraphs = [p.strip() for p in DISCLAIMER_TEXT.split('.') if p.strip()]
+    for paragraph in disclaimer_paragraphs:
+        if paragraph:
+            elements.append(Paragraph(paragraph + ".", disclaimer_style))
+            elements.append(Spacer(1, 3))
+    
+    # Build PDF with header/footer that supports footer.png
+    doc = SimpleDocTemplate(buffer, pagesize=A4, 
+                          rightMargin=cm, leftMargin=cm, 
+                          topMargin=5*cm, bottomMargin=3*cm)
+    with span("pdf.layout"):
+        doc.build(elements, onFirstPage=header_footer_with_logos,
+                  onLaterPages=header_footer_with_logos)
+    
+    buffer.seek(0)
+    return buffer
@@ -0,0 +1,507 @@
+from io import BytesIO
+from datetime import datetime
+
+import streamlit as st
+import pandas as pd
+from reportlab.lib.pagesizes import A4
+from reportlab.lib import colors
+from reportlab.platypus import Table, TableStyle, SimpleDocTemplate, Paragraph, Spacer, PageBreak, Image
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.colors import HexColor
+from reportlab.lib.units import cm
+from reportlab.lib.enums import TA_CENTER
+import matplotlib.pyplot as plt
+
+from sahayak.utils import format_indian_number
+from sahayak.goals import GOAL_ORDER, GOAL_LABELS, GOAL_FIELDS, GoalPlan
+from sahayak.pdf_common import UNICODE_FONT, DISCLAIMER_TEXT, header_footer_with_logos, dataframe_to_table
+from sahayak.metrics import measured_report
+from sahayak.tracing import span, traced
+from sahayak.resources import get_stylesheet, default_table
+from sahayak.session_store import CompactTable, as_frame, fragment, store_table
+from sahayak.ui import show_header, show_back_button, client_records_panel
+
+# Session values saved per client (see ui.client_records_panel)
+CLIENT_RECORD_KEYS = (
+    ['goal_client_name', 'goal_current_age', 'goal_date', 'goal_risk_profile']
+    + [f"include_{goal_key}" for goal_key in GOAL_ORDER]
+    + [field for goal_key in GOAL_ORDER for field in GOAL_FIELDS[goal_key]]
+    + ['current_assets', 'goal_calculations', 'calculations_done']
+)
+
+# --- 1. Financial Goal Planner (COMPLETE) ---
+# Each goal, the assets editor and each results panel is a fragment, so a
+# widget change reruns only the fragment that owns it instead of the page.
+# Goal results come from the session's GoalPlan, which recalculates a goal
+# only when its own inputs change.
+def show_financial_goal_planner():
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+    
+    show_header()
+    show_back_button("back_goal_planner")
+    
+    # Title Section with BLUE GRADIENT
+    st.markdown("""
+    <div class="goal-section">
+        <h2>Financial Goal Planner</h2>
+        <p>Comprehensive financial goal planning with SIP calculations and progress tracking</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    client_records_panel("goal_planner", CLIENT_RECORD_KEYS, name_key="goal_client_name")
+    
+    # Initialize current_assets if not already set
+    if 'current_assets' not in st.session_state:
+        st.session_state.current_assets = CompactTable.from_frame(default_table('current_assets'))
+    if 'goal_plan' not in st.session_state:
+        st.session_state.goal_plan = GoalPlan()
+    
+    # Client Information Section
+    st.markdown('<div class="info-card"><h3>👤 Client Information</h3></div>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        client_name = st.text_input("Client Name (Mr./Ms.)", placeholder="Enter client name", key="goal_client_name")
+        current_age = st.number_input("Current Age", value=30, key="goal_current_age")
+    
+    with col2:
+        date_field = st.text_input("Date", value=datetime.now().strftime("%d-%m-%Y"), key="goal_date")
+        risk_profile = st.selectbox("Risk Profile", ["Conservative", "Moderate", "Aggressive"], key="goal_risk_profile")
+    
+    # GOAL SELECTION SECTION
+    st.markdown('<div class="info-card"><h3>Select Goals to Calculate</h3></div>', unsafe_allow_html=True)
+    
+    selected_goals = []
+    for col, goal_key in zip(st.columns(4), GOAL_ORDER):
+        with col:
+            if st.checkbox(GOAL_LABELS[goal_key], value=True, key=f"include_{goal_key}"):
+                selected_goals.append(goal_key)
+    
+    # Financial Goals Configuration (Only show selected goals)
+    st.markdown('<div class="info-card"><h3>🎯 Financial Goals Configuration</h3></div>', unsafe_allow_html=True)
+    
+    for goal_key in selected_goals:
+        goal_input_fragment(goal_key)
+    
+    # Current Assets Summary
+    st.markdown('<div class="info-card"><h3>💼 Current Assets Summary</h3><p>Please provide details of your current general assets:</p></div>', unsafe_allow_html=True)
+    
+    current_assets_fragment()
+    
+    # Calculate Button
+    st.markdown('<div class="calculate-button">', unsafe_allow_html=True)
+    if st.button("Calculate Selected Financial Goals"):
+        with st.spinner("⚡ Calculating your selected financial goals..."):
+            
+            # Process ONLY selected goals; the plan skips those whose inputs
+            # haven't changed since they were last calculated
+            plan = st.session_state.goal_plan
+            plan.update(selected_goals, st.session_state, current_age)
+            calculated_goals = plan.calculated_goals()
+            
+            # Store results with client information. The assets snapshot is
+            # the same read-only table object as current_assets, not a copy.
+            st.session_state.goal_calculations = {
+                'calculated_goals': calculated_goals,
+                **plan.summary,
+                'client_name': client_name,
+                'current_age': current_age,
+                'date_field': date_field,
+                'risk_profile': risk_profile,
+                'edited_assets': st.session_state.current_assets
+            }
+            
+            st.session_state.calculations_done = True
+            st.success(f"✅ Calculated {len(calculated_goals)} selected financial goals successfully!")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Display Results (only for selected goals)
+    if st.session_state.get('calculations_done', False) and st.session_state.get('goal_calculations'):
+        # Results Section
+        st.markdown("""
+        <div class="results-section">
+            <div class="results-title">📈 Selected Goals Analysis Results</div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        goal_results_fragment()
+        goal_progress_chart_fragment()
+        goal_pdf_fragment()
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+def render_goal_inputs(goal_key):
+    defaults = GOAL_FIELDS[goal_key]
+
+    # Education Goal
+    if goal_key == 'education':
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.text_input("Goal Name", value=defaults['edu_goal_name'], key="edu_goal_name")
+            st.number_input("Child's Current Age", min_value=0, max_value=25, value=defaults['edu_current_age'], key="edu_current_age")
+        with col2:
+            st.number_input("Age when goal is needed", min_value=1, max_value=30, value=defaults['edu_target_age'], key="edu_target_age")
+            st.number_input("Current Cost of Education (Rs.)", min_value=0, value=defaults['edu_current_cost'], key="edu_current_cost")
+        with col3:
+            st.number_input("Education Inflation (%)", min_value=0.0, max_value=20.0, value=defaults['edu_inflation'], key="edu_inflation")
+            st.number_input("Expected Return (%)", min_value=0.0, max_value=30.0, value=defaults['edu_return'], key="edu_return")
+        
+        st.number_input("Amount Already Saved for this Goal (Rs.)", min_value=0, value=defaults['edu_already_saved'], key="edu_already_saved")
+    
+    # Marriage Goal
+    elif goal_key == 'marriage':
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.text_input("Goal Name", value=defaults['marriage_goal_name'], key="marriage_goal_name")
+            st.number_input("Age when goal is needed", min_value=18, max_value=80, value=defaults['marriage_target_age'], key="marriage_target_age")
+        with col2:
+            st.number_input("Target Amount (Rs.)", min_value=0, value=defaults['marriage_amount'], key="marriage_amount")
+            st.number_input("Inflation (%)", min_value=0.0, max_value=20.0, value=defaults['marriage_inflation'], key="marriage_inflation")
+        with col3:
+            st.number_input("Expected Return (%)", min_value=0.0, max_value=30.0, value=defaults['marriage_return'], key="marriage_return")
+        
+        st.number_input("Amount Already Saved for this Goal (Rs.)", min_value=0, value=defaults['marriage_already_saved'], key="marriage_already_saved")
+    
+    # Emergency Goal
+    elif goal_key == 'emergency':
+        col1, col2 = st.columns(2)
+        with col1:
+            st.number_input("Emergency Fund (Months of expenses)", min_value=3, max_value=24, value=defaults['emergency_months'], key="emergency_months")
+            st.number_input("Current Monthly Expenses (Rs.)", min_value=0, value=defaults['monthly_expenses'], key="monthly_expenses")
+        with col2:
+            st.number_input("Expected Return (%)", min_value=0.0, max_value=15.0, value=defaults['emergency_return'], key="emergency_return")
+        
+        st.number_input("Amount Already Saved for Emergency Fund (Rs.)", min_value=0, value=defaults['emergency_already_saved'], key="emergency_already_saved")
+    
+    # Retirement Goal
+    elif goal_key == 'retirement':
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.number_input("Retirement Age", min_value=40, max_value=80, value=defaults['retirement_age'], key="retirement_age")
+            st.number_input("Years in Retirement", min_value=10, max_value=40, value=defaults['retirement_years'], key="retirement_years")
+        with col2:
+            st.number_input("Monthly Expenses at Retirement (Rs.)", min_value=0, value=defaults['retirement_monthly_exp'], key="retirement_monthly_exp")
+            st.number_input("Inflation (%)", min_value=0.0, max_value=15.0, value=defaults['retirement_inflation'], key="retirement_inflation")
+        with col3:
+            st.number_input("Expected Return (%)", min_value=0.0, max_value=20.0, value=defaults['retirement_return'], key="retirement_return")
+        
+        st.number_input("Amount Already Saved for Retirement (Rs.)", min_value=0, value=defaults['retirement_already_saved'], key="retirement_already_saved")
+
+@fragment
+def goal_input_fragment(goal_key):
+    """Inputs and live result for one goal; editing them reruns only this goal"""
+    with st.expander(GOAL_LABELS[goal_key], expanded=False):
+        render_goal_inputs(goal_key)
+        
+        goal = st.session_state.goal_plan.result(goal_key, st.session_state, st.session_state.goal_current_age)
+        if goal:
+            st.caption(
+                f"Target Rs.{format_indian_number(goal['Target Value'])} | "
+                f"Monthly SIP Rs.{format_indian_number(goal['Monthly SIP'])} | "
+                f"Lumpsum Rs.{format_indian_number(goal['Lumpsum'])}"
+            )
+
+@fragment
+def current_assets_fragment():
+    # Assets table editor
+    edited_assets = st.data_editor(
+        st.session_state.current_assets.to_frame(),
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "Asset Class": st.column_config.TextColumn("Asset Class", disabled=True),
+            "Expected Returns (%)": st.column_config.NumberColumn("Expected Returns (%)", min_value=0.0, max_value=30.0, step=0.1, format="%.1f"),
+            "Current Value (Rs.)": st.column_config.NumberColumn("Current Value (Rs.)", min_value=0, step=1000, format="%d")
+        }
+    )
+    store_table('current_assets', edited_assets)
+
+@fragment
+def goal_results_fragment():
+    results = st.session_state.goal_calculations
+    
+    # Create results DataFrame for selected goals
+    results_data = []
+    for goal in results['calculated_goals']:
+        results_data.append({
+            'Goal': goal['Goal'],
+            'Target Value': f"Rs.{format_indian_number(goal['Target Value'])}",
+            'Already Saved': f"Rs.{format_indian_number(goal['Already Saved'])}",
+            'Progress': f"{goal['Progress']:.1f}%",
+            'Deficit': f"Rs.{format_indian_number(goal['Deficit'])}",
+            'Monthly SIP': f"Rs.{format_indian_number(goal['Monthly SIP'])}",
+            'Step-up SIP': f"Rs.{format_indian_number(goal['Step-up SIP'])}",
+            'Lumpsum': f"Rs.{format_indian_number(goal['Lumpsum'])}"
+        })
+    
+    if results_data:
+        results_df = pd.DataFrame(results_data)
+        st.dataframe(results_df, use_container_width=True, hide_index=True)
+    
+    # Summary Metrics
+    st.markdown('<div class="info-card"><h3>Combined Selected Goals Summary</h3></div>', unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="metric-label">Total Monthly SIP Required</div>
+            <div class="metric-value">Rs.{format_indian_number(results['total_sip'])}</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="metric-label">Total Step-up SIP Required</div>
+            <div class="metric-value">Rs.{format_indian_number(results['total_stepup_sip'])}</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="metric-label">Total Lumpsum Required</div>
+            <div class="metric-value">Rs.{format_indian_number(results['total_lumpsum'])}</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+@fragment
+def goal_progress_chart_fragment():
+    results = st.session_state.goal_calculations
+    
+    # Progress Visualization for selected goals
+    if results['calculated_goals']:
+        st.markdown('<div class="calculation-card"><h3>Selected Goals Progress</h3></div>', unsafe_allow_html=True)
+        
+        fig, ax = plt.subplots(figsize=(12, 6))
+        goal_names = [goal['Goal'] for goal in results['calculated_goals']]
+        progress_values = [goal['Progress'] for goal in results['calculated_goals']]
+        
+        bars = ax.barh(goal_names, progress_values, color='#4facfe')
+        ax.set_xlabel('Progress Completion (%)')
+        ax.set_ylabel('Selected Financial Goals')
+        ax.set_title('Current Progress Towards Selected Goals')
+        ax.set_xlim(0, 100)
+        
+        for i, (bar, value) in enumerate(zip(bars, progress_values)):
+            ax.text(value + 1, i, f'{value:.1f}%', va='center')
+        
+        ax.grid(True, alpha=0.3, axis='x')
+        st.pyplot(fig)
+        plt.close()
+
+@fragment
+def goal_pdf_fragment():
+    results = st.session_state.goal_calculations
+    client_name = st.session_state.goal_client_name
+    
+    # PDF Generation Button (ONLY shows after calculation)
+    st.markdown('<div class="calculate-button">', unsafe_allow_html=True)
+    if st.button("📄 Generate Financial Goal Report PDF"):
+        if not client_name:
+            st.error("Please enter a client name before generating the PDF.")
+        elif not results.get('calculated_goals'):
+            st.error("No goals were calculated. Please select and calculate goals first.")
+        else:
+            with st.spinner("Generating Financial Goal Report..."):
+                try:
+                    pdf = generate_financial_goal_pdf(
+                        results, client_name, st.session_state.goal_current_age,
+                        st.session_state.goal_date, st.session_state.goal_risk_profile
+                    )
+                    st.success("Financial Goal Report generated successfully!")
+                    st.download_button(
+                        label="✅ Download Financial Goal Report PDF",
+                        data=pdf,
+                        file_name=f"Financial_Goal_Report_{client_name.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.pdf",
+                        mime="application/pdf",
+                        use_container_width=True
+                    )
+                except Exception as e:
+                    st.error(f"Error generating PDF: {str(e)}")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+@traced("chart.goal_progress")
+def goal_progress_chart(calculated_goals):
+    """Progress bar chart of the calculated goals as a PDF image"""
+    fig, ax = plt.subplots(figsize=(8, 4))  # Adjusted size for PDF
+    goal_names = [goal['Goal'] for goal in calculated_goals]
+    progress_values = [goal['Progress'] for goal in calculated_goals]
+
+    bars = ax.barh(goal_names, progress_values, color='#4facfe')
+    ax.set_xlabel('Progress Completion (%)')
+    ax.set_ylabel('Selected Financial Goals')
+    ax.set_title('Current Progress Towards Selected Goals')
+    ax.set_xlim(0, 100)
+
+    for i, (bar, value) in enumerate(zip(bars, progress_values)):
+        ax.text(value + 1, i, f'{value:.1f}%', va='center')
+
+    ax.grid(True, alpha=0.3, axis='x')
+
+    # Save figure to BytesIO
+    img_buffer = BytesIO()
+    plt.savefig(img_buffer, format='png', bbox_inches='tight')
+    plt.close(fig)
+    img_buffer.seek(0)
+
+    # Insert image into PDF
+    return Image(img_buffer, width=15*cm, height=10*cm)  # Adjust size as needed
+
+@measured_report("goal_plan")
+@traced("pdf.goal_plan", is_request=True)
+def generate_financial_goal_pdf(results, client_name, current_age, date_field, risk_profile):
+    buffer = BytesIO()
+
+    # Create PDF document
+    styles = get_stylesheet()
+
+    # Define custom styles
+    heading_style = ParagraphStyle(
+        name='HeadingLarge', 
+        fontSize=20, 
+        leading=24, 
+        alignment=TA_CENTER,
+        spaceAfter=20, 
+        fontName=UNICODE_FONT,
+        textColor=colors.black
+    )
+    client_style = ParagraphStyle(
+        name='ClientDetails', 
+        parent=styles['Normal'], 
+        spaceAfter=6, 
+        leading=14, 
+        fontName=UNICODE_FONT,
+        fontSize=11
+    )
+
+    subheading_style = ParagraphStyle(
+        name='SubHeading',
+        fontSize=14,
+        leading=18,
+        spaceAfter=10,
+        spaceBefore=15,
+        fontName='Helvetica-Bold',
+        textColor=colors.black
+    )
+
+    elements = []
+
+    # Title
+    elements.append(Paragraph("Financial Goal Planner Report", heading_style))
+    elements.append(Paragraph(f"Generated on: {date_field}", client_style))
+    elements.append(Spacer(1, 20))
+
+    # Client Information Section
+    elements.append(Paragraph("Client Information", subheading_style))
+    elements.append(Paragraph(f"<b>Client Name:</b> {client_name}", client_style))
+    elements.append(Paragraph(f"<b>Age:</b> {current_age} years", client_style))
+    elements.append(Paragraph(f"<b>Risk Profile:</b> {risk_profile}", client_style))
+
+    # Asset allocation recommendation
+    asset_allocation = {"Conservative": "40% Equity, 60% Debt", "Moderate": "60% Equity, 40% Debt", "Aggressive": "80% Equity, 20% Debt"}[risk_profile]
+    elements.append(Paragraph(f"<b>Recommended Asset Allocation:</b> {asset_allocation} - {risk_profile} approach", client_style))
+    elements.append(Spacer(1, 20))
+
+    # Financial Goals Analysis Section
+    elements.append(Paragraph("Financial Goals Analysis", subheading_style))
+
+    # Create table data for goals
+    if results['calculated_goals']:
+        table_data = [
+            ['Goal', 'Target', 'Progress', 'Monthly SIP', 'Lumpsum']
+        ]
+
+        for goal in results['calculated_goals']:
+            table_data.append([
+                goal['Goal'],
+                f"Rs.{format_indian_number(goal['Target Value'])}",
+                f"Rs.{format_indian_number(goal['Already Saved'])} ({goal['Progress']:.1f}%)",
+                f"Rs.{format_indian_number(goal['Monthly SIP'])}",
+                f"Rs.{format_indian_number(goal['Lumpsum'])}"
+            ])
+
+        # Create table with matching color scheme to Current Asset Summary
+        goal_table = Table(table_data, colWidths=[6*cm, 3.5*cm, 4*cm, 3.5*cm, 3.5*cm])
+        goal_table.setStyle(TableStyle([
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),  # Matching grid
+            ('BACKGROUND', (0, 0), (-1, 0), HexColor('#E6F3F8')),  # Matching header background (light blue)
+            # No body background (matches Current Asset Summary)
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # Matching vertical alignment
+            ('LEFTPADDING', (0, 0), (-1, -1), 4),    # Matching padding
+            ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),    # Center header
+            ('ALIGN', (0, 1), (-1, -1), 'LEFT'),     # Left-align body
+            ('ALIGN', (-2, 1), (-1, -1), 'RIGHT'),   # Right-align numbers in body
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),  # Bold header
+            ('FONTSIZE', (0, 0), (-1, 0), 10),       # Matching font sizes
+            ('FONTSIZE', (0, 1), (-1, -1), 9),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),  # Padding for header
+        ]))
+
+        elements.append(goal_table) 
+        elements.append(Spacer(1, 20))
+
+
+    # Investment Summary Section
+    elements.append(Paragraph("Investment Summary", subheading_style))
+    elements.append(Paragraph(f"<b>Total Monthly SIP Required:</b> Rs.{format_indian_number(results['total_sip'])}", client_style))
+    elements.append(Paragraph(f"<b>Total Step-up SIP Required:</b> Rs.{format_indian_number(results['total_stepup_sip'])}", client_style))
+    elements.append(Paragraph(f"<b>Total Lumpsum Required:</b> Rs.{format_indian_number(results['total_lumpsum'])}", client_style))
+    elements.append(Spacer(1, 20))
+
+    # Current Asset Summary Section
+    elements.append(PageBreak())
+    elements.append(Paragraph("Current Asset Summary", subheading_style))
+    assets_table = dataframe_to_table(as_frame(results['edited_assets']))
+    elements.append(assets_table)
+    elements.append(Spacer(1, 20))
+
+    # Goal Progress Visualization
+    elements.append(Paragraph("Goal Progress Visualization", subheading_style))
+    img = goal_progress_chart(results['calculated_goals'])
+    elements.append(img)
+    elements.append(Spacer(1, 20))
+
+    # Page break before disclaimer
+    elements.append(PageBreak())
+
+    # Disclaimer Section
+    elements.append(Spacer(1, 30))
+    elements.append(Paragraph("DISCLAIMER", ParagraphStyle(
+        name='DisclaimerHeading', 
+        fontSize=16, 
+        leading=24, 
+        alignment=TA_CENTER,
+        spaceAfter=25, 
+        fontName='Helvetica-Bold'
+    )))
+
+    disclaimer_style = ParagraphStyle(
+        name='DisclaimerStyle', 
+        parent=styles['Normal'], 
+        fontSize=9, 
+        leading=11,
+        fontName=UNICODE_FONT
+    )
+
+    # Split disclaimer into paragraphs
+    disclaimer_paragraphs = [p.strip() for p in DISCLAIMER_TEXT.split('.') if p.strip()]
+    for paragraph in disclaimer_paragraphs:
+        if paragraph:
+            elements.append(Paragraph(paragraph + ".", disclaimer_style))
+            elements.append(Spacer(1, 3))
+
+    # Build PDF
+    doc = SimpleDocTemplate(buffer, pagesize=A4, 
+                          rightMargin=cm, leftMargin=cm, 
+                          topMargin=5*cm, bottomMargin=3*cm)
+    with span("pdf.layout"):
+        doc.build(elements, onFirstPage=header_footer_with_logos,
+                  onLaterPages=header_footer_with_logos)
+
+    buffer.seek(0)
+    return buffer
@@ -0,0 +1,473 @@
+from io import BytesIO
+from datetime import datetime
+
+import streamlit as st
+import pandas as pd
+import matplotlib.pyplot as plt
+from reportlab.lib.pagesizes import A4
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, KeepTogether, Image
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.units import cm
+from reportlab.lib.enums import TA_LEFT
+
+from sahayak.utils import format_indian_number
+from sahayak.pdf_common import UNICODE_FONT, DISCLAIMER_TEXT, header_footer_with_logos, dataframe_to_table, fund_performance_table
+from sahayak.fund_metrics import fill_fund_performance
+from sahayak.metrics import measured_report
+from sahayak.tracing import span, traced
+from sahayak.resources import get_stylesheet, default_table, load_nav_store
+from sahayak.rolling_returns import ROLLING_WINDOWS, scheme_rolling_returns
+from sahayak.session_store import as_frame, store_table
+from sahayak.stp import STP_FREQUENCIES, stp_schedule
+from sahayak.ui import show_header, show_back_button, scheme_name_helper, client_records_panel
+
+DEFAULT_RETURNS = {"Conservative": "8-10%", "Moderate": "10-12%", "Aggressive": "12-15%"}
+
+# Session values saved per client (see ui.client_records_panel); the
+# allocation tables are saved from their editors
+CLIENT_RECORD_KEYS = [
+    'inv_client_name', 'inv_report_date', 'inv_financial_goal', 'inv_horizon', 'inv_risk_profile',
+    'inv_return_expectation', 'inv_lumpsum_amount', 'inv_sip_amount', 'include_strategy_note', 'inv_strategy_note',
+    'include_lumpsum', 'include_sip', 'include_fund_perf', 'include_initial_stp', 'include_final_stp',
+    'fund_perf_benchmark', 'fund_perf_notes', 'include_rolling_returns', 'rolling_chart_window',
+    'stp_start', 'stp_frequency', 'stp_amount', 'stp_count', 'include_stp_schedule', 'inv_factsheet_links',
+]
+ALLOCATION_TABLES = ('lumpsum', 'sip', 'fund_perf', 'initial_stp', 'final_stp')
+
+# --- 2. Investment Sheet Generator ---
+def show_investment_sheet():
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+    
+    show_header()
+    show_back_button("back_investment")
+    
+    st.markdown("""
+    <div class="goal-section">
+        <h2>Investment Sheet Generator</h2>
+        <p>Create comprehensive investment recommendations and portfolio allocations</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    client_records_panel("investment_sheet", CLIENT_RECORD_KEYS, tables=ALLOCATION_TABLES, name_key="inv_client_name")
+    
+    tab1, tab2, tab3 = st.tabs(["📋 Client Details", "💼 Portfolio Configuration", "📄 Generate PDF"])
+    
+    with tab1:
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            client_name = st.text_input("Client Name", placeholder="Enter client full name", key="inv_client_name")
+            report_date = st.text_input("Report Date", value=datetime.now().strftime("%d-%m-%Y"), key="inv_report_date")
+            financial_goal = st.text_input("Financial Goal", placeholder="e.g., Wealth Creation, Retirement Planning",
+                                           key="inv_financial_goal")
+            
+        with col2:
+            investment_horizon = st.selectbox("Investment Horizon", ["Short Term (< 3 years)", "Medium Term (3-7 years)", "Long Term (> 7 years)"],
+                                              key="inv_horizon")
+            # Changing the profile resets Expected Returns to its default
+            risk_profile = st.selectbox("Risk Profile", list(DEFAULT_RETURNS), key="inv_risk_profile",
+                                        on_change=reset_return_expectation)
+            return_expectation = st.text_input("Expected Returns", value=DEFAULT_RETURNS[risk_profile],
+                                               key="inv_return_expectation")
+
+        st.markdown("**Investment Amount**")
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            investment_amount = st.text_input("Lumpsum Investment (Rs.)", placeholder="0", key="inv_lumpsum_amount")
+        with col2:
+            sip_amount = st.text_input("Monthly SIP Amount (Rs.)", placeholder="0", key="inv_sip_amount")
+        
+        include_strategy_note = st.checkbox("Include Investment Strategy Description", key="include_strategy_note")
+        if include_strategy_note:
+            strategy_note = st.text_area("Strategy Description", 
+                                        value="""Out of Rs. 35.00 lacs,
+• An amount of Rs 7.00 Lacs will be invested directly into Equity Funds.
+• Balance amount of Rs. 28.00 lacs will be invested into Debt funds, we will start STP (Systematic Transfer Plan) of
+ Rs. 3.50 lacs every fortnight or according to the market opportunities from Debt Funds to Equity Funds till August 2025.
+This is an important point to note.""", 
+                                        height=100, key="inv_strategy_note")
+    
+    with tab2:
+        st.markdown("**Select Tables to Include**")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            include_lumpsum = st.checkbox("Lumpsum Allocation", key="include_lumpsum")
+            include_sip = st.checkbox("SIP Allocation", key="include_sip")
+            include_fund_perf = st.checkbox("Fund Performance Analysis", key="include_fund_perf")
+            
+        with col2:
+            include_initial_stp = st.checkbox("Initial Investment (STP Clients)", key="include_initial_stp")
+            include_final_stp = st.checkbox("Final Portfolio (Post STP)", key="include_final_stp")
+
+        lumpsum_alloc = None
+        if include_lumpsum:
+            with st.expander("Configure Lumpsum Allocation", expanded=True):
+                lumpsum_alloc = allocation_editor("lumpsum", 'lumpsum')
+
+        sip_alloc = None
+        if include_sip:
+            with st.expander("Configure SIP Allocation", expanded=True):
+                sip_alloc = allocation_editor("sip", 'sip')
+
+        fund_perf = None
+        rolling = None
+        if include_fund_perf:
+            with st.expander("Configure Fund Performance", expanded=True):
+                fund_perf = allocation_editor("fund_perf", 'fund_perf')
+                nav_store = load_nav_store()
+                if nav_store is not None:
+                    col1, col2 = st.columns([3, 1])
+                    with col1:
+                        benchmark = st.text_input("Benchmark Scheme (code or name)", key="fund_perf_benchmark",
+                                                  help="An index fund to measure Beta and Alpha against; leave empty to skip them")
+                    with col2:
+                        fill = st.button("Fill from NAV History", key="fill_fund_perf", use_container_width=True)
+                    if fill:
+                        notes = []
+                        benchmark = benchmark.strip() or None
+                        if benchmark and nav_store.find(benchmark) is None:
+                            notes.append(f"Benchmark '{benchmark}' is not in the NAV history; Beta and Alpha were not filled.")
+                            benchmark = None
+                        filled, missing = fill_fund_performance(fund_perf, nav_store, benchmark)
+                        if missing:
+                            notes.append(f"No NAV history for: {', '.join(missing)}.")
+                        st.session_state['fund_perf_notes'] = notes
+                        replace_table("fund_perf", filled)
+                    for note in st.session_state.get('fund_perf_notes', []):
+                        st.info(note)
+
+                    col1, col2 = st.columns([3, 1])
+                    with col1:
+                        include_rolling = st.checkbox("Include Rolling Returns", key="include_rolling_returns",
+                                                      help="Rolling return ranges of these schemes from their NAV history")
+                    with col2:
+                        rolling_window = st.selectbox("Chart Window", list(ROLLING_WINDOWS), index=1, key="rolling_chart_window")
+                    if include_rolling:
+                        rolling = scheme_rolling_returns(nav_store, fund_perf['Scheme Name'].fillna('').astype(str),
+                                                         rolling_window)
+                        if rolling is None:
+                            st.info("None of these schemes is in the NAV history.")
+                        else:
+                            st.dataframe(rolling_returns_table(rolling['summary']), use_container_width=True, hide_index=True)
+                            st.line_chart(rolling['series'])
+
+        initial_alloc = None
+        if include_initial_stp:
+            with st.expander("Configure Initial Investment (STP)", expanded=True):
+                initial_alloc = allocation_editor("initial_stp", 'stp_allocation')
+
+        final_alloc = None
+        if include_final_stp:
+            with st.expander("Configure Final Portfolio (Post STP)", expanded=True):
+                final_alloc = allocation_editor("final_stp", 'stp_allocation')
+
+        stp_table = None
+        if include_initial_stp and include_final_stp:
+            with st.expander("STP Transfer Schedule", expanded=False):
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    stp_start = st.date_input("First Transfer Date", key="stp_start")
+                    stp_frequency = st.selectbox("Transfer Frequency", list(STP_FREQUENCIES), index=1, key="stp_frequency")
+                with col2:
+                    stp_amount = st.number_input("Amount per Transfer (Rs.)", min_value=0, value=0, step=50000, key="stp_amount",
+                                                 help="Leave at 0 to split the transfers equally over the number of transfers")
+                    stp_count = st.number_input("Number of Transfers", min_value=1, max_value=104, value=8, key="stp_count")
+                with col3:
+                    include_stp_schedule = st.checkbox("Include schedule in PDF", key="include_stp_schedule")
+
+                try:
+                    stp = stp_schedule(initial_alloc, final_alloc, stp_start, stp_frequency,
+                                       instalments=stp_count, instalment_amount=stp_amount or None)
+                except ValueError as e:
+                    st.info(f"No STP schedule: {e}.")
+                else:
+                    schedule = stp['schedule']
+                    st.dataframe(stp_schedule_table(schedule), use_container_width=True, hide_index=True)
+                    st.line_chart(schedule.set_index('date').drop(columns=['instalment', 'transfer', 'total']))
+                    if include_stp_schedule:
+                        stp_table = schedule
+
+        st.markdown("**Fund Factsheets**")
+        factsheet_links = st.text_area("Factsheet Links", 
+                                       placeholder="Format: Fund Name - Description | https://link.com\nOne link per line",
+                                       height=80, key="inv_factsheet_links")
+
+    with tab3:
+        st.markdown("**PDF Generation**")
+        
+        if not client_name or not client_name.strip():
+            st.warning("Please enter client name in the Client Details tab to generate PDF.")
+        else:
+            st.success(f"Ready to generate PDF for: **{client_name}**")
+            
+            col1, col2, col3 = st.columns([1, 2, 1])
+            with col2:
+                if st.button("📄 Download Investment Sheet PDF", type="primary", use_container_width=True):
+                    if not client_name.strip() or not report_date.strip():
+                        st.error("Please enter both Client Name and Report Date.")
+                    else:
+                        with st.spinner("Generating Investment Sheet..."):
+                            pdf = generate_investment_pdf(
+                                client_name, report_date, financial_goal, investment_horizon, risk_profile,
+                                return_expectation, investment_amount, sip_amount,
+                                strategy_note=strategy_note if include_strategy_note else None,
+                                lumpsum_alloc=lumpsum_alloc, sip_alloc=sip_alloc, fund_perf=fund_perf,
+                                initial_alloc=initial_alloc, final_alloc=final_alloc,
+                                factsheet_links=factsheet_links, stp_schedule=stp_table,
+                                rolling_returns=rolling
+                            )
+                            st.success("Investment Sheet PDF generated successfully!")
+                            st.download_button(
+                                label="Download Investment Sheet PDF",
+                                data=pdf,
+                                file_name=f"Investment_Sheet_{client_name.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.pdf",
+                                mime="application/pdf"
+                            )
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+def reset_return_expectation():
+    st.session_state.inv_return_expectation = DEFAULT_RETURNS[st.session_state.inv_risk_profile]
+
+def allocation_editor(key, default_name):
+    """Editable table starting from the session's copy (or the default),
+    with scheme lookup and name corrections below it"""
+    start = st.session_state.get(f"{key}_table")
+    table = st.data_editor(default_table(default_name) if start is None else as_frame(start),
+                           num_rows="dynamic", use_container_width=True, key=key)
+    # Kept compact for saving the client (the editor's own state holds only the edits)
+    store_table(f"{key}_edited", table)
+    fixed = scheme_name_helper(table, key)
+    if fixed is not None:
+        replace_table(key, fixed)
+    return table
+
+def replace_table(key, table):
+    # The editor starts over from the new table, dropping its pending edits
+    store_table(f"{key}_table", table)
+    st.session_state.pop(key, None)
+    st.rerun()
+
+def stp_schedule_table(schedule):
+    """STP schedule formatted for display: dates and rupee amounts as text"""
+    table = pd.DataFrame({
+        'No.': schedule['instalment'].astype(str),
+        'Date': pd.to_datetime(schedule['date']).dt.strftime('%d-%m-%Y'),
+    })
+    for column in schedule.columns.drop(['instalment', 'date']):
+        label = {'transfer': 'Transfer', 'total': 'Total'}.get(column, column)
+        table[label] = [f"Rs.{format_indian_number(value)}" for value in schedule[column]]
+    return table
+
+def rolling_returns_table(summary):
+    """Rolling return summary formatted for display: one row per scheme and window"""
+    table = pd.DataFrame({'Scheme Name': summary['Scheme Name'], 'Window': summary['window']})
+    for column, label in [('Min', 'Min'), ('P5', '5th'), ('P25', '25th'), ('P50', 'Median'), ('P75', '75th'),
+                          ('P95', '95th'), ('Max', 'Max'), ('Positive (%)', 'Positive')]:
+        table[label] = [f"{value:.2f}%" if pd.notna(value) else '-' for value in summary[column]]
+    return table
+
+@traced("chart.rolling_returns")
+def rolling_returns_chart(series, window):
+    """Compact line chart of rolling CAGRs for the PDF"""
+    fig, ax = plt.subplots(figsize=(8, 3))
+    for column in series.columns:
+        ax.plot(series.index, series[column], linewidth=1, label=column)
+    ax.axhline(0, color='black', linewidth=0.6)
+    ax.set_ylabel(f"Rolling {window} CAGR (%)", fontsize=8)
+    ax.tick_params(labelsize=7)
+    ax.legend(fontsize=7, loc='upper left', framealpha=0.9)
+    ax.grid(True, alpha=0.3)
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+
+    img_buffer = BytesIO()
+    plt.savefig(img_buffer, format='png', bbox_inches='tight', dpi=200)
+    plt.close(fig)
+    img_buffer.seek(0)
+    return Image(img_buffer, width=16*cm, height=6*cm)
+
+@measured_report("investment")
+@traced("pdf.investment", is_request=True)
+def generate_investment_pdf(client_name, report_date, financial_goal, investment_horizon, risk_profile,
+                            return_expectation, investment_amount="", sip_amount="", strategy_note=None,
+                            lumpsum_alloc=None, sip_alloc=None, fund_perf=None, initial_alloc=None,
+                            final_alloc=None, factsheet_links="", stp_schedule=None, rolling_returns=None):
+    buffer = BytesIO()
+    styles = get_stylesheet()
+
+    link_container_style = ParagraphStyle(
+        name='LinkContainer',
+        parent=styles['Normal'],
+        fontSize=10,
+        spaceAfter=5,
+        fontName=UNICODE_FONT
+    )
+    bullet_style = ParagraphStyle(
+        name='BulletStyle',
+        parent=styles['Normal'],
+        leftIndent=20,
+        firstLineIndent=-15,
+        spaceBefore=0,
+        leading=14,
+        fontSize=10,
+        alignment=TA_LEFT,
+        fontName=UNICODE_FONT
+    )
+
+    heading_style = ParagraphStyle(name='HeadingLarge', fontSize=20, leading=24, alignment=1, spaceAfter=20, fontName=UNICODE_FONT)
+    client_style = ParagraphStyle(name='ClientDetails', parent=styles['Normal'], spaceAfter=6, leading=14, fontName=UNICODE_FONT)
+    note_style = ParagraphStyle(name='NoteStyle', fontSize=7, leading=10, fontName=UNICODE_FONT)
+
+    elements = [Paragraph("Investment Sheet", heading_style)]
+
+    elements += [
+        Paragraph(f"<b>Client Name:</b> {client_name}", client_style),
+        Paragraph(f"<b>Date:</b> {report_date}", client_style),
+        Paragraph(f"<b>Financial Goal:</b> {financial_goal}", client_style),
+        Paragraph(f"<b>Investment Horizon:</b> {investment_horizon}", client_style),
+        Paragraph(f"<b>Risk Profile:</b> {risk_profile}", client_style),
+        Paragraph(f"<b>Return Expectation:</b> {return_expectation}", client_style),
+    ]
+
+    investment_summary_parts = []
+    if investment_amount.strip():
+        try:
+            amount_num = float(investment_amount.replace(',', '').replace('Rs.', '').replace('Rs.', '').strip())
+            formatted_amount = format_indian_number(amount_num)
+            investment_summary_parts.append(f"Rs.{formatted_amount} (Lumpsum)")
+        except:
+            investment_summary_parts.append(f"Rs.{investment_amount} (Lumpsum)")
+
+    if sip_amount.strip():
+        try:
+            sip_num = float(sip_amount.replace(',', '').replace('Rs.', '').replace('Rs.', '').strip())
+            formatted_sip = format_indian_number(sip_num)
+            investment_summary_parts.append(f"Rs.{formatted_sip} (SIP)")
+        except:
+            investment_summary_parts.append(f"Rs.{sip_amount} (SIP)")
+
+    if investment_summary_parts:
+        elements.append(Paragraph(f"<b>Investment Amount:</b> {', '.join(investment_summary_parts)}", client_style))
+
+    elements.append(Spacer(1, 10))
+
+    if strategy_note is not None:
+        elements.append(Paragraph("<b>Investment Strategy</b>", styles['Heading3']))
+
+        strategy_lines = strategy_note.strip().split("• ")
+        for i, line in enumerate(strategy_lines):
+            if line.strip():
+                if i == 0 and not line.strip().startswith("•"):
+                    elements.append(Paragraph(line.strip(), styles['Normal']))
+                else:
+                    elements.append(Paragraph(f"• {line.strip()}", bullet_style))
+        elements.append(Spacer(1, 10))
+
+    tables = []
+    if lumpsum_alloc is not None and not lumpsum_alloc.empty and not lumpsum_alloc.dropna(how='all').empty:
+        tables.append(("Lumpsum Allocation", lumpsum_alloc))
+    if sip_alloc is not None and not sip_alloc.empty and not sip_alloc.dropna(how='all').empty:
+        tables.append(("SIP Allocation", sip_alloc))
+    if fund_perf is not None and not fund_perf.empty and not fund_perf.dropna(how='all').empty:
+        tables.append(("Fund Performance", fund_perf))
+    if initial_alloc is not None and not initial_alloc.empty and not initial_alloc.dropna(how='all').empty:
+        tables.append(("Initial Investment Allocation", initial_alloc))
+    if final_alloc is not None and not final_alloc.empty and not final_alloc.dropna(how='all').empty:
+        tables.append(("Final Portfolio Allocation", final_alloc))
+    if stp_schedule is not None and not stp_schedule.empty:
+        tables.append(("STP Transfer Schedule", stp_schedule_table(stp_schedule)))
+
+    for title, df in tables:
+        if not df.empty and not df.dropna(how='all').empty:
+            table_heading = Paragraph(f"<b>{title}</b>", styles['Heading4'])
+
+            if title == "Fund Performance":
+                table_content = fund_performance_table(df)
+            else:
+                table_content = dataframe_to_table(df)
+
+            table_elements = [
+                table_heading,
+                Spacer(1, 10),
+                table_content
+            ]
+            note_text = ""
+            if title == "Initial Investment Allocation":
+                note_text = "*First time transaction to be done for switching purpose from Debt funds to Equity Funds"
+            elif title == "Final Portfolio Allocation":
+                note_text = "*Final Portfolio Illustration after switching the funds from Debt to Equity."
+            elif title == "STP Transfer Schedule":
+                note_text = "*Balances after each transfer are projections at assumed category returns, not guaranteed values."
+
+            if note_text:
+                note_paragraph_style = ParagraphStyle('note_paragraph_style', parent=note_style, leftIndent=0, firstLineIndent=0, spaceBefore=0, leading=10, fontSize=7)
+                note_paragraph = Paragraph(note_text, note_paragraph_style)
+                table_elements.append(note_paragraph)
+
+            elements.append(KeepTogether(table_elements))
+            elements.append(Spacer(1, 10))
+
+    if rolling_returns is not None and not rolling_returns['summary'].empty:
+        elements.append(KeepTogether([
+            Paragraph("<b>Rolling Returns</b>", styles['Heading4']),
+            Spacer(1, 10),
+            dataframe_to_table(rolling_returns_table(rolling_returns['summary'])),
+            Paragraph("*Range of annualized returns over every holding period of each length in the scheme's NAV history. "
+                      "Past returns do not indicate future performance.", note_style),
+        ]))
+        if not rolling_returns['series'].empty:
+            elements.append(rolling_returns_chart(rolling_returns['series'], rolling_returns['window']))
+        elements.append(Spacer(1, 10))
+
+    if factsheet_links.strip():
+        elements.append(Paragraph("<b>Fund Factsheets</b>", styles['Heading4']))
+        for line in factsheet_links.strip().splitlines():
+            if "|" in line:
+                label, url = line.split("|", 1)
+                elements.append(
+                    Paragraph(
+                        f"{label.strip()}: <u><link href='{url.strip()}' color='blue'>{url.strip()}</link></u>",
+                        link_container_style 
+                    )
+                )
+            else:
+                elements.append(Paragraph(line.strip(), styles['Normal']))
+
+    elements.append(PageBreak())
+
+    disclaimer_heading_style = ParagraphStyle(
+        name='DisclaimerHeading', 
+        fontSize=16, 
+        leading=24, 
+        alignment=1,
+        spaceAfter=25, 
+        fontName='Helvetica-Bold'
+    )
+
+    elements.append(Spacer(1, 30))
+    elements.append(Paragraph("DISCLAIMER", disclaimer_heading_style))
+
+    disclaimer_style = ParagraphStyle(
+        name='DisclaimerStyle', 
+        parent=styles['Normal'], 
+        fontSize=9, 
+        leading=11,
+        fontName=UNICODE_FONT
+    )
+
+    disclaimer_paragraphs = [p.strip() for p in DISCLAIMER_TEXT.split('.') if p.strip()]
+    for paragraph in disclaimer_paragraphs:
+        if paragraph:
+            elements.append(Paragraph(paragraph + ".", disclaimer_style))
+            elements.append(Spacer(1, 3))
+
+    doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=cm, leftMargin=cm, topMargin=5*cm, bottomMargin=3*cm)
+    with span("pdf.layout"):
+        doc.build(elements, onFirstPage=header_footer_with_logos, onLaterPages=header_footer_with_logos)
+
+    buffer.seek(0)
+    return buffer
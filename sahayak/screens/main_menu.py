@@ -0,0 +1,90 @@
+import streamlit as st
+
+from sahayak.ui import show_header
+
+# --- Main App Selection Screen ---
+def show_main_screen():
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+    
+    show_header()
+    
+    st.markdown("""
+        <div class="app-header">
+            <h1 class="app-title">SAHAYAK ASSOCIATES</h1>
+            <p class="app-subtitle">Professional Financial Planning Tools</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown('<div class="services-grid">', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2, gap="large")
+    
+    with col1:
+        st.markdown("""
+        <div class="service-card">
+            <h3 class="service-title">Investment Planning</h3>
+            <p class="service-description">Generate professional investment sheets with portfolio allocations and fund performance analysis.</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        if st.button("Investment Sheet Generator", key="investment_btn"):
+            st.session_state.app_mode = "investment"
+            st.rerun()
+        
+        st.markdown("""
+        <div class="service-card">
+            <h3 class="service-title">Goal Planning</h3>
+            <p class="service-description">Comprehensive financial goal planning with SIP calculations and progress tracking.</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        if st.button("Financial Goal Planner", key="goal_btn"):
+            st.session_state.app_mode = "goal_planner"
+            st.session_state.calculations_done = False
+            st.rerun()
+        
+        # NEW MODULE - Add this card
+        st.markdown("""
+        <div class="service-card">
+            <h3 class="service-title">Investment Decision Analysis</h3>
+            <p class="service-description">Real-time comparison across asset classes (MF, Real Estate, Gold, FD) to make informed investment decisions.</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        if st.button("Multi-Asset Decision Analyzer", key="decision_btn"):
+            st.session_state.app_mode = "decision_analyzer"
+            st.rerun()
+
+    with col2:
+        st.markdown("""
+        <div class="service-card">
+            <h3 class="service-title">Meeting Documentation</h3>
+            <p class="service-description">Create detailed meeting minutes with client information and investment details.</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        if st.button("Minutes of Meeting Generator", key="mom_btn"):
+            st.session_state.app_mode = "mom"
+            st.rerun()
+        
+        st.markdown("""
+        <div class="service-card">
+            <h3 class="service-title">Meeting Preparation</h3>
+            <p class="service-description">Customizable pre-meeting checklists to ensure comprehensive client discussions.</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        if st.button("Meeting Checklist Generator", key="checklist_btn"):
+            st.session_state.app_mode = "checklist"
+            st.rerun()
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="app-footer">
+        <p class="footer-text"><strong>Sahayak Associates</strong> - AMFI Registered Mutual Fund Distributor</p>
+        <p class="footer-text">Professional financial planning and investment advisory services</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,261 @@
+from io import BytesIO
+from datetime import datetime
+
+import streamlit as st
+from reportlab.lib.pagesizes import A4
+from reportlab.lib import colors
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.units import cm
+
+from sahayak.pdf_common import header_footer_with_logos
+from sahayak.metrics import measured_report
+from sahayak.tracing import span, traced
+from sahayak.resources import get_stylesheet
+from sahayak.ui import show_header, show_back_button
+
+# Default checklist items
+DEFAULT_CHECKLIST_ITEMS = [
+    "Non NJ Portfolio Review",
+    "Change in Financial Goals- Time & Amount",
+    "Requirement of Funds in next 1,3,5 Years",
+    "Any additional goals",
+    "Performance against goals (tracker)",
+    "Review of Asset Allocation- Current vs Proposed vs Original",
+    "Review of Category Allocation- Current vs Proposed vs Original",
+    "Changes Proposed",
+    "Reason for change",
+    "SIP Review",
+    "Investment Plan",
+    "Additional Family Account Opening",
+    "Reference",
+    "Insurance Review - Term/ Health / General",
+    "Will Writing / Estate Planning",
+    "Testimonial/ Wallet share",
+    "Risk profile",
+    "Money belief",
+    "Collection of docs",
+    "Anniversary",
+    "Need an iPad",
+    "Taking gifts along",
+    "Carry all necessary forms",
+    "Taking valuation report, SIP, Portfolio review report of existing portfolio",
+    "Brochures & file ready"
+]
+
+# --- 4. Meeting Checklist Generator ---
+def show_meeting_checklist():
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+
+    show_header()
+    show_back_button("back_checklist")
+
+    st.markdown("""
+    <div class="goal-section">
+        <h2>Meeting Checklist Generator</h2>
+        <p>Customizable pre-meeting checklists to ensure comprehensive client discussions</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    tab1, tab2, tab3 = st.tabs(["📋 Meeting Info", "✅ Checklist Items", "📄 Generate PDF"])
+    
+    with tab1:
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            client_name_checklist = st.text_input("Client Name", placeholder="Enter client name")
+            meeting_date_checklist = st.text_input("Meeting Date", placeholder="DD-MM-YYYY")
+            
+        with col2:
+            meeting_time_checklist = st.text_input("Meeting Time", placeholder="HH:MM AM/PM")
+            meeting_location_checklist = st.text_input("Meeting Location", placeholder="Enter location")
+    
+    with tab2:
+        # Initialize session state
+        if 'selected_checklist_items' not in st.session_state:
+            st.session_state.selected_checklist_items = []
+        
+        st.markdown("**Select Checklist Items**")
+        
+        # Quick select buttons
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            if st.button("Select All", use_container_width=True):
+                st.session_state.selected_checklist_items = list(DEFAULT_CHECKLIST_ITEMS)
+                st.rerun()
+        
+        with col2:
+            if st.button("Clear All", use_container_width=True):
+                st.session_state.selected_checklist_items = []
+                st.rerun()
+        
+        with col3:
+            if st.button("Select Top 10", use_container_width=True):
+                st.session_state.selected_checklist_items = DEFAULT_CHECKLIST_ITEMS[:10]
+                st.rerun()
+        
+        st.markdown("---")
+        
+        # Display checkboxes for each item
+        for i, item in enumerate(DEFAULT_CHECKLIST_ITEMS):
+            is_selected = item in st.session_state.selected_checklist_items
+            
+            if st.checkbox(item, value=is_selected, key=f"checkbox_{i}"):
+                if item not in st.session_state.selected_checklist_items:
+                    st.session_state.selected_checklist_items.append(item)
+            else:
+                if item in st.session_state.selected_checklist_items:
+                    st.session_state.selected_checklist_items.remove(item)
+        
+        # Custom checklist items
+        st.markdown("**Add Custom Items**")
+        custom_item = st.text_input("Add custom checklist item", placeholder="Enter custom item")
+        if st.button("Add Custom Item") and custom_item:
+            if custom_item not in st.session_state.selected_checklist_items:
+                st.session_state.selected_checklist_items.append(custom_item)
+                st.success(f"Added: {custom_item}")
+                st.rerun()
+        
+        # Show selected items count
+        st.info(f"Selected {len(st.session_state.selected_checklist_items)} items")
+    
+    with tab3:
+        st.markdown("**PDF Generation**")
+        
+        if not client_name_checklist or not client_name_checklist.strip():
+            st.warning("Please enter client name in the Meeting Info tab to generate PDF.")
+        elif not st.session_state.selected_checklist_items:
+            st.warning("Please select at least one checklist item.")
+        else:
+            st.success(f"Ready to generate checklist for: **{client_name_checklist}**")
+            st.info(f"Checklist contains **{len(st.session_state.selected_checklist_items)}** items")
+            
+            # Preview selected items
+            with st.expander("Preview Selected Items"):
+                for idx, item in enumerate(st.session_state.selected_checklist_items, 1):
+                    st.write(f"{idx}. {item}")
+            
+            col1, col2, col3 = st.columns([1, 2, 1])
+            with col2:
+                if st.button("📄 Download Meeting Checklist PDF", type="primary", use_container_width=True):
+                    with st.spinner("Generating Meeting Checklist..."):
+                        pdf = generate_meeting_checklist_pdf(
+                            client_name_checklist, meeting_date_checklist, meeting_time_checklist,
+                            meeting_location_checklist, st.session_state.selected_checklist_items
+                        )
+                        st.success("Meeting Checklist PDF generated successfully!")
+                        st.download_button(
+                            label="Download Meeting Checklist PDF",
+                            data=pdf,
+                            file_name=f"Meeting_Checklist_{client_name_checklist.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.pdf",
+                            mime="application/pdf"
+                        )
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+@measured_report("checklist")
+@traced("pdf.checklist", is_request=True)
+def generate_meeting_checklist_pdf(client_name_checklist, meeting_date_checklist, meeting_time_checklist,
+                                   meeting_location_checklist, checklist_items):
+    buffer = BytesIO()
+    styles = get_stylesheet()
+
+    # Enhanced professional styles
+    title_style = ParagraphStyle(
+        name='Title', 
+        fontSize=20, 
+        leading=24, 
+        alignment=1, 
+        spaceAfter=25, 
+        fontName='Helvetica-Bold',
+        textColor=colors.black
+    )
+
+    client_style = ParagraphStyle(
+        name='Client', 
+        parent=styles['Normal'], 
+        fontSize=12, 
+        leading=16, 
+        spaceAfter=10, 
+        fontName='Helvetica',
+        textColor=colors.black
+    )
+
+    heading_style = ParagraphStyle(
+        name='Heading', 
+        fontSize=16, 
+        leading=20, 
+        spaceAfter=15, 
+        spaceBefore=20,
+        fontName='Helvetica-Bold',
+        textColor=colors.black
+    )
+
+    checklist_style = ParagraphStyle(
+        name='Checklist', 
+        parent=styles['Normal'], 
+        fontSize=12, 
+        leading=18,  # Increased line spacing
+        leftIndent=15, 
+        spaceAfter=12,  # More space between items
+        fontName='Helvetica',
+        textColor=colors.black
+    )
+
+    elements = []
+
+    # Header with more space
+    elements.append(Paragraph("PRE-MEETING CHECKLIST", title_style))
+    elements.append(Spacer(1, 30))
+
+    # Meeting details with better formatting
+    elements.append(Paragraph("Meeting Information", heading_style))
+    elements.append(Paragraph(f"<b>Client Name:</b> {client_name_checklist or '_' * 30}", client_style))
+    elements.append(Paragraph(f"<b>Meeting Date:</b> {meeting_date_checklist or '_' * 20}", client_style))
+    elements.append(Paragraph(f"<b>Meeting Time:</b> {meeting_time_checklist or '_' * 20}", client_style))
+    elements.append(Paragraph(f"<b>Location:</b> {meeting_location_checklist or '_' * 30}", client_style))
+    elements.append(Spacer(1, 25))
+
+    # Checklist items with better spacing
+    elements.append(Paragraph("Checklist Items", heading_style))
+    elements.append(Spacer(1, 15))
+
+    for item in checklist_items:
+        # REMOVED numbers, just checkbox and item
+        checkbox_text = f"• {item}"
+        elements.append(Paragraph(checkbox_text, checklist_style))
+
+    # Add page break before Additional Notes
+    elements.append(PageBreak())
+
+    # Additional Notes section (FIXED VERSION)
+    elements.append(Spacer(1, 30))  # Space from top
+    elements.append(Paragraph("Additional Notes:", heading_style))
+    elements.append(Spacer(1, 20))
+
+    # Create proper note lines (FIXED)
+    note_style = ParagraphStyle(
+        name='Notes', 
+        parent=styles['Normal'], 
+        fontSize=12, 
+        leading=20,  # Reduced line height
+        fontName='Helvetica',
+        textColor=colors.black
+    )
+
+    # FIXED: Create continuous lines that fit on one page
+    for _ in range(8):
+        elements.append(Paragraph("_" * 80, styles['Normal']))
+        elements.append(Spacer(1, 12))
+
+    # Build PDF with increased margins for better spacing
+    doc = SimpleDocTemplate(buffer, pagesize=A4, 
+                           rightMargin=2.5*cm,   # Increased margins
+                           leftMargin=2.5*cm, 
+                           topMargin=6*cm,       # More space from header
+                           bottomMargin=4*cm)    # More space from footer
+    with span("pdf.layout"):
+        doc.build(elements, onFirstPage=header_footer_with_logos, onLaterPages=header_footer_with_logos)
+
+    buffer.seek(0)
+    return buffer
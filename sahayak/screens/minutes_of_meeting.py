@@ -0,0 +1,374 @@
+from io import BytesIO
+from datetime import datetime
+
+import streamlit as st
+import pandas as pd
+from reportlab.lib.pagesizes import A4
+from reportlab.lib import colors
+from reportlab.platypus import Table, TableStyle, SimpleDocTemplate, Paragraph, Spacer, PageBreak, KeepTogether
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.colors import HexColor
+from reportlab.lib.units import cm
+
+from sahayak.utils import format_indian_number
+from sahayak.pdf_common import UNICODE_FONT, DISCLAIMER_TEXT, header_footer_with_logos
+from sahayak.metrics import measured_report
+from sahayak.tracing import span, traced
+from sahayak.resources import get_stylesheet, default_table
+from sahayak.ui import show_header, show_back_button, scheme_name_helper
+
+# --- 3. Minutes of Meeting Generator ---
+def show_minutes_of_meeting():
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+    
+    show_header()
+    show_back_button("back_mom")
+    
+    st.markdown("""
+    <div class="goal-section">
+        <h2>Minutes of Meeting</h2>
+        <p>Create detailed meeting minutes with client information and investment details</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Meeting Title
+    meeting_title = st.text_input("Meeting Title", value="Portfolio Review of")
+    
+    # Meeting Details
+    st.markdown('<div class="info-card"><h3>📅 Meeting Information</h3></div>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        meeting_organizer = st.text_input("Meeting Organizer", value="Mr. Puneet Kohli")
+        meeting_date_time = st.text_input("Meeting Date & Time")
+        
+    with col2:
+        meeting_location = st.text_input("Meeting Location")
+        minutes_drafted_date = st.text_input("Minutes Drafted Date")
+    
+    # Investment Profile
+    st.markdown('<div class="info-card"><h3>💼 Investment Profile</h3></div>', unsafe_allow_html=True)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        investment_horizon = st.selectbox("Investment Horizon", ["Short Term", "Medium Term", "Long Term"])
+    with col2:
+        risk_profile = st.selectbox("Risk Profile", ["Conservative", "Moderate", "Aggressive"])
+    with col3:
+        return_expectation = st.text_input("Return Expectation", value="8% - 10% CAGR")
+    with col4:
+        awareness_level = st.selectbox("Awareness level", ["LOW", "MEDIUM", "HIGH"])
+    
+    # Brief Description/Agenda
+    st.markdown('<div class="info-card"><h3>📋 Brief Description/Agenda</h3></div>', unsafe_allow_html=True)
+    
+    agenda_items = st.text_area("Meeting Agenda", 
+                               value="- Review of Asset Allocation\n- Fund Review", 
+                               height=100)
+    
+    # Asset Allocation Review
+    st.markdown('<div class="calculation-card"><h3>🔍 Review of Asset Allocation</h3></div>', unsafe_allow_html=True)
+    
+    investor_name = st.text_input("Investor Name")
+    
+    # Asset Allocation Table
+    st.markdown("**Current Asset Allocation**")
+    asset_df = default_table('mom_asset_allocation')
+    edited_allocation = st.data_editor(
+        asset_df,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "Percentage": st.column_config.NumberColumn("Percentage (%)", min_value=0.0, max_value=100.0, step=0.1, format="%.2f"),
+            "Amount (Rs.)": st.column_config.NumberColumn("Amount (Rs.)", min_value=0, step=1000, format="%.2f")
+        }
+    )
+    
+    # Further Action
+    st.markdown('<div class="info-card"><h3>⚡ Further Action:</h3><p>Detail of Investment is as mention below in chart:</p></div>', unsafe_allow_html=True)
+    
+    # Investment Details Table
+    investment_df = st.session_state.get('mom_investment_table', default_table('mom_investment'))
+    edited_investment = st.data_editor(
+        investment_df,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "Sr. No.": st.column_config.NumberColumn("Sr. No.", disabled=True),
+            "Scheme Type": st.column_config.TextColumn("Scheme Type", disabled=True),
+            "Scheme Name": st.column_config.TextColumn("Scheme Name"),
+            "Allocation (%)": st.column_config.NumberColumn("Allocation (%)", min_value=0.0, max_value=100.0, step=0.1, format="%.2f"),
+            "Amount (Rs.)": st.column_config.NumberColumn("Amount (Rs.)", min_value=0, step=1000, format="%.2f")
+        }
+    )
+    
+    fixed = scheme_name_helper(edited_investment, "mom_investment")
+    if fixed is not None:
+        st.session_state['mom_investment_table'] = fixed
+        st.rerun()
+
+    # Add Total row
+    total_allocation = edited_investment['Allocation (%)'].sum()
+    total_amount = edited_investment['Amount (Rs.)'].sum()
+    
+    st.markdown(f"**Total: {total_allocation:.2f}% | Rs.{format_indian_number(total_amount)}**")
+    
+    # Additional Notes
+    st.markdown('<div class="info-card"><h3>📝 Additional Notes</h3></div>', unsafe_allow_html=True)
+    
+    additional_notes = st.text_area("Additional Discussion Points", height=100)
+    
+    # Generate PDF Button
+    st.markdown('<div class="calculate-button">', unsafe_allow_html=True)
+    if st.button("📄 Generate Minutes of Meeting PDF"):
+        if investor_name:
+            with st.spinner("Generating Minutes of Meeting..."):
+                pdf = generate_mom_pdf(
+                    investor_name, meeting_organizer, meeting_date_time, meeting_location, minutes_drafted_date,
+                    investment_horizon, risk_profile, return_expectation, awareness_level,
+                    agenda_items, edited_allocation, edited_investment, additional_notes
+                )
+                st.success("Minutes of Meeting PDF generated successfully!")
+                st.download_button(
+                    label="Download Minutes of Meeting PDF",
+                    data=pdf,
+                    file_name=f"MOM_{investor_name.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.pdf",
+                    mime="application/pdf"
+                )
+        else:
+            st.error("Please enter Investor Name")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+@measured_report("mom")
+@traced("pdf.mom", is_request=True)
+def generate_mom_pdf(investor_name, meeting_organizer, meeting_date_time, meeting_location, minutes_drafted_date,
+                     investment_horizon, risk_profile, return_expectation, awareness_level,
+                     agenda_items, edited_allocation, edited_investment, additional_notes=""):
+    buffer = BytesIO()
+    styles = get_stylesheet()
+
+    heading_style = ParagraphStyle(
+        name='MoMHeading', 
+        fontSize=18, 
+        leading=22, 
+        alignment=1, 
+        spaceAfter=20, 
+        fontName='Helvetica-Bold'
+    )
+
+    info_table_style = ParagraphStyle(
+        name='InfoTable', 
+        parent=styles['Normal'], 
+        fontSize=10, 
+        leading=14,
+        fontName=UNICODE_FONT
+    )
+
+    section_heading_style = ParagraphStyle(
+        name='SectionHeading', 
+        fontSize=12, 
+        leading=16, 
+        spaceAfter=12, 
+        spaceBefore=8,
+        fontName='Helvetica-Bold'
+    )
+
+    normal_style = ParagraphStyle(
+        name='MoMNormal', 
+        parent=styles['Normal'], 
+        fontSize=10, 
+        leading=14,
+        fontName=UNICODE_FONT
+    )
+
+    centered_profile_style = ParagraphStyle(
+        name='CenteredProfile',
+        parent=styles['Normal'],
+        fontSize=11,
+        leading=16,
+        alignment=1,
+        spaceAfter=20,
+        spaceBefore=10,
+        fontName=UNICODE_FONT
+    )
+
+    elements = []
+
+    elements.append(Paragraph("Minutes of Meeting", heading_style))
+    elements.append(Spacer(1, 15))
+
+    meeting_info_data = [
+        [Paragraph("<b>Meeting Title</b>", info_table_style), Paragraph(f"<b>Portfolio Review of {investor_name}</b>", info_table_style)],
+        [Paragraph("<b>Meeting Organizer</b>", info_table_style), Paragraph(f"<b>{meeting_organizer}</b>", info_table_style)],
+        [Paragraph("<b>Meeting Date & Time</b>", info_table_style), Paragraph(f"<b>{meeting_date_time}</b>", info_table_style)],
+        [Paragraph("<b>Meeting Location</b>", info_table_style), Paragraph(f"<b>{meeting_location}</b>", info_table_style)],
+        [Paragraph("<b>Minutes Drafted Date</b>", info_table_style), Paragraph(f"<b>{minutes_drafted_date}</b>", info_table_style)]
+    ]
+
+    meeting_info_table = Table(meeting_info_data, colWidths=[7.5*cm, 8.5*cm])
+    meeting_info_table.setStyle(TableStyle([
+        ('GRID', (0,0), (-1,-1), 1.5, colors.black),
+        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+        ('LEFTPADDING', (0,0), (-1,-1), 10),
+        ('RIGHTPADDING', (0,0), (-1,-1), 10),
+        ('TOPPADDING', (0,0), (-1,-1), 10),
+        ('BOTTOMPADDING', (0,0), (-1,-1), 10),
+        ('BACKGROUND', (0,0), (0,-1), HexColor('#E6F3F8')),
+    ]))
+
+    elements.append(meeting_info_table)
+    elements.append(Spacer(1, 20))
+
+    profile_text = f"<b>Investment Horizon:</b> {investment_horizon} &nbsp;&nbsp;&nbsp;&nbsp; <b>Risk Profile:</b> {risk_profile}<br/><br/><b>Return Expectation:</b> {return_expectation} &nbsp;&nbsp;&nbsp;&nbsp; <b>Awareness level:</b> {awareness_level}"
+    elements.append(Paragraph(profile_text, centered_profile_style))
+
+    elements.append(Paragraph("<b>Brief Description/Agenda</b>", section_heading_style))
+
+    agenda_table_data = [[Paragraph(agenda_items.replace('\n', '<br/>'), normal_style)]]
+    agenda_table = Table(agenda_table_data, colWidths=[16*cm])
+    agenda_table.setStyle(TableStyle([
+        ('GRID', (0,0), (-1,-1), 1, colors.black),
+        ('VALIGN', (0,0), (-1,-1), 'TOP'),
+        ('LEFTPADDING', (0,0), (-1,-1), 10),
+        ('RIGHTPADDING', (0,0), (-1,-1), 10),
+        ('TOPPADDING', (0,0), (-1,-1), 10),
+        ('BOTTOMPADDING', (0,0), (-1,-1), 10),
+    ]))
+    elements.append(agenda_table)
+    elements.append(Spacer(1, 20))
+
+    elements.append(Paragraph("<b>A. Review of Asset Allocation</b>", section_heading_style))
+
+    asset_alloc_data = [
+        [Paragraph("<b>Investor Name</b>", info_table_style), Paragraph("<b>Current Asset Allocation</b>", info_table_style), "", ""],
+        ["", Paragraph("<b>Equity</b>", info_table_style), Paragraph("<b>Debt</b>", info_table_style), Paragraph("<b>Total</b>", info_table_style)],
+        [Paragraph(f"<b>{investor_name}</b>", info_table_style), Paragraph(f"<b>{edited_allocation.at[0, 'Percentage']:.2f}%</b>", info_table_style), Paragraph(f"<b>{edited_allocation.at[1, 'Percentage']:.2f}%</b>", info_table_style), Paragraph("<b>100%</b>", info_table_style)]
+    ]
+
+    asset_alloc_table = Table(asset_alloc_data, colWidths=[4*cm, 4*cm, 4*cm, 4*cm])
+    asset_alloc_table.setStyle(TableStyle([
+        ('GRID', (0,0), (-1,-1), 1, colors.black),
+        ('SPAN', (1,0), (3,0)),
+        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+        ('ALIGN', (0,0), (-1,-1), 'CENTER'),
+        ('LEFTPADDING', (0,0), (-1,-1), 8),
+        ('RIGHTPADDING', (0,0), (-1,-1), 8),
+        ('TOPPADDING', (0,0), (-1,-1), 8),
+        ('BOTTOMPADDING', (0,0), (-1,-1), 8),
+        ('BACKGROUND', (0,0), (-1,1), HexColor('#E6F3F8')),
+    ]))
+    elements.append(asset_alloc_table)
+    elements.append(Spacer(1, 20))
+
+    if not edited_investment.empty and not edited_investment.dropna(how='all').empty:
+        total_amount = edited_investment['Amount (Rs.)'].sum()
+
+        investment_table_data = []
+        investment_table_data.append([
+            Paragraph("<b>Sr. No.</b>", info_table_style),
+            Paragraph("<b>Scheme Type</b>", info_table_style),
+            Paragraph("<b>Scheme Name</b>", info_table_style),
+            Paragraph("<b>Allocation (%)</b>", info_table_style),
+            Paragraph("<b>Amount (Rs.)</b>", info_table_style)
+        ])
+
+        for index, row in edited_investment.iterrows():
+            if not pd.isna(row["Scheme Type"]) and row["Scheme Type"].strip():
+                amount_formatted = format_indian_number(row['Amount (Rs.)']) if pd.notna(row['Amount (Rs.)']) else "0.00"
+
+                investment_table_data.append([
+                    Paragraph(f"<b>{row['Sr. No.']}</b>", info_table_style),
+                    Paragraph(f"<b>{row['Scheme Type']}</b>", info_table_style),
+                    Paragraph(str(row['Scheme Name']), info_table_style),
+                    Paragraph(f"{row['Allocation (%)']:.2f}" if pd.notna(row['Allocation (%)']) else "0.00", info_table_style),
+                    Paragraph(f"Rs.{amount_formatted}", info_table_style)
+                ])
+
+        total_formatted = format_indian_number(total_amount)
+        investment_table_data.append([
+            Paragraph("<b>Total</b>", info_table_style),
+            "", "",
+            Paragraph("<b>100.00</b>", info_table_style),
+            Paragraph(f"<b>Rs.{total_formatted}</b>", info_table_style)
+        ])
+
+        investment_table = Table(investment_table_data, colWidths=[1.5*cm, 2.5*cm, 7*cm, 2.5*cm, 2.5*cm])
+        investment_table.setStyle(TableStyle([
+            ('GRID', (0,0), (-1,-1), 1, colors.black),
+            ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+            ('ALIGN', (0,0), (-1,0), 'CENTER'),
+            ('ALIGN', (3,1), (4,-1), 'RIGHT'),
+            ('LEFTPADDING', (0,0), (-1,-1), 6),
+            ('RIGHTPADDING', (0,0), (-1,-1), 6),
+            ('TOPPADDING', (0,0), (-1,-1), 8),
+            ('BOTTOMPADDING', (0,0), (-1,-1), 8),
+            ('BACKGROUND', (0,0), (-1,0), HexColor('#E6F3F8')),
+            ('BACKGROUND', (0,-1), (-1,-1), HexColor('#E6F3F8')),
+            ('FONTNAME', (0,0), (-1,-1), 'Helvetica'),
+            ('FONTSIZE', (0,0), (-1,-1), 9),
+        ]))
+
+        investment_section = KeepTogether([
+            Paragraph("<b>Further Action:</b>", normal_style),
+            Paragraph("Detail of Investment is as mention below in chart:", normal_style),
+            Spacer(1, 10),
+            investment_table
+        ])
+
+        elements.append(investment_section)
+        elements.append(Spacer(1, 20))
+
+    if additional_notes.strip():
+        elements.append(Paragraph("<b>Additional Notes:</b>", section_heading_style))
+        elements.append(Paragraph(additional_notes.replace('\n', '<br/>'), normal_style))
+        elements.append(Spacer(1, 20))
+
+    elements.append(PageBreak())
+
+    elements.append(Spacer(1, 50))
+    elements.append(Paragraph("Please revert for any clarifications. Kindly approve the same so that we can initiate the transactions for your authorization.", normal_style))
+    elements.append(Spacer(1, 20))
+    elements.append(Paragraph("<b>Happy Investing!</b>", normal_style))
+    elements.append(Spacer(1, 20))
+    elements.append(Paragraph("<b>With Best Regards and Good Wishes,</b>", normal_style))
+    elements.append(Paragraph("<b>For and on behalf of</b>", normal_style))
+    elements.append(Paragraph("<b>Sahayak Associates,</b>", normal_style))
+    elements.append(Paragraph("<b>Sandeep Sahni/Puneet Kohli</b>", normal_style))
+    elements.append(Paragraph("<b>91-9872804694/91-9872804694</b>", normal_style))
+
+    elements.append(PageBreak())
+
+    disclaimer_heading_style = ParagraphStyle(
+        name='DisclaimerHeading', 
+        fontSize=16, 
+        leading=20, 
+        alignment=1,
+        spaceAfter=25, 
+        fontName='Helvetica-Bold'
+    )
+
+    elements.append(Spacer(1, 30))
+    elements.append(Paragraph("DISCLAIMER", disclaimer_heading_style))
+
+    disclaimer_style = ParagraphStyle(
+        name='DisclaimerText', 
+        parent=styles['Normal'], 
+        fontSize=9, 
+        leading=12,
+        fontName=UNICODE_FONT
+    )
+
+    disclaimer_paragraphs = [p.strip() for p in DISCLAIMER_TEXT.split('.') if p.strip()]
+    for paragraph in disclaimer_paragraphs:
+        if paragraph:
+            elements.append(Paragraph(paragraph + ".", disclaimer_style))
+            elements.append(Spacer(1, 6))
+
+    doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=cm, leftMargin=cm, topMargin=5*cm, bottomMargin=3*cm)
+    with span("pdf.layout"):
+        doc.build(elements, onFirstPage=header_footer_with_logos, onLaterPages=header_footer_with_logos)
+
+    buffer.seek(0)
+    return buffer
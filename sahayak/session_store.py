@@ -0,0 +1,365 @@
+import functools
+import logging
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from streamlit.runtime import Runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from sahayak import metrics
+
+logger = logging.getLogger("sahayak.session_store")
+
+# --- Compact tables ---
+class CompactTable:
+    """Read-only column store for an edited table.
+
+    Numeric columns are kept as numpy arrays of the narrowest dtype that
+    holds them exactly, text columns as integer
+    codes into their distinct values and date columns as datetime64[D], so a
+    table costs a few bytes per cell instead of a Python object per cell.
+    to_frame() rebuilds a DataFrame with the original dtypes.
+    """
+
+    def __init__(self, columns, index):
+        # columns: list of (name, kind, dtype, data, values)
+        self.columns = columns
+        self.index = index
+
+    @classmethod
+    def from_frame(cls, df):
+        columns = []
+        for name in df.columns:
+            series = df[name]
+            if series.dtype.kind in 'biuf':
+                data = _narrow(series.to_numpy(copy=True))
+                columns.append((name, 'num', series.dtype, _frozen(data), None))
+            elif _is_date_column(series):
+                data = series.to_numpy(dtype='datetime64[D]', na_value=np.datetime64('NaT'))
+                columns.append((name, 'date', series.dtype, _frozen(data), None))
+            elif _is_text_column(series):
+                codes, values = pd.factorize(series, use_na_sentinel=True)
+                codes = codes.astype(np.int8 if len(values) < 127 else np.int32)
+                columns.append((name, 'text', series.dtype, _frozen(codes), np.asarray(values, dtype=object)))
+            else:
+                columns.append((name, 'object', series.dtype, _frozen(series.to_numpy(copy=True)), None))
+
+        index = df.index
+        if not isinstance(index, pd.RangeIndex):
+            index = _frozen(index.to_numpy(copy=True))
+        return cls(columns, index)
+
+    def to_frame(self):
+        data = {}
+        for name, kind, dtype, values, categories in self.columns:
+            if kind == 'date':
+                values = values.astype(object)
+            elif kind == 'text':
+                decoded = np.full(len(values), None, dtype=object)
+                present = values >= 0
+                decoded[present] = categories[values[present]]
+                values = decoded
+            data[name] = pd.Series(values, dtype=dtype, copy=True)
+        index = self.index if isinstance(self.index, pd.RangeIndex) else pd.Index(self.index)
+        df = pd.DataFrame(data)
+        df.index = index
+        return df
+
+    def equals(self, other):
+        if not isinstance(other, CompactTable) or not _same_index(self.index, other.index):
+            return False
+        if [column[:3] for column in self.columns] != [column[:3] for column in other.columns]:
+            return False
+        for (_, kind, _, values, categories), (_, _, _, other_values, other_categories) in zip(self.columns, other.columns):
+            if kind == 'text' and list(categories) != list(other_categories):
+                return False
+            if kind == 'object':
+                if list(values) != list(other_values):
+                    return False
+            elif not np.array_equal(values, other_values, equal_nan=values.dtype.kind in 'fmM'):
+                return False
+        return True
+
+    @property
+    def empty(self):
+        return len(self) == 0 or not self.columns
+
+    @property
+    def nbytes(self):
+        total = sys.getsizeof(self)
+        for name, kind, dtype, values, categories in self.columns:
+            total += values.nbytes
+            if kind == 'object':
+                total += sum(sys.getsizeof(v) for v in values)
+            if categories is not None:
+                total += categories.nbytes + sum(sys.getsizeof(v) for v in categories)
+        if not isinstance(self.index, pd.RangeIndex):
+            total += self.index.nbytes
+        return total
+
+    def __len__(self):
+        return len(self.index)
+
+def _same_index(a, b):
+    if isinstance(a, pd.RangeIndex) or isinstance(b, pd.RangeIndex):
+        return isinstance(a, pd.RangeIndex) and isinstance(b, pd.RangeIndex) and a.equals(b)
+    return np.array_equal(a, b)
+
+def _narrow(data):
+    """data in the smallest dtype that represents every value exactly"""
+    if data.size == 0:
+        return data
+    if data.dtype.kind in 'iu':
+        for dtype in (np.int8, np.int16, np.int32):
+            info = np.iinfo(dtype)
+            if info.min <= data.min() and data.max() <= info.max:
+                return data.astype(dtype)
+    elif data.dtype == np.float64:
+        narrow = data.astype(np.float32)
+        if np.array_equal(narrow, data, equal_nan=True):
+            return narrow
+    return data
+
+def _frozen(array):
+    array.flags.writeable = False
+    return array
+
+def _is_date_column(series):
+    if series.dtype != object:
+        return False
+    values = series.dropna()
+    return not values.empty and all(type(v) is date for v in values)
+
+def _is_text_column(series):
+    if isinstance(series.dtype, pd.StringDtype):
+        return True
+    return series.dtype == object and all(isinstance(v, str) for v in series.dropna())
+
+def as_frame(table):
+    """DataFrame for a CompactTable, passing DataFrames through unchanged"""
+    return table.to_frame() if isinstance(table, CompactTable) else table
+
+def store_table(key, df, state=None):
+    """Store df under key as a CompactTable, keeping the current object when
+    the contents are unchanged so other references to it stay shared"""
+    if state is None:
+        state = st.session_state
+    table = CompactTable.from_frame(df)
+    current = state.get(key)
+    if isinstance(current, CompactTable) and current.equals(table):
+        return current
+    state[key] = table
+    return table
+
+# --- Memory accounting ---
+def estimate_bytes(value, seen=None):
+    """Approximate bytes held by a session value. Objects already in seen
+    are not counted again, so shared tables are only charged once."""
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    if isinstance(value, CompactTable):
+        return value.nbytes
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum() if isinstance(value, pd.DataFrame) else usage)
+    if isinstance(value, np.ndarray):
+        return sys.getsizeof(value) + (0 if value.base is None else value.nbytes)
+    if isinstance(value, BytesIO):
+        return sys.getsizeof(value) + value.getbuffer().nbytes
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_bytes(k, seen) + estimate_bytes(v, seen) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_bytes(v, seen) for v in value)
+    return sys.getsizeof(value)
+
+def session_footprint(state):
+    """Bytes held per session_state key, largest first"""
+    if hasattr(state, 'filtered_state'):
+        items = state.filtered_state.items()
+    else:
+        items = state.to_dict().items() if hasattr(state, 'to_dict') else state.items()
+    seen = set()
+    footprint = {str(key): estimate_bytes(value, seen) for key, value in items}
+    return dict(sorted(footprint.items(), key=lambda item: item[1], reverse=True))
+
+# --- Session registry ---
+# Sessions idle this long lose their derived results; their typed inputs
+# are kept
+SESSION_IDLE_SECONDS = 30 * 60
+# How often the sweeper looks for idle sessions
+EVICTION_INTERVAL_SECONDS = 60
+# A session's footprint is measured at most this often, unless a hook wants
+# it on every run
+FOOTPRINT_INTERVAL_SECONDS = 60
+# Derived state an idle session recomputes on demand
+EVICTABLE_KEYS = ('goal_calculations', 'asset_analysis_results', 'asset_scenarios', 'rebalance_plan')
+
+class _Session:
+    """A tracked session: the thread-safe state wrapper of its latest run,
+    when it was last active, its sampled footprint, and a lock held for the
+    whole of each of its runs so the sweeper never changes a running session"""
+
+    def __init__(self, state):
+        self.state = state
+        self.last_seen = 0.0
+        self.footprint = {}
+        self.measured_at = None
+        self.run_lock = threading.RLock()
+
+_sessions = {}
+_footprint_hooks = []
+_lock = threading.Lock()
+
+def add_footprint_hook(hook):
+    """Call hook(session_id, footprint) at the start of every tracked run"""
+    _footprint_hooks.append(hook)
+    return hook
+
+def remove_footprint_hook(hook):
+    if hook in _footprint_hooks:
+        _footprint_hooks.remove(hook)
+
+@contextmanager
+def track_session():
+    """Mark the current session as active for the duration of a run (or a
+    fragment's rerun, see fragment); the app wraps each run in it"""
+    ctx = get_script_run_ctx(suppress_warning=True)
+    if ctx is None:
+        yield
+        return
+    with _lock:
+        session = _sessions.get(ctx.session_id)
+        if session is None:
+            session = _sessions[ctx.session_id] = _Session(ctx.session_state)
+    with session.run_lock:
+        now = time.monotonic()
+        session.state = ctx.session_state
+        session.last_seen = now
+        _prune_closed()
+        if _footprint_hooks or session.measured_at is None or now - session.measured_at >= FOOTPRINT_INTERVAL_SECONDS:
+            _measure(ctx.session_id, session, now)
+            for hook in list(_footprint_hooks):
+                hook(ctx.session_id, session.footprint)
+        try:
+            yield
+        finally:
+            session.last_seen = time.monotonic()
+
+def fragment(function):
+    """st.fragment whose reruns count as activity of the session"""
+    @functools.wraps(function)
+    def run(*args, **kwargs):
+        with track_session():
+            return function(*args, **kwargs)
+    return st.fragment(run)
+
+def drop_derived_state(state):
+    """Drop the results a session can recompute from its inputs"""
+    for key in EVICTABLE_KEYS:
+        if key in state:
+            del state[key]
+    if 'calculations_done' in state:
+        state['calculations_done'] = False
+
+def evict_idle_sessions(max_idle_seconds=None, now=None):
+    """Drop the derived state of sessions idle longer than max_idle_seconds.
+    A session in the middle of a run is skipped. Returns the ids of the
+    sessions that were trimmed."""
+    max_idle_seconds = SESSION_IDLE_SECONDS if max_idle_seconds is None else max_idle_seconds
+    now = time.monotonic() if now is None else now
+    _prune_closed()
+    with _lock:
+        sessions = list(_sessions.items())
+    evicted = []
+    for session_id, session in sessions:
+        if now - session.last_seen < max_idle_seconds or not session.run_lock.acquire(blocking=False):
+            continue
+        try:
+            # The run's SafeSessionState takes its own lock around each change
+            if any(key in session.state for key in EVICTABLE_KEYS):
+                drop_derived_state(session.state)
+                _measure(session_id, session, now)
+                evicted.append(session_id)
+        finally:
+            session.run_lock.release()
+    return evicted
+
+def start_sweeper(interval=EVICTION_INTERVAL_SECONDS):
+    """Evict idle sessions every interval seconds from a daemon thread;
+    returns an Event that stops it when set"""
+    stop = threading.Event()
+
+    def sweep():
+        while not stop.wait(interval):
+            try:
+                evict_idle_sessions()
+            except Exception:
+                logger.exception("session sweep failed")
+
+    threading.Thread(target=sweep, name="sahayak-session-sweeper", daemon=True).start()
+    return stop
+
+def session_report(now=None):
+    """Footprint of every live session as last measured:
+    {session_id: {idle_seconds, total_bytes, keys}}"""
+    now = time.monotonic() if now is None else now
+    _prune_closed()
+    with _lock:
+        sessions = list(_sessions.items())
+    return {
+        session_id: {
+            'idle_seconds': now - session.last_seen,
+            'total_bytes': sum(session.footprint.values()),
+            'keys': session.footprint,
+        }
+        for session_id, session in sessions
+    }
+
+def _measure(session_id, session, now):
+    session.footprint = session_footprint(session.state)
+    session.measured_at = now
+    _publish()
+
+def _publish():
+    """Session gauges from the latest footprints"""
+    with _lock:
+        footprints = {session_id: session.footprint for session_id, session in _sessions.items()}
+    by_key = {}
+    for footprint in footprints.values():
+        for key, size in footprint.items():
+            by_key[(key,)] = by_key.get((key,), 0) + size
+    metrics.SESSIONS.set(len(footprints))
+    metrics.SESSION_BYTES.replace({(session_id,): sum(footprint.values()) for session_id, footprint in footprints.items()})
+    metrics.SESSION_KEY_BYTES.replace(by_key)
+
+def _session_closed(session_id):
+    """Whether the runtime no longer holds the session; False when it can't
+    tell (bare mode, app tests)"""
+    if not Runtime.exists():
+        return False
+    try:
+        return not Runtime.instance().is_active_session(session_id)
+    except Exception:
+        return False
+
+def _prune_closed():
+    """Forget sessions the runtime has closed"""
+    with _lock:
+        session_ids = list(_sessions)
+    closed = [session_id for session_id in session_ids if _session_closed(session_id)]
+    if closed:
+        with _lock:
+            for session_id in closed:
+                _sessions.pop(session_id, None)
+        _publish()
@@ -0,0 +1,130 @@
+"""Systematic transfer plan (STP) schedules for the Investment Sheet.
+
+The initial and final allocation tables (Category, Scheme Name, Amount)
+fix how much leaves each scheme over the plan (it holds less at the end)
+and how much arrives in each (it holds more). Transfers are equal
+instalments, or a fixed amount with a smaller last one, taken from the
+sources and paid into the destinations in proportion to those amounts.
+Between transfers every scheme grows at its category's assumed return.
+Balances are computed in closed form for all schemes and dates at once.
+"""
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from sahayak.xirr import instalment_dates
+
+# Days between transfers; monthly transfers fall on the start date's day
+STP_FREQUENCIES = {"Weekly": 7, "Fortnightly": 14, "Monthly": None}
+
+# Assumed annual return (%) by the allocation table's Category; matched on
+# the category's first word, anything else is assumed not to grow
+STP_RETURNS = {'Equity': 12.0, 'Debt': 7.0, 'Hybrid': 9.0}
+
+ALLOCATION_COLUMNS = ['Category', 'Scheme Name', 'Amount']
+
+def stp_schedule(initial, final, start_date=None, frequency="Fortnightly", instalments=None, instalment_amount=None,
+                 returns=None):
+    """Transfer schedule and projected balances from the allocation tables.
+
+    Give either the number of instalments or the amount moved each time.
+    returns overrides STP_RETURNS. Returns a dict of DataFrames:
+    'transfers' (one row per instalment, source and destination),
+    'balances' (one row per instalment and scheme, after that transfer) and
+    'schedule' (per instalment: date, amount moved and the balance held in
+    each category).
+    """
+    if frequency not in STP_FREQUENCIES:
+        raise ValueError(f"unknown frequency '{frequency}' (expected one of: {', '.join(STP_FREQUENCIES)})")
+    funds = _funds(initial, final)
+    change = funds['final'].to_numpy() - funds['initial'].to_numpy()
+    outflow, inflow = np.clip(-change, 0, None), np.clip(change, 0, None)
+    total = outflow.sum()
+    if total <= 0 or inflow.sum() <= 0:
+        raise ValueError("the final portfolio needs no transfers from the initial one")
+
+    # Instalment amounts: equal, or fixed with the remainder last
+    if instalment_amount:
+        count = int(np.ceil(total / instalment_amount - 1e-9))
+        amounts = np.full(count, float(instalment_amount))
+        amounts[-1] = total - instalment_amount * (count - 1)
+    elif instalments:
+        amounts = np.full(int(instalments), total / int(instalments))
+    else:
+        raise ValueError("give the number of instalments or the amount per instalment")
+    count = len(amounts)
+
+    start = np.datetime64(start_date or datetime.now().date(), 'D')
+    step = STP_FREQUENCIES[frequency]
+    if step is None:
+        dates = instalment_dates(np.full(count, start), np.arange(count))
+        period_years = 1 / 12
+    else:
+        dates = start + np.arange(count) * step
+        period_years = step / 365
+
+    # Each transfer moves the same shares out of the sources and into the
+    # destinations; a destination's share is its part of all the increases
+    flow = outflow / outflow.sum() * -1 + inflow / inflow.sum()
+    rates = np.array([_category_return(category, returns) for category in funds['category']])
+    growth = (1 + rates / 100) ** period_years
+
+    # Balance after transfer k: the initial amount grown k-1 periods plus
+    # every transfer so far grown from its own date, for all schemes at once
+    periods = np.arange(count)[:, None]
+    grown = growth[None, :] ** periods
+    moved = np.cumsum(amounts[:, None] / grown, axis=0)
+    balances = grown * (funds['initial'].to_numpy()[None, :] + moved * flow[None, :])
+    balances[np.abs(balances) < 1e-6] = 0.0
+
+    sources, destinations = np.flatnonzero(outflow), np.flatnonzero(inflow)
+    pair_share = (outflow[sources, None] / outflow.sum()) * (inflow[None, destinations] / inflow.sum())
+    transfers = pd.DataFrame({
+        'instalment': np.repeat(np.arange(1, count + 1), pair_share.size),
+        'date': np.repeat(dates, pair_share.size),
+        'from_scheme': np.tile(np.repeat(funds['scheme'].to_numpy()[sources], len(destinations)), count),
+        'to_scheme': np.tile(np.tile(funds['scheme'].to_numpy()[destinations], len(sources)), count),
+        'amount': (amounts[:, None] * pair_share.ravel()[None, :]).ravel(),
+    })
+
+    n_funds = len(funds)
+    balance_rows = pd.DataFrame({
+        'instalment': np.repeat(np.arange(1, count + 1), n_funds),
+        'date': np.repeat(dates, n_funds),
+        'scheme': np.tile(funds['scheme'].to_numpy(), count),
+        'category': np.tile(funds['category'].to_numpy(), count),
+        'balance': balances.ravel(),
+    })
+
+    schedule = balance_rows.pivot_table(index=['instalment', 'date'], columns='category', values='balance',
+                                        aggfunc='sum', sort=False)
+    schedule.columns.name = None
+    schedule.insert(0, 'transfer', amounts)
+    schedule['total'] = balances.sum(axis=1)
+    return {'transfers': transfers, 'balances': balance_rows, 'schedule': schedule.reset_index()}
+
+def _funds(initial, final):
+    """Initial and final amount of every scheme in either table"""
+    tables = []
+    for table, column in ((initial, 'initial'), (final, 'final')):
+        table = table.reindex(columns=ALLOCATION_COLUMNS)
+        amount = pd.to_numeric(table['Amount'], errors='coerce').fillna(0).to_numpy(dtype=float)
+        category = table['Category'].fillna('').astype(str).str.strip().to_numpy(dtype=object)
+        names = table['Scheme Name'].fillna('').astype(str).str.strip().to_numpy(dtype=object)
+        # Unnamed schemes are told apart by category and row
+        scheme = [name or f"{cat or 'Fund'} (row {i + 1})" for i, (name, cat) in enumerate(zip(names, category))]
+        rows = pd.DataFrame({'scheme': scheme, 'category': category, column: amount})[amount != 0]
+        # One row per scheme, so a scheme listed twice isn't multiplied by the merge
+        tables.append(rows.groupby('scheme', sort=False, as_index=False).agg({'category': 'first', column: 'sum'}))
+    funds = tables[0].merge(tables[1], on='scheme', how='outer', suffixes=('', '_final'), sort=False)
+    funds['category'] = funds['category'].fillna(funds['category_final']).replace('', 'Other')
+    funds[['initial', 'final']] = funds[['initial', 'final']].fillna(0.0)
+    return funds[['scheme', 'category', 'initial', 'final']]
+
+def _category_return(category, returns):
+    table = returns or STP_RETURNS
+    for key, rate in table.items():
+        if str(category).lower().startswith(key.lower()):
+            return rate
+    return 0.0
@@ -0,0 +1,166 @@
+"""Per-request timing spans for the report and calculation paths.
+
+A request (one report, one calculation run) opens a trace; stages inside
+it open nested spans:
+
+    with request("report.goal_plan"):
+        with span("pdf.layout", pages=3):
+            ...
+
+or decorate a function with @traced("chart.goal_progress"). Without an
+active trace a span is a shared no-op, so instrumented code costs one
+context variable lookup when tracing is off. A request only starts a
+trace when tracing is configured, either by configure() or by the
+SAHAYAK_TRACE environment variable:
+
+    SAHAYAK_TRACE=log          one JSON log line per span (logger "sahayak.trace")
+    SAHAYAK_TRACE=traces/      one Chrome trace file per request, for
+                               chrome://tracing or ui.perfetto.dev
+"""
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from datetime import datetime
+
+logger = logging.getLogger("sahayak.trace")
+
+# Where finished traces go: None (off), "log" or a directory for Chrome traces
+_output = None
+_current = ContextVar("sahayak_trace", default=None)
+_NO_SPAN = nullcontext()
+
+class Trace:
+    """Spans of one request, in the order they started"""
+
+    def __init__(self, name):
+        self.name = name
+        self.started = datetime.now()
+        self.spans = []         # [name, start ns, duration ns or None, parent index, depth, attrs]
+        self._open = []
+        self._origin = time.perf_counter_ns()
+        self.thread = threading.get_ident()
+
+    @contextmanager
+    def span(self, name, **attrs):
+        parent = self._open[-1] if self._open else -1
+        index = len(self.spans)
+        record = [name, time.perf_counter_ns() - self._origin, None, parent, len(self._open), attrs]
+        self.spans.append(record)
+        self._open.append(index)
+        try:
+            yield attrs
+        finally:
+            record[2] = time.perf_counter_ns() - self._origin - record[1]
+            self._open.pop()
+
+    def records(self):
+        """One dict per span: name, parent, depth, start_ms and duration_ms
+        from the start of the request, and the span's attributes"""
+        return [{'trace': self.name, 'span': name, 'parent': self.spans[parent][0] if parent >= 0 else None,
+                 'depth': depth, 'start_ms': start / 1e6, 'duration_ms': (duration or 0) / 1e6, **attrs}
+                for name, start, duration, parent, depth, attrs in self.spans]
+
+    def chrome_events(self, pid=None):
+        """Spans as Chrome trace "complete" events (microseconds)"""
+        pid = os.getpid() if pid is None else pid
+        return [{'name': name, 'ph': 'X', 'ts': start / 1e3, 'dur': (duration or 0) / 1e3,
+                 'pid': pid, 'tid': self.thread, 'args': {key: str(value) for key, value in attrs.items()}}
+                for name, start, duration, parent, depth, attrs in self.spans]
+
+    def write_chrome(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': self.chrome_events(), 'displayTimeUnit': 'ms',
+                       'otherData': {'request': self.name, 'started': self.started.isoformat()}}, f)
+
+    def log(self):
+        for record in self.records():
+            logger.info(json.dumps(record, default=str))
+
+# --- Configuration ---
+def configure(output):
+    """Trace every request from now on to output ("log" or a directory for
+    Chrome traces); None turns tracing off"""
+    global _output
+    _output = output or None
+    if _output == "log" and not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    elif _output and _output != "log":
+        os.makedirs(_output, exist_ok=True)
+
+configure(os.environ.get("SAHAYAK_TRACE"))
+
+def enabled():
+    return _output is not None
+
+def current():
+    """The active trace, or None"""
+    return _current.get()
+
+def export(trace, output=None):
+    """Write a finished trace to output (default: the configured one)"""
+    output = output or _output
+    if output == "log":
+        trace.log()
+    elif output:
+        stamp = trace.started.strftime('%Y%m%dT%H%M%S%f')
+        trace.write_chrome(os.path.join(output, f"{trace.name}-{stamp}-{trace.thread}.json"))
+
+# --- Instrumentation ---
+def span(name, **attrs):
+    """A timed stage of the active trace; a no-op when there is none"""
+    trace = _current.get()
+    if trace is None:
+        return _NO_SPAN
+    return trace.span(name, **attrs)
+
+@contextmanager
+def request(name, **attrs):
+    """Trace a request: starts a trace (exported when the request ends) if
+    tracing is on and none is active, else is a span of the active one"""
+    trace = _current.get()
+    if trace is not None:
+        with trace.span(name, **attrs) as span_attrs:
+            yield span_attrs
+        return
+    if _output is None:
+        yield attrs
+        return
+    trace = Trace(name)
+    token = _current.set(trace)
+    try:
+        with trace.span(name, **attrs) as span_attrs:
+            yield span_attrs
+    finally:
+        _current.reset(token)
+        try:
+            export(trace)
+        except OSError as e:
+            logger.warning(f"could not write trace of {name}: {e}")
+
+def traced(name, is_request=False):
+    """Decorator timing each call of a function as a span (or, with
+    is_request, as a request)"""
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if is_request:
+                if _output is None and _current.get() is None:
+                    return function(*args, **kwargs)
+                with request(name):
+                    return function(*args, **kwargs)
+            trace = _current.get()
+            if trace is None:
+                return function(*args, **kwargs)
+            with trace.span(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
@@ -0,0 +1,541 @@
+import sqlite3
+
+import streamlit as st
+import pandas as pd
+
+from sahayak.resources import load_client_store, load_logo_bytes, load_scheme_index
+from sahayak.session_store import as_frame, store_table
+
+# Enhanced CSS with BLUE GRADIENT THEME
+APP_CSS = """
+<style>
+    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600&display=swap');
+    
+    /* COMPLETE REMOVAL OF STREAMLIT ELEMENTS AND WHITE SPACE */
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    header {visibility: hidden;}
+    .stDeployButton {display: none;}
+    
+    /* Remove all Streamlit header and toolbar space */
+    [data-testid="stToolbar"] {display: none !important;}
+    [data-testid="stHeader"] {height: 0px !important; min-height: 0px !important; display: none !important;}
+    [data-testid="stDecoration"] {display: none !important;}
+    [data-testid="stStatusWidget"] {display: none !important;}
+    
+    /* Kill all padding/margin above the app */
+    html, body {
+        margin: 0 !important;
+        padding: 0 !important;
+    }
+    
+    .stApp {
+        background: #fafafa;
+        margin: 0 !important;
+        padding: 0 !important;
+        top: 0 !important;
+    }
+    
+    .main > div {
+        padding: 0 !important;
+        margin: 0 !important;
+        max-width: none;
+        font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
+    }
+    
+    .block-container {
+        padding: 0rem 1rem !important;
+        margin: 0 !important;
+        max-width: none !important;
+    }
+    
+    .element-container {
+        margin: 0 !important;
+        padding: 0 !important;
+    }
+    
+    /* Target Streamlit's main content area */
+    [data-testid="stAppViewContainer"] {
+        padding: 0 !important;
+        margin: 0 !important;
+    }
+    
+    /* Aggressive fix for all content blocks */
+    .css-1rs6os, .css-10trblm, .css-1kyxreq, .css-k1vhr4, .css-18e3th9, .css-1d391kg, .css-1v3fvcr,
+    .css-1rs6os.edgvbvh3, .css-10trblm.e1nzilvr0, .css-1kyxreq.etr89bj2, .css-k1vhr4.egzxvld3 {
+        margin: 0 !important;
+        padding: 0 !important;
+    }
+    
+    /* Main container styling */
+    .main-container {
+        background: #fafafa;
+        min-height: 0vh;
+        padding: 1rem 1rem 1rem 1rem;
+        margin: 0 !important;
+    }
+    
+    .logo-container {
+        display: flex;
+        justify-content: center;
+        align-items: center;
+        margin: 0.5rem 0 1rem 0;
+        padding: 0;
+    }
+    
+    /* BLUE GRADIENT THEME THROUGHOUT */
+    .goal-section {
+        background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
+        color: white;
+        padding: 1.5rem;
+        border-radius: 12px;
+        margin: 1rem 0;
+        box-shadow: 0 4px 20px rgba(0,0,0,0.1);
+    }
+    
+    .goal-section h2 {
+        margin: 0 0 1rem 0;
+        font-size: 1.5rem;
+        font-weight: 600;
+    }
+    
+    .info-card {
+        background: rgba(255,255,255,0.95);
+        color: #333;
+        padding: 1rem;
+        border-radius: 8px;
+        margin: 0.5rem 0;
+        border-left: 4px solid #4facfe;
+    }
+    
+    .calculation-card {
+        background: white;
+        border: 1px solid #e0e0e0;
+        border-radius: 12px;
+        padding: 1.5rem;
+        margin: 1rem 0;
+        box-shadow: 0 2px 10px rgba(0,0,0,0.05);
+    }
+    
+    .metric-card {
+        background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
+        color: white;
+        padding: 1rem;
+        border-radius: 10px;
+        text-align: center;
+        margin: 0.5rem 0;
+    }
+    
+    .metric-value {
+        font-size: 1.8rem;
+        font-weight: bold;
+        margin: 0.5rem 0;
+    }
+    
+    .metric-label {
+        font-size: 0.9rem;
+        opacity: 0.9;
+    }
+    
+    /* Enhanced Form Styling */
+    .stTextInput > div > div > input,
+    .stSelectbox > div > div > select,
+    .stTextArea > div > div > textarea,
+    .stNumberInput > div > div > input {
+        background: white;
+        border: 2px solid #e0e0e0;
+        border-radius: 8px;
+        padding: 0.8rem;
+        font-size: 0.9rem;
+        transition: all 0.3s ease;
+        font-family: 'Inter', sans-serif;
+    }
+    
+    .stTextInput > div > div > input:focus,
+    .stSelectbox > div > div > select:focus,
+    .stTextArea > div > div > textarea:focus,
+    .stNumberInput > div > div > input:focus {
+        border-color: #4facfe;
+        outline: none;
+        box-shadow: 0 0 0 3px rgba(79, 172, 254, 0.1);
+    }
+    
+    /* Enhanced Buttons with BLUE GRADIENT */
+    .stButton > button {
+        background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 0.8rem 1.5rem;
+        font-weight: 600;
+        font-size: 0.9rem;
+        transition: all 0.3s ease;
+        font-family: 'Inter', sans-serif;
+        box-shadow: 0 4px 15px rgba(0,0,0,0.2);
+    }
+    
+    .stButton > button:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 6px 20px rgba(0,0,0,0.3);
+    }
+    
+    /* Calculate Button Special Styling */
+    .calculate-button {
+        text-align: center;
+        margin: 2rem 0;
+    }
+    
+    .calculate-button .stButton > button {
+        background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
+        font-size: 1.1rem;
+        padding: 1rem 2rem;
+        border-radius: 50px;
+    }
+    
+    /* Results Section with BLUE GRADIENT */
+    .results-section {
+        background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
+        padding: 2rem;
+        border-radius: 15px;
+        margin: 2rem 0;
+        color: white;
+    }
+    
+    .results-title {
+        color: white;
+        font-size: 1.8rem;
+        font-weight: bold;
+        text-align: center;
+        margin-bottom: 1.5rem;
+    }
+    
+    /* Investment Recommendation with BLUE GRADIENT */
+    .investment-recommendation {
+        background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
+        color: white;
+        padding: 1.5rem;
+        border-radius: 12px;
+        margin: 1rem 0;
+    }
+    
+    .investment-recommendation h3 {
+        margin: 0 0 1rem 0;
+        font-size: 1.2rem;
+    }
+    
+    .recommendation-item {
+        background: rgba(255,255,255,0.2);
+        padding: 0.8rem;
+        border-radius: 8px;
+        margin: 0.5rem 0;
+    }
+    
+    /* Table Styling */
+    .stDataFrame {
+        border-radius: 12px;
+        overflow: hidden;
+        box-shadow: 0 4px 20px rgba(0,0,0,0.1);
+    }
+    
+    /* Service Grid */
+    .services-grid {
+        display: grid;
+        grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
+        gap: 1rem;
+        margin: 1rem 0;
+    }
+    
+    .service-card {
+        background: white;
+        border: 1px solid #e8e8e8;
+        border-radius: 6px;
+        padding: 1rem;
+        transition: all 0.2s ease;
+    }
+    
+    .service-card:hover {
+        border-color: #4facfe;
+        transform: translateY(-1px);
+        box-shadow: 0 2px 8px rgba(0, 0, 0, 0.06);
+    }
+    
+    .service-title {
+        font-size: 1rem;
+        font-weight: 500;
+        color: #1a1a1a;
+        margin: 0 0 0.5rem 0;
+    }
+    
+    .service-description {
+        font-size: 0.8rem;
+        color: #666;
+        line-height: 1.4;
+        margin: 0 0 0.75rem 0;
+    }
+    
+    .app-header {
+        background: white;
+        border: 1px solid #e8e8e8;
+        border-radius: 8px;
+        padding: 1rem;
+        margin-bottom: 1rem;
+        text-align: center;
+    }
+    
+    .app-title {
+        font-size: 1.75rem;
+        font-weight: 500;
+        color: #1a1a1a;
+        margin: 0 0 0.25rem 0;
+        letter-spacing: -0.01em;
+    }
+    
+    .app-subtitle {
+        font-size: 0.875rem;
+        color: #666;
+        font-weight: 400;
+        margin: 0;
+    }
+    
+    /* Form Labels */
+    .stTextInput > label,
+    .stSelectbox > label,
+    .stTextArea > label,
+    .stNumberInput > label {
+        font-weight: 500;
+        color: #374151;
+        font-size: 0.8rem;
+        margin-bottom: 0.25rem !important;
+        font-family: 'Inter', sans-serif;
+    }
+    
+    .stTextInput, .stSelectbox, .stTextArea, .stNumberInput {
+        margin-bottom: 0.5rem !important;
+    }
+    
+    .stCheckbox {
+        margin: 0.25rem 0 !important;
+    }
+    
+    .stCheckbox > label {
+        font-weight: 500;
+        color: #374151;
+        font-size: 0.8rem;
+        font-family: 'Inter', sans-serif;
+    }
+    
+    /* Alert Styling */
+    .stInfo, .stSuccess, .stError, .stWarning {
+        border-radius: 4px;
+        border-left: 2px solid;
+        padding: 0.5rem;
+        margin: 0.5rem 0;
+        font-size: 0.8rem;
+    }
+    
+    .stInfo {
+        background: #f0f8ff;
+        border-left-color: #4facfe;
+    }
+    
+    .stSuccess {
+        background: #f0fff4;
+        border-left-color: #22c55e;
+    }
+    
+    .stError {
+        background: #fff5f5;
+        border-left-color: #ef4444;
+    }
+    
+    /* Expander Styling */
+    .streamlit-expanderHeader {
+        background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
+        color: white;
+        border-radius: 8px;
+        font-weight: 600;
+        padding: 0.8rem !important;
+        margin: 0.5rem 0 !important;
+    }
+    
+    .stProgress > div > div {
+        background: #4facfe;
+        border-radius: 2px;
+    }
+    
+    .app-footer {
+        background: white;
+        border: 1px solid #e8e8e8;
+        border-radius: 6px;
+        padding: 1rem;
+        margin-top: 1rem;
+        text-align: center;
+    }
+    
+    .footer-text {
+        color: #666;
+        font-size: 0.75rem;
+        margin: 0.125rem 0;
+    }
+    
+    .back-button {
+        margin-bottom: 0.75rem;
+    }
+    
+    .row-widget {
+        gap: 0.75rem !important;
+    }
+    
+    div[data-testid="column"] {
+        padding-left: 0.375rem !important;
+        padding-right: 0.375rem !important;
+    }
+    
+    .stMultiSelect {
+        margin-bottom: 0.5rem !important;
+    }
+    
+    .stSpinner {
+        text-align: center;
+        margin: 0.5rem 0;
+    }
+    
+    .stMarkdown {
+        margin-bottom: 0 !important;
+    }
+    
+    .stTabs {
+        margin: 0.5rem 0 !important;
+    }
+</style>
+"""
+
+def apply_theme():
+    st.markdown(APP_CSS, unsafe_allow_html=True)
+
+# --- UI Helper Functions ---
+def show_header():
+    """Properly sized and centered header"""
+    logo = load_logo_bytes()
+    if logo is not None:
+        # Center the logo with controlled size
+        col1, col2, col3 = st.columns([2.30, 2, 1])
+        with col2:
+            st.image(logo, width=215)  # Fixed width instead of use_column_width=True
+    else:
+        st.markdown("""
+        <div class="app-header">
+            <h1 class="app-title">SAHAYAK ASSOCIATES</h1>
+            <p class="app-subtitle">Professional Financial Planning Tools</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+def show_back_button(key):
+    """Clean back button"""
+    st.markdown('<div class="back-button">', unsafe_allow_html=True)
+    if st.button("← Back to Main Menu", key=key):
+        st.session_state.app_mode = None
+        st.rerun()
+    st.markdown('</div>', unsafe_allow_html=True)
+
+def scheme_name_helper(table, key):
+    """Scheme lookup and name corrections for a table with a Scheme Name
+    column. Returns the table with the suggested names once the advisor
+    accepts them, else None. Shows nothing until a scheme master (NAV
+    store) has been imported."""
+    index = load_scheme_index()
+    if index is None or table is None or 'Scheme Name' not in table:
+        return None
+    with st.popover("🔎 Find Scheme"):
+        query = st.text_input("Scheme name or code", key=f"{key}_scheme_query", placeholder="e.g. hdfc mid cap")
+        if query.strip():
+            matches = index.search(query, 8)
+            st.dataframe(matches.rename(columns={'name': 'Scheme Name', 'code': 'Code'})[['Scheme Name', 'Code']],
+                         hide_index=True, use_container_width=True)
+
+    suggestions = index.suggestions(table['Scheme Name'].fillna(''))
+    if suggestions:
+        st.caption("Not in the scheme master: " + "; ".join(
+            f"{typed} → {name} ({code})" for typed, (code, name) in suggestions.items()))
+        if st.button("Use Suggested Scheme Names", key=f"{key}_fix_names"):
+            fixed = table.copy()
+            fixed['Scheme Name'] = [suggestions[str(name).strip()][1] if pd.notna(name) and str(name).strip() in suggestions
+                                    else name for name in table['Scheme Name']]
+            return fixed
+    return None
+
+def client_records_panel(screen, keys, tables=(), name_key=None):
+    """Save this screen for a client or load a saved client back into it.
+
+    keys are the session values that make up the screen (inputs and
+    results); tables are keys of keyed data editors, saved from their last
+    edited output (session_state[f"{key}_edited"]) and restored as the
+    editor's starting table (session_state[f"{key}_table"]), both held as
+    CompactTables. The client name is the screen's own name
+    input, name_key. Must run before the screen's widgets."""
+    try:
+        store = load_client_store()
+    except sqlite3.Error as e:
+        st.caption(f"Client records are unavailable: {e}")
+        return
+
+    with st.expander("💾 Client Records", expanded=False):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            query = st.text_input("Find Client", key=f"{screen}_client_query", placeholder="Name starts with...")
+        with col2:
+            advisor = st.text_input("Advisor", key=f"{screen}_client_advisor")
+        with col3:
+            review_date = st.date_input("Next Review Date", value=None, key=f"{screen}_review_date")
+
+        clients = store.find_clients(query.strip() or None, advisor.strip() or None, screen=screen, limit=20)
+        labels = {row.id: f"{row.name}" + (f" ({row.advisor})" if row.advisor else "")
+                  + (f" - review {row.review_date}" if row.review_date else "")
+                  for row in clients.itertuples()}
+        col1, col2, col3 = st.columns([3, 1, 1])
+        with col1:
+            client_id = st.selectbox("Saved Clients", list(labels), format_func=labels.get, key=f"{screen}_client_pick",
+                                     placeholder="No saved clients match" if not labels else "Choose a client")
+        with col2:
+            load = st.button("Load", key=f"{screen}_client_load", disabled=client_id is None, use_container_width=True)
+        with col3:
+            save = st.button("Save", key=f"{screen}_client_save", use_container_width=True)
+
+        if load:
+            try:
+                values = store.load_screen(client_id, screen) or {}
+            except ValueError as e:
+                st.error(f"Error loading client: {str(e)}")
+                return
+            # Whatever the saved client doesn't have goes back to its default
+            for key in keys:
+                if key in values:
+                    st.session_state[key] = values[key]
+                else:
+                    st.session_state.pop(key, None)
+            for key in tables:
+                # The editor starts over from the saved table
+                st.session_state.pop(key, None)
+                st.session_state.pop(f"{key}_edited", None)
+                if key in values:
+                    store_table(f"{key}_table", as_frame(values[key]))
+                else:
+                    st.session_state.pop(f"{key}_table", None)
+            st.rerun()
+
+        if save:
+            name = str(st.session_state.get(name_key) or "").strip()
+            if not name:
+                st.error("Please enter the client name before saving.")
+                return
+            values = {key: st.session_state[key] for key in keys if key in st.session_state}
+            for key in tables:
+                if f"{key}_edited" in st.session_state:
+                    values[key] = as_frame(st.session_state[f"{key}_edited"])
+            try:
+                client_id = store.save_client(name, advisor, review_date)
+                store.save_screen(client_id, screen, values)
+            except (sqlite3.Error, ValueError) as e:
+                st.error(f"Error saving client: {str(e)}")
+            else:
+                st.success(f"Saved {name}.")
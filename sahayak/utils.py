@@ -0,0 +1,104 @@
+# --- UTILITY FUNCTIONS ---
+def format_indian_number(amount):
+    try:
+        num = float(amount)
+    except:
+        return "0.00"
+    
+    formatted = f"{abs(num):.2f}"
+    
+    if '.' in formatted:
+        integer_part, decimal_part = formatted.split('.')
+    else:
+        integer_part, decimal_part = formatted, "00"
+    
+    if len(integer_part) <= 3:
+        formatted_integer = integer_part
+    else:
+        last_three = integer_part[-3:]
+        remaining = integer_part[:-3]
+        
+        formatted_remaining = ""
+        while len(remaining) > 2:
+            formatted_remaining = "," + remaining[-2:] + formatted_remaining
+            remaining = remaining[:-2]
+        
+        if remaining:
+            formatted_remaining = remaining + formatted_remaining
+        
+        formatted_integer = formatted_remaining + "," + last_three
+    
+    result = formatted_integer + "." + decimal_part
+    
+    if num < 0:
+        result = "-" + result
+    
+    return result
+
+def calculate_future_value(present_value, inflation_rate, years):
+    return present_value * ((1 + inflation_rate/100) ** years)
+
+def calculate_sip_amount(future_value, years, expected_return, existing_assets=0):
+    deficit = future_value - existing_assets
+    if deficit <= 0:
+        return 0
+    
+    monthly_rate = expected_return / 100 / 12
+    months = years * 12
+    
+    if monthly_rate == 0:
+        return deficit / months
+    
+    sip_amount = deficit * monthly_rate / (((1 + monthly_rate) ** months) - 1)
+    return sip_amount
+
+def calculate_lumpsum_amount(future_value, years, expected_return, existing_assets=0):
+    deficit = future_value - existing_assets
+    if deficit <= 0:
+        return 0
+    
+    annual_rate = expected_return / 100
+    lumpsum = deficit / ((1 + annual_rate) ** years)
+    return lumpsum
+
+def calculate_stepup_sip(base_sip, stepup_rate=10):
+    return base_sip * (1 - stepup_rate/100)
+
+def calculate_retirement_corpus(monthly_expenses, retirement_years, inflation_rate, tax_rate, investment_return):
+    annual_expenses = monthly_expenses * 12
+    
+    real_return = ((1 + investment_return/100) / (1 + inflation_rate/100)) - 1
+    
+    real_return_tax_adjusted = real_return * (1 - tax_rate)
+    
+    if real_return_tax_adjusted <= 0:
+        return annual_expenses * retirement_years
+    
+    corpus = annual_expenses * (1 - (1 + real_return_tax_adjusted)**(-retirement_years)) / real_return_tax_adjusted
+    
+    return corpus
+
+def calculate_goal_progress(current_age, target_age, already_saved, required_sip, expected_return):
+    progress = []
+    years = list(range(current_age, target_age + 1))
+    
+    monthly_rate = expected_return / 100 / 12
+    
+    for year in years:
+        months_elapsed = (year - current_age) * 12
+        
+        if months_elapsed == 0:
+            progress_value = already_saved
+        else:
+            fv_saved = already_saved * ((1 + expected_return/100) ** (year - current_age))
+            
+            if required_sip > 0 and monthly_rate > 0:
+                fv_sip = required_sip * ((((1 + monthly_rate) ** months_elapsed) - 1) / monthly_rate)
+            else:
+                fv_sip = required_sip * months_elapsed
+            
+            progress_value = fv_saved + fv_sip
+        
+        progress.append(progress_value)
+    
+    return years, progress
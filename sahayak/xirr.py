@@ -0,0 +1,153 @@
+"""XIRR of dated cash flows, solved for many schemes or portfolios at once.
+
+Cash flows follow the usual sign convention: money invested is negative,
+the current value (or a redemption) is positive. Flows belong to groups
+(schemes, folios, clients) given as integer codes, and every group's rate
+is found by the same vectorized Newton iteration, with a bisection
+fallback that keeps each step inside the group's bracket.
+"""
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# Rates are searched as log(1 + rate) between these bounds: -99.99% to +1000% a year
+_LOG_RATE_BOUNDS = (np.log(1e-4), np.log(11.0))
+_MAX_ITERATIONS = 100
+# Converged when a step moves log(1 + rate) less than this
+_TOLERANCE = 1e-10
+
+# --- Solver ---
+def xirr(group, dates, amounts, n_groups=None):
+    """Annual XIRR of each group's cash flows.
+
+    group is an integer code per flow, dates are datetime64-compatible and
+    amounts signed. Returns an array with one rate (0.12 for 12%) per group
+    code; groups whose flows don't change sign, span a single day or have no
+    root in the search range get NaN.
+    """
+    group = np.asarray(group, dtype=np.int64)
+    amounts = np.asarray(amounts, dtype=float)
+    days = np.asarray(dates, dtype='datetime64[D]').astype(np.int64)
+    if n_groups is None:
+        n_groups = int(group.max(initial=-1)) + 1
+    if not n_groups:
+        return np.zeros(0)
+
+    # Years before each group's last flow, so discount factors stay <= 1
+    # for positive rates and nothing overflows over long SIP histories
+    last_day = np.full(n_groups, np.iinfo(np.int64).min)
+    np.maximum.at(last_day, group, days)
+    years = (last_day[group] - days) / 365.0
+
+    def value(x, slope=False):
+        # NPV at the last flow date as a function of x = log(1 + rate)
+        growth = amounts * np.exp(x[group] * years)
+        npv = np.bincount(group, weights=growth, minlength=n_groups)
+        if not slope:
+            return npv
+        return npv, np.bincount(group, weights=growth * years, minlength=n_groups)
+
+    lo = np.full(n_groups, _LOG_RATE_BOUNDS[0])
+    hi = np.full(n_groups, _LOG_RATE_BOUNDS[1])
+    value_lo, value_hi = value(lo), value(hi)
+    solvable = np.sign(value_lo) * np.sign(value_hi) < 0
+    # Orient each bracket so the NPV is negative at lo
+    swap = value_lo > 0
+    lo, hi = np.where(swap, hi, lo), np.where(swap, lo, hi)
+
+    x = np.zeros(n_groups)
+    active = solvable.copy()
+    for _ in range(_MAX_ITERATIONS):
+        if not active.any():
+            break
+        npv, slope = value(x, slope=True)
+        below = npv < 0
+        lo = np.where(active & below, x, lo)
+        hi = np.where(active & ~below, x, hi)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            newton = x - npv / slope
+        # Bisect wherever Newton would leave the bracket or the slope vanished
+        inside = (newton - lo) * (newton - hi) < 0
+        step = np.where(inside, newton, (lo + hi) / 2) - x
+        x = np.where(active, x + step, x)
+        active &= np.abs(step) > _TOLERANCE
+
+    rates = np.expm1(x)
+    rates[~solvable | active] = np.nan
+    return rates
+
+def xirr_by(flows, by='scheme'):
+    """XIRR per value of flows[by] for a DataFrame with date and amount columns"""
+    codes, keys = pd.factorize(flows[by], sort=True)
+    rates = xirr(codes, flows['date'].to_numpy().astype('datetime64[D]'), flows['amount'], len(keys))
+    return pd.Series(rates, index=keys, name='xirr')
+
+# --- Flows from holdings ---
+def holding_flows(holdings, as_of=None):
+    """Dated cash flows of mutual fund holdings.
+
+    A holding with a monthly SIP is taken to have started its SIP on the
+    investment date, with an instalment on that day of every month up to
+    as_of, as far as the invested amount covers; any rest of the invested
+    amount is a lumpsum on the investment date. The current value is a
+    positive flow on as_of. Holdings without an investment date or invested
+    amount are skipped. Flows carry the holding's position in a 'holding'
+    column and are labelled like capital_gains.holdings_transactions.
+    """
+    as_of = np.datetime64(as_of or datetime.now().date(), 'D')
+    frame = pd.DataFrame(list(holdings), columns=['scheme_name', 'category', 'invested_amount', 'current_value',
+                                                  'investment_date', 'monthly_sip'])
+    invested = pd.to_numeric(frame['invested_amount'], errors='coerce').fillna(0).to_numpy(dtype=float)
+    current = pd.to_numeric(frame['current_value'], errors='coerce').fillna(0).to_numpy(dtype=float)
+    sip = pd.to_numeric(frame['monthly_sip'], errors='coerce').fillna(0).to_numpy(dtype=float)
+    start = pd.to_datetime(frame['investment_date']).to_numpy().astype('datetime64[D]')
+    valid = (invested > 0) & ~np.isnat(start) & (start <= as_of)
+
+    rows = np.flatnonzero(valid)
+    invested, current, sip, start = invested[rows], current[rows], sip[rows], start[rows]
+
+    # Instalments that fell due by as_of, capped by what was invested
+    start_month = start.astype('datetime64[M]')
+    due = (as_of.astype('datetime64[M]') - start_month).astype(np.int64) + 1
+    due -= instalment_dates(start, due - 1) > as_of
+    instalments = np.where(sip > 0, np.minimum(due, np.floor(invested / np.where(sip > 0, sip, 1))), 0).astype(np.int64)
+    lumpsum = invested - instalments * sip
+
+    # One flow per instalment, laid out row after row
+    holding = np.repeat(np.arange(len(rows)), instalments)
+    month = np.arange(len(holding)) - np.repeat(np.cumsum(instalments) - instalments, instalments)
+    sip_dates = instalment_dates(start[holding], month)
+
+    has_lumpsum = lumpsum > 1e-9
+    labels = np.array([f"{name or 'Scheme'} (row {i + 1})" for i, name in zip(rows, frame['scheme_name'].to_numpy()[rows])],
+                      dtype=object)
+    flows = pd.DataFrame({
+        'holding': np.concatenate((np.flatnonzero(has_lumpsum), holding, np.arange(len(rows)))),
+        'date': np.concatenate((start[has_lumpsum], sip_dates, np.full(len(rows), as_of))),
+        'amount': np.concatenate((-lumpsum[has_lumpsum], -sip[holding], current)),
+    })
+    flows = flows.sort_values(['holding', 'date'], kind='stable', ignore_index=True)
+    flows.insert(0, 'scheme', labels[flows['holding'].to_numpy()])
+    flows['holding'] = rows[flows['holding'].to_numpy()]
+    return flows
+
+def instalment_dates(start, months_after):
+    """start's day of month, months_after months later, clipped to month end"""
+    month = start.astype('datetime64[M]') + months_after
+    first = month.astype('datetime64[D]')
+    month_days = (month + 1).astype('datetime64[D]') - first
+    day = (start - start.astype('datetime64[M]').astype('datetime64[D]')).astype(np.int64)
+    return first + np.minimum(day, month_days.astype(np.int64) - 1)
+
+def holdings_xirr(holdings, as_of=None):
+    """(per-scheme XIRR Series, portfolio XIRR) for mutual fund holdings"""
+    flows = holding_flows(holdings, as_of)
+    if flows.empty:
+        return pd.Series(dtype=float, name='xirr'), np.nan
+    schemes = xirr_by(flows, 'holding')
+    schemes.index = flows.drop_duplicates('holding').set_index('holding').loc[schemes.index, 'scheme'].to_numpy()
+    portfolio = xirr(np.zeros(len(flows), dtype=np.int64), flows['date'].to_numpy().astype('datetime64[D]'),
+                     flows['amount'], 1)[0]
+    return schemes, portfolio
@@ -0,0 +1,122 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sahayak.asset_engine import (EQUITY_CATEGORIES, SCENARIO_FIELDS, AnalysisParams, FixedDeposit, GoldHolding,
+                                  MutualFundHolding, PropertyHolding, analyze_mutual_funds, analyze_portfolio,
+                                  project_fd_accrual, scenario_cube)
+
+def test_partial_mf_returns_override_keeps_other_categories():
+    holdings = [
+        MutualFundHolding("Fund A", 'Equity Large Cap', 100000, 300000, date(2020, 1, 1)),
+        MutualFundHolding("Fund B", 'Debt Fund', 100000, 100000, date(2020, 1, 1)),
+    ]
+    params = AnalysisParams(5, 0.30, 6.0, date(2025, 1, 1), {'Debt Fund': 7.5})
+    result = analyze_mutual_funds(holdings, params)
+    assert result['expected_return'] == pytest.approx(0.75 * 12.0 + 0.25 * 7.5)
+    assert result['future_value'] == pytest.approx(400000 * (1 + result['expected_return'] / 100) ** 5)
+
+def loop_tax_and_load(holdings, today, tax_rate):
+    """Tax and exit load as the analyzer worked them out scheme by scheme"""
+    total_tax, total_load = 0, 0
+    for scheme in holdings:
+        if scheme.investment_date and pd.notna(scheme.investment_date):
+            holding_days = (today - scheme.investment_date).days
+            gains = scheme.current_value - scheme.invested_amount
+            if scheme.category in EQUITY_CATEGORIES:
+                if holding_days > 365:
+                    tax = max(0, (gains - 100000) * 0.10) if gains > 100000 else 0
+                else:
+                    tax = gains * 0.15 if gains > 0 else 0
+            else:
+                if holding_days > 1095:
+                    tax = gains * 0.20 if gains > 0 else 0
+                else:
+                    tax = gains * tax_rate if gains > 0 else 0
+            total_tax += tax
+            if holding_days < 365:
+                total_load += scheme.current_value * 0.01
+    return total_tax, total_load
+
+def test_mf_tax_and_exit_load_match_the_scheme_loop():
+    today = date(2025, 1, 15)
+    rng = np.random.default_rng(11)
+    categories = ['Equity Large Cap', 'ELSS', 'Debt Fund', 'Hybrid Fund']
+    # Holding periods either side of the exit load, equity and debt
+    # boundaries, plus undated rows
+    days = [364, 365, 366, 1094, 1095, 1096, 30, 2000, None, None]
+    for _ in range(50):
+        holdings = []
+        for held in rng.choice(np.array(days, dtype=object), 12):
+            invested = float(rng.integers(1, 50) * 10000)
+            current = invested + float(rng.integers(-20, 40) * 10000)
+            holdings.append(MutualFundHolding("Fund", str(rng.choice(categories)), invested, current,
+                                              None if held is None else today - timedelta(days=int(held))))
+        result = analyze_mutual_funds(holdings, AnalysisParams(5, 0.30, 6.0, today))
+        tax, load = loop_tax_and_load(holdings, today, 0.30)
+        assert result['tax_impact'] == pytest.approx(tax, rel=1e-12, abs=1e-9)
+        assert result['exit_load'] == pytest.approx(load, rel=1e-12, abs=1e-9)
+
+def fd_year_loop(principal, annual_rate, years, tax_rate, compounding):
+    """Per-year (opening, interest, tax) of an FD whose interest is taxed as it accrues"""
+    amount, rows = principal, []
+    for _ in range(years):
+        interest = amount * ((1 + annual_rate / 100 / compounding) ** compounding - 1)
+        tax = interest * tax_rate
+        rows.append((amount, interest, tax))
+        amount += interest - tax
+    return amount, rows
+
+def test_fd_closed_form_matches_the_year_loop():
+    principals = np.array([100000.0, 250000.0, 50000.0, 1000.0, 75000.0])
+    rates = np.array([7.5, 6.0, 0.0, 9.25, 7.0])
+    years = np.array([5, 1, 3, 30, 0])
+    compounding = np.array([1, 4, 12, 2, 4])
+    for tax_rate in (0.0, 0.30, 1.0):
+        projection = project_fd_accrual(principals, rates, years, tax_rate, compounding, schedule=True)
+        schedule = projection['schedule']
+        assert schedule['opening'].shape == (len(principals), years.max())
+        for i in range(len(principals)):
+            maturity, rows = fd_year_loop(principals[i], rates[i], years[i], tax_rate, compounding[i])
+            tax_paid = sum(tax for _, _, tax in rows)
+            assert projection['maturity'][i] == pytest.approx(maturity, rel=1e-12)
+            assert projection['tax_paid'][i] == pytest.approx(tax_paid, rel=1e-12, abs=1e-9)
+            assert projection['interest'][i] == pytest.approx(sum(interest for _, interest, _ in rows), rel=1e-12, abs=1e-9)
+            for year, (opening, interest, tax) in enumerate(rows):
+                assert schedule['opening'][i, year] == pytest.approx(opening, rel=1e-12)
+                assert schedule['interest'][i, year] == pytest.approx(interest, rel=1e-12, abs=1e-9)
+                assert schedule['tax'][i, year] == pytest.approx(tax, rel=1e-12, abs=1e-9)
+                assert schedule['closing'][i, year] == pytest.approx(opening + interest - tax, rel=1e-12)
+            # Years after the FD's own horizon earn nothing
+            assert (schedule['interest'][i, years[i]:] == 0).all()
+
+def test_scenario_cube_matches_scalar_analyses():
+    as_of = date(2025, 1, 15)
+    portfolio = {
+        'Mutual Funds': [
+            MutualFundHolding("Fund A", 'Equity Large Cap', 100000, 180000, date(2021, 6, 1), 5000),
+            MutualFundHolding("Fund B", 'Debt Fund', 50000, 56000, date(2024, 9, 1)),
+        ],
+        'Real Estate': [PropertyHolding(4000000, 6500000, date(2016, 3, 1), 15000, 20000)],
+        'Gold': [GoldHolding(4500, 20, 7800, date(2019, 11, 1), 500)],
+        'Fixed Deposits': [FixedDeposit(200000, 7.25, 3, "Tax Saver FD", 4)],
+    }
+    horizons, tax_rates, inflations = [1, 5, 10], [0.0, 0.30], [4.0, 6.5]
+    cube = scenario_cube(portfolio, horizons, tax_rates, inflations, as_of=as_of, mf_returns={'Debt Fund': 7.5})
+
+    assert len(cube) == 4 * 3 * 2 * 2
+    for horizon in horizons:
+        for tax_rate in tax_rates:
+            for inflation in inflations:
+                results = analyze_portfolio(portfolio, AnalysisParams(horizon, tax_rate, inflation, as_of,
+                                                                      {'Debt Fund': 7.5}))
+                cells = cube[(cube['horizon_years'] == horizon) & (cube['tax_rate'] == tax_rate)
+                             & (cube['inflation'] == inflation)].set_index('asset_class')
+                assert sorted(cells.index) == sorted(results)
+                for asset_class, result in results.items():
+                    for field in SCENARIO_FIELDS:
+                        assert cells.loc[asset_class, field] == pytest.approx(float(result[field]), rel=1e-12, abs=1e-9)
+                    assert cells.loc[asset_class, 'real_future_value'] == pytest.approx(
+                        float(result['future_value']) / (1 + inflation / 100) ** horizon, rel=1e-12)
@@ -0,0 +1,91 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sahayak.asset_engine import MutualFundHolding
+from sahayak.capital_gains import fifo_match, harvest_plan, holdings_transactions, open_lots, redemption_tax
+
+def brute_force_fifo(buy_group, buy_units, sell_group, sell_units):
+    """Units per (buy, sell) pair, matching one whole unit at a time"""
+    queues = {}
+    for index, (group, units) in enumerate(zip(buy_group, buy_units)):
+        queues.setdefault(group, []).extend([index] * units)
+    matched = {}
+    for index, (group, units) in enumerate(zip(sell_group, sell_units)):
+        for _ in range(units):
+            buy = queues[group].pop(0)
+            matched[buy, index] = matched.get((buy, index), 0) + 1
+    for queue in queues.values():
+        for buy in queue:
+            matched[buy, -1] = matched.get((buy, -1), 0) + 1
+    return matched
+
+def slices_by_pair(buy_index, sell_index, units):
+    matched = {}
+    for buy, sell, amount in zip(buy_index, sell_index, units):
+        matched[int(buy), int(sell)] = matched.get((int(buy), int(sell)), 0) + amount
+    return matched
+
+def test_fifo_match_without_sells_holds_every_buy():
+    buy_index, sell_index, units = fifo_match([0, 1, 0], [10.0, 5.0, 2.5], [], [])
+    assert sorted(zip(buy_index.tolist(), units.tolist())) == [(0, 10.0), (1, 5.0), (2, 2.5)]
+    assert (sell_index == -1).all()
+
+def test_fifo_match_agrees_with_per_unit_fifo():
+    rng = np.random.default_rng(7)
+    for _ in range(200):
+        n_groups = rng.integers(1, 4)
+        buy_group = rng.integers(0, n_groups, rng.integers(1, 12))
+        buy_units = rng.integers(1, 20, len(buy_group))
+        sell_group, sell_units = [], []
+        held = np.bincount(buy_group, weights=buy_units, minlength=n_groups).astype(int)
+        for _ in range(rng.integers(0, 10)):
+            group = int(rng.integers(0, n_groups))
+            if held[group]:
+                units = int(rng.integers(1, held[group] + 1))
+                held[group] -= units
+                sell_group.append(group)
+                sell_units.append(units)
+
+        expected = brute_force_fifo(buy_group, buy_units, sell_group, sell_units)
+        actual = slices_by_pair(*fifo_match(buy_group, buy_units, sell_group, sell_units))
+        assert actual.keys() == expected.keys()
+        for pair, units in expected.items():
+            assert abs(actual[pair] - units) < 1e-9
+
+def sip_book():
+    return pd.DataFrame({
+        'scheme': ['Fund A', 'Fund A', 'Fund B'],
+        'date': pd.to_datetime(['2022-01-10', '2022-02-10', '2022-03-10']),
+        'units': [100.0, 50.0, 20.0],
+        'nav': [10.0, 11.0, 50.0],
+    })
+
+def test_open_lots_of_purchases_only():
+    lots = open_lots(sip_book())
+    assert lots['units'].tolist() == [100.0, 50.0, 20.0]
+
+def test_redemption_tax_with_nothing_to_redeem():
+    schemes = pd.DataFrame({'category': ['Equity Large Cap', 'Debt'], 'nav': [12.0, 55.0]},
+                           index=['Fund A', 'Fund B'])
+    lots, totals = redemption_tax(sip_book(), schemes, as_of='2024-01-01', redeem={})
+    assert lots.empty
+    assert totals['tax'] == 0
+
+def test_sip_instalments_under_a_year_are_not_harvested():
+    # 13 monthly instalments; only the first is over 365 days old on as_of
+    sip = MutualFundHolding("Fund A", 'Equity Large Cap', 65000, 130000, date(2024, 1, 10), 5000)
+    transactions, schemes = holdings_transactions([sip], as_of=date(2025, 1, 15))
+    assert len(transactions) == 13
+    assert (transactions['units'] == 5000.0).all()
+
+    _, totals = redemption_tax(transactions, schemes, as_of='2025-01-15')
+    assert totals['stcg'] == pytest.approx(12 * 5000.0)
+    assert totals['exit_load'] == pytest.approx(12 * 10000.0 * 0.01)
+
+    plan, summary = harvest_plan(transactions, schemes, as_of='2025-01-15')
+    assert plan['units'].tolist() == pytest.approx([5000.0])
+    assert summary['tax'] == 0
+    assert summary['exit_load'] == 0
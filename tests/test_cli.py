@@ -0,0 +1,48 @@
+import json
+from datetime import date, datetime, timedelta
+
+from sahayak import cli
+from sahayak.cli import build_report, main, report_as_of, report_fingerprint
+
+def test_investment_report_with_numeric_amounts():
+    pdf, file_name = build_report({
+        'report': 'investment', 'client_name': "Ravi Kumar", 'report_date': "01-01-2025",
+        'financial_goal': "Retirement", 'investment_horizon': "10 years", 'risk_profile': "Moderate",
+        'return_expectation': "12%", 'investment_amount': 2500000, 'sip_amount': 25000.0,
+    })
+    assert pdf.getvalue().startswith(b'%PDF')
+    assert file_name.endswith('.pdf')
+
+def asset_spec(client_name, **extra):
+    return {'report': 'asset_analysis', 'client_name': client_name, **extra, 'holdings': {
+        'Mutual Funds': [{'scheme_name': "Fund A", 'category': 'Equity Large Cap', 'invested_amount': 100000,
+                          'current_value': 150000, 'investment_date': "2020-01-01"}],
+    }}
+
+def test_asset_reports_of_one_batch_get_distinct_names(tmp_path):
+    spec = tmp_path / 'spec.json'
+    spec.write_text(json.dumps([asset_spec("Ravi Kumar"), asset_spec("Asha Rao")]))
+    assert main([str(spec), '--output-dir', str(tmp_path / 'out')]) == 0
+    names = sorted(path.name for path in (tmp_path / 'out').iterdir())
+    assert len(names) == 2
+    assert names[0].startswith('Asset_Comparison_Report_Asha_Rao_')
+
+def test_duplicate_outputs_in_one_run_are_rejected(tmp_path, capsys):
+    spec = tmp_path / 'spec.json'
+    spec.write_text(json.dumps([asset_spec("Ravi Kumar", output='same.pdf'), asset_spec("Asha Rao", output='same.pdf')]))
+    assert main([str(spec), '--output-dir', str(tmp_path)]) == 1
+    assert "already written" in capsys.readouterr().err
+
+def test_fingerprint_follows_the_valuation_date(monkeypatch):
+    class Tomorrow(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.now(tz) + timedelta(days=1)
+
+    spec = asset_spec("Ravi Kumar")
+    pinned = asset_spec("Ravi Kumar", as_of="2025-01-15")
+    today, pinned_today = report_fingerprint(spec), report_fingerprint(pinned)
+    monkeypatch.setattr(cli, 'datetime', Tomorrow)
+    assert report_fingerprint(spec) != today
+    assert report_fingerprint(pinned) == pinned_today
+    assert report_as_of(pinned) == date(2025, 1, 15)
@@ -0,0 +1,61 @@
+import pickle
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sahayak.client_store import ClientStore, decode_record, encode_record
+from sahayak.session_store import CompactTable
+
+def screen_values():
+    assets = pd.DataFrame({
+        'Asset Class': ["Equity", "Debt", None],
+        'Value': [100000.5, float('nan'), 0.0],
+        'Units': [1, 2, 3],
+        'Date': [date(2024, 1, 1), None, date(2024, 3, 1)],
+    })
+    return {
+        'client_name': "Ravi Kumar",
+        'stp_start': date(2025, 1, 15),
+        'include_sip': True,
+        'current_assets': CompactTable.from_frame(assets),
+        'lumpsum': pd.DataFrame({'Fund': ["A"], 'Allocation %': [100]}, index=[3]),
+        'goal_calculations': {
+            'calculated_goals': [{'Goal': "Retirement", 'Lumpsum': np.float64(12.5), 'Years': np.int64(20)}],
+            'edited_assets': assets,
+            'generated_at': datetime(2025, 1, 15, 10, 30),
+        },
+        'asset_analysis_results': {'Mutual Funds': {'xirr': None, 'grid': np.arange(6.0).reshape(2, 3),
+                                                    'scheme_xirr': {1: 0.1}, 'span': (1, 2)}},
+    }
+
+def test_screen_values_round_trip(tmp_path):
+    store = ClientStore(str(tmp_path / 'clients.db'))
+    client_id = store.save_client("Ravi Kumar")
+    values = screen_values()
+    store.save_screen(client_id, 'goal_planner', values)
+    loaded = store.load_screen(client_id, 'goal_planner')
+
+    assert loaded['client_name'] == "Ravi Kumar" and loaded['stp_start'] == date(2025, 1, 15)
+    assert isinstance(loaded['current_assets'], CompactTable)
+    assert loaded['current_assets'].equals(values['current_assets'])
+    pd.testing.assert_frame_equal(loaded['lumpsum'], values['lumpsum'])
+    goals = loaded['goal_calculations']
+    pd.testing.assert_frame_equal(goals['edited_assets'], values['goal_calculations']['edited_assets'])
+    assert goals['calculated_goals'] == [{'Goal': "Retirement", 'Lumpsum': 12.5, 'Years': 20}]
+    assert goals['generated_at'] == datetime(2025, 1, 15, 10, 30)
+    mf = loaded['asset_analysis_results']['Mutual Funds']
+    np.testing.assert_array_equal(mf['grid'], np.arange(6.0).reshape(2, 3))
+    assert mf['scheme_xirr'] == {1: 0.1} and mf['span'] == (1, 2)
+    store.close()
+
+def test_unreadable_records_fail_loudly():
+    with pytest.raises(ValueError):
+        decode_record(pickle.dumps({'client_name': "Ravi"}))
+    with pytest.raises(ValueError, match="format 2"):
+        decode_record(b'{"format": 2, "values": {}}')
+    with pytest.raises(ValueError, match="unknown value type"):
+        decode_record(b'{"format": 1, "values": {"table": {"$parquet": ""}}}')
+    with pytest.raises(ValueError):
+        encode_record({'store': object()})
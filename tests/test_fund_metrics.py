@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sahayak.fund_metrics import CAGR_YEARS, RISK_FREE_RATE, RISK_WINDOW_MONTHS, fund_metrics
+from sahayak.nav_store import NavStore, write_store
+
+AS_OF = pd.Timestamp('2025-06-15')
+
+def random_navs(codes, start='2014-01-01'):
+    """Business-day NAVs of a random walk per code"""
+    rng = np.random.default_rng(5)
+    days = pd.bdate_range(start, AS_OF)
+    frames = []
+    for code in codes:
+        walk = 10 * np.exp(np.cumsum(rng.normal(0.0004, 0.01, len(days))))
+        frames.append(pd.DataFrame({'code': code, 'name': f"Fund {code}", 'date': days, 'nav': walk}))
+    return pd.concat(frames, ignore_index=True)
+
+def monthly_navs(series, months):
+    """NAV on the as-of day of each of the last `months` months, the last
+    one published within a week before it"""
+    values = []
+    for back in range(months, -1, -1):
+        day = AS_OF - pd.DateOffset(months=back)
+        published = series[series.index <= day]
+        values.append(published.iloc[-1] if len(published) and day - published.index[-1] <= pd.Timedelta(days=7)
+                      else np.nan)
+    return pd.Series(values)
+
+def naive_metrics(series, benchmark):
+    monthly_free = (1 + RISK_FREE_RATE / 100) ** (1 / 12) - 1
+    excess = monthly_navs(series, RISK_WINDOW_MONTHS).pct_change().dropna() - monthly_free
+    market = monthly_navs(benchmark, RISK_WINDOW_MONTHS).pct_change().dropna() - monthly_free
+    beta = excess.cov(market) / market.var()
+    metrics = {
+        'SD': excess.std() * np.sqrt(12) * 100,
+        'SR': excess.mean() / excess.std() * np.sqrt(12),
+        'Beta': beta,
+        'Alpha': (excess.mean() - beta * market.mean()) * 12 * 100,
+    }
+    longest = monthly_navs(series, 12 * max(CAGR_YEARS.values()))
+    for label, years in CAGR_YEARS.items():
+        metrics[label] = ((longest.iloc[-1] / longest.iloc[-1 - 12 * years]) ** (1 / years) - 1) * 100
+    return metrics
+
+def test_fund_metrics_match_naive_pandas(tmp_path):
+    history = random_navs(['1', '2', 'bench'])
+    # A scheme launched three years ago has no 5Y or 10Y figure
+    young = random_navs(['3'], start='2022-06-01')
+    write_store(str(tmp_path), pd.concat([history, young], ignore_index=True))
+    store = NavStore(str(tmp_path))
+
+    metrics = fund_metrics(store, ['1', '2', '3', 'missing'], benchmark='bench', as_of=AS_OF)
+    benchmark = store.series('bench')
+    for code in ['1', '2']:
+        expected = naive_metrics(store.series(code), benchmark)
+        for column, value in expected.items():
+            assert metrics.loc[code, column] == pytest.approx(value, rel=1e-9), (code, column)
+    assert np.isnan(metrics.loc['3', ['5Y', '10Y']].astype(float)).all()
+    assert metrics.loc['3', '1Y'] == pytest.approx(naive_metrics(store.series('3'), benchmark)['1Y'], rel=1e-9)
+    assert metrics.loc['missing'].isna().all()
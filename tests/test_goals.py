@@ -0,0 +1,40 @@
+import pytest
+
+from sahayak import goals
+from sahayak.goals import GOAL_ORDER, GoalPlan, calculate_goal, goal_params, summarize_goals
+
+def full_recalculation(values, current_age):
+    rows = [calculate_goal(goal_key, goal_params(goal_key, values), current_age) for goal_key in GOAL_ORDER]
+    return summarize_goals([row for row in rows if row])
+
+def test_goal_plan_recalculates_only_changed_goals(monkeypatch):
+    calculated = []
+    original = goals.calculate_goal
+    monkeypatch.setattr(goals, 'calculate_goal',
+                        lambda goal_key, params, age: calculated.append(goal_key) or original(goal_key, params, age))
+    plan = GoalPlan()
+    values = {}
+    assert plan.update(GOAL_ORDER, values, 30) == GOAL_ORDER
+    version = plan.version
+
+    # Nothing changed: no goal is recalculated and the totals stand
+    calculated.clear()
+    assert plan.update(GOAL_ORDER, values, 30) == []
+    assert calculated == [] and plan.version == version
+
+    values = {'edu_current_cost': 800000}
+    assert plan.update(GOAL_ORDER, values, 30) == ['education']
+    assert calculated == ['education']
+    assert plan.summary == pytest.approx(full_recalculation(values, 30))
+
+    # Age feeds only the goals that depend on it
+    calculated.clear()
+    assert plan.update(GOAL_ORDER, values, 32) == ['marriage', 'retirement']
+    assert plan.summary == pytest.approx(full_recalculation(values, 32))
+
+    # Dropping a goal changes the totals without recalculating anything
+    calculated.clear()
+    assert plan.update(['education', 'retirement'], values, 32) == []
+    assert calculated == []
+    assert [row['Goal'] for row in plan.calculated_goals()] == ["Child Education", "Retirement Corpus"]
+    assert plan.version > version
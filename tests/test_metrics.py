@@ -0,0 +1,91 @@
+import urllib.error
+import urllib.request
+from io import BytesIO
+
+import pytest
+
+from sahayak import metrics
+
+@pytest.fixture
+def report_metrics(monkeypatch):
+    """Fresh report metrics for one report type, and a clock that
+    advances by the given steps"""
+    reports = metrics.Counter("sahayak_reports_total", "Reports", ('report', 'status'),
+                              initial=[('goal_plan', 'ok'), ('goal_plan', 'error')])
+    seconds = metrics.Histogram("sahayak_report_duration_seconds", "Build time", ('report',), (0.5, 5),
+                                initial=[('goal_plan',)])
+    sizes = metrics.Histogram("sahayak_report_pdf_bytes", "PDF size", ('report',), (10e3, 100e3))
+    monkeypatch.setattr(metrics, 'REPORTS', reports)
+    monkeypatch.setattr(metrics, 'REPORT_SECONDS', seconds)
+    monkeypatch.setattr(metrics, 'REPORT_BYTES', sizes)
+    monkeypatch.setattr(metrics, 'METRICS', [reports, seconds, sizes])
+    clock = []
+    monkeypatch.setattr(metrics.time, 'perf_counter', lambda: clock.pop(0))
+    return clock
+
+@metrics.measured_report('goal_plan')
+def build_pdf(size, fail=False):
+    if fail:
+        raise ValueError("no goals")
+    return BytesIO(b"x" * size)
+
+def test_render_after_ok_and_failed_reports(report_metrics):
+    report_metrics.extend([10.0, 10.25, 20.0, 27.5])
+    build_pdf(42000)
+    with pytest.raises(ValueError):
+        build_pdf(0, fail=True)
+
+    assert metrics.render().splitlines() == [
+        '# HELP sahayak_reports_total Reports',
+        '# TYPE sahayak_reports_total counter',
+        'sahayak_reports_total{report="goal_plan",status="error"} 1',
+        'sahayak_reports_total{report="goal_plan",status="ok"} 1',
+        '# HELP sahayak_report_duration_seconds Build time',
+        '# TYPE sahayak_report_duration_seconds histogram',
+        'sahayak_report_duration_seconds_bucket{report="goal_plan",le="0.5"} 1',
+        'sahayak_report_duration_seconds_bucket{report="goal_plan",le="5"} 1',
+        'sahayak_report_duration_seconds_bucket{report="goal_plan",le="+Inf"} 2',
+        'sahayak_report_duration_seconds_sum{report="goal_plan"} 7.75',
+        'sahayak_report_duration_seconds_count{report="goal_plan"} 2',
+        '# HELP sahayak_report_pdf_bytes PDF size',
+        '# TYPE sahayak_report_pdf_bytes histogram',
+        'sahayak_report_pdf_bytes_bucket{report="goal_plan",le="10000"} 0',
+        'sahayak_report_pdf_bytes_bucket{report="goal_plan",le="100000"} 1',
+        'sahayak_report_pdf_bytes_bucket{report="goal_plan",le="+Inf"} 1',
+        'sahayak_report_pdf_bytes_sum{report="goal_plan"} 42000',
+        'sahayak_report_pdf_bytes_count{report="goal_plan"} 1',
+    ]
+
+def test_nested_reports_are_counted_once(report_metrics):
+    report_metrics.extend([0.0, 1.0])
+    with metrics.observe_report('goal_plan') as observation:
+        # The screen's PDF builder called from a CLI report
+        build_pdf(500)
+        observation['pdf_bytes'] = 500
+    assert metrics.REPORTS.value('goal_plan', 'ok') == 1
+    assert metrics.REPORT_SECONDS.count('goal_plan') == 1
+    assert metrics.REPORT_BYTES.count('goal_plan') == 1
+
+    report_metrics.extend([2.0, 3.0])
+    with pytest.raises(ValueError):
+        with metrics.observe_report('goal_plan'):
+            build_pdf(0, fail=True)
+    assert metrics.REPORTS.value('goal_plan', 'error') == 1
+    assert metrics.REPORT_SECONDS.count('goal_plan') == 2
+    assert metrics.REPORT_BYTES.count('goal_plan') == 1
+
+def test_server_serves_the_metrics():
+    server = metrics.start_server(0)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        with urllib.request.urlopen(f"{url}/metrics", timeout=5) as response:
+            assert response.headers['Content-Type'] == metrics.CONTENT_TYPE
+            body = response.read().decode('utf-8')
+        assert '# TYPE sahayak_reports_total counter' in body.splitlines()
+        assert 'sahayak_cache_lookups_total{cache="nav_store"}' in body
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(f"{url}/other", timeout=5)
+        assert error.value.code == 404
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+
+from sahayak.nav_store import NavStore, store_frame, write_store
+
+def navs():
+    return pd.DataFrame({
+        'code': ['101', '101', '101', '202', '202', '101'],
+        'name': ["Fund A", "Fund A", "Fund A", "Fund B", "Fund B", "Fund A"],
+        'date': pd.to_datetime(['2024-01-01', '2024-01-02', '2024-01-05', '2024-01-03', '2024-01-04', '2024-01-02']),
+        'nav': [10.0, 10.5, 11.0, 50.0, 51.0, 10.6],
+    })
+
+def test_store_reads_back_what_was_written(tmp_path):
+    write_store(str(tmp_path), navs())
+    store = NavStore(str(tmp_path))
+    assert len(store) == 2 and '101' in store and store.find("fund b") == '202'
+
+    # Calendar-day slots, NaN on days without a NAV; a repeated date keeps the later row
+    dates, values = store.values('101')
+    assert dates[0] == np.datetime64('2024-01-01') and len(dates) == 5
+    np.testing.assert_array_equal(values, [10.0, 10.6, np.nan, np.nan, 11.0])
+    assert store.series('101', start='2024-01-02').tolist() == [10.6, 11.0]
+
+    dates, matrix = store.matrix(['202', '101', '999'], '2024-01-02', '2024-01-04')
+    np.testing.assert_array_equal(matrix, [[np.nan, 10.6, np.nan], [50.0, np.nan, np.nan], [51.0, np.nan, np.nan]])
+
+    frame = store_frame(store)
+    assert frame['nav'].tolist() == [10.0, 10.6, 11.0, 50.0, 51.0]
@@ -0,0 +1,48 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sahayak.asset_engine import ASSET_CLASSES, AnalysisParams, FixedDeposit, MutualFundHolding
+from sahayak.rebalance import _check_target, _switches, rebalance_plan, target_adds_up
+
+def sells(*rows):
+    return pd.DataFrame(rows, columns=['client', 'asset_class', 'net_proceeds'])
+
+def test_switches_without_destinations():
+    shortfall = np.zeros((1, len(ASSET_CLASSES)))
+    switches = _switches(sells((0, 'Gold', 50000.0)), shortfall)
+    assert switches.empty
+    assert list(switches.columns) == ['client', 'from', 'to', 'amount']
+
+def test_switches_split_proceeds_by_shortfall():
+    shortfall = np.zeros((1, len(ASSET_CLASSES)))
+    shortfall[0, list(ASSET_CLASSES).index('Mutual Funds')] = 30000.0
+    shortfall[0, list(ASSET_CLASSES).index('Fixed Deposits')] = 10000.0
+    switches = _switches(sells((0, 'Gold', 20000.0)), shortfall)
+    amounts = dict(zip(switches['to'], switches['amount']))
+    assert amounts == pytest.approx({'Mutual Funds': 15000.0, 'Fixed Deposits': 5000.0})
+    assert (switches['from'] == 'Gold').all()
+
+def test_targets_rounded_to_two_decimals_add_up():
+    three = dict(zip(['Mutual Funds', 'Gold', 'Fixed Deposits'], [33.33] * 3))
+    assert target_adds_up(three)
+    assert _check_target(three) is three
+    assert not target_adds_up({'Mutual Funds': 60.0, 'Gold': 30.0})
+    with pytest.raises(ValueError):
+        _check_target({'Mutual Funds': 60.0, 'Gold': 30.0})
+
+def test_sip_instalments_are_sold_oldest_first_at_their_own_cost():
+    # 13 instalments of 5000, each now worth 10000; only the first is long-term
+    sip = MutualFundHolding("Fund A", 'Equity Large Cap', 65000, 130000, date(2024, 1, 10), 5000)
+    portfolio = {'Mutual Funds': [sip], 'Fixed Deposits': [FixedDeposit(130000)]}
+    params = AnalysisParams(5, 0.30, 6.0, date(2025, 1, 15))
+    plan = rebalance_plan(portfolio, {'Mutual Funds': 25.0, 'Fixed Deposits': 75.0}, params)
+
+    sells = plan['sells']
+    assert sells['holding'].tolist() == ["Fund A (row 1)"]
+    assert sells['sale_value'].iloc[0] == pytest.approx(65000.0)
+    # The long-term lot's gain is exempt; 5.5 short-term lots pay STCG and exit load
+    assert sells['tax'].iloc[0] == pytest.approx(5.5 * 5000 * 0.15)
+    assert sells['exit_load'].iloc[0] == pytest.approx(5.5 * 10000 * 0.01)
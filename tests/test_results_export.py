@@ -0,0 +1,58 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from sahayak.asset_engine import AnalysisParams
+from sahayak.goals import calculate_goal, goal_params
+from sahayak.results_export import ResultsWriter, read_results, pa
+
+FORMATS = ['npz', pytest.param('feather', marks=pytest.mark.skipif(pa is None, reason="needs pyarrow"))]
+
+@pytest.mark.parametrize('format', FORMATS)
+def test_results_round_trip_through_parts(tmp_path, format):
+    goals = [calculate_goal(goal_key, goal_params(goal_key), 30) for goal_key in ('education', 'retirement')]
+    analysis = {
+        'Mutual Funds': {'current_value': 150000, 'invested_amount': 100000, 'tax_impact': np.float64(1500.0),
+                         'expected_return': 12.0, 'xirr': None, 'liquidity': 'High', 'risk_level': 'Medium'},
+        'Gold': None,
+    }
+    # One row per part, so reading has to stitch parts back in order
+    with ResultsWriter(str(tmp_path), rows_per_part=1, format=format) as writer:
+        for client in ("Ravi Kumar", "Asha Rao"):
+            writer.add_goals({'calculated_goals': goals, 'client_name': client, 'date_field': "15-01-2025",
+                              'risk_profile': "Moderate", 'current_age': 30}, as_of=date(2025, 1, 15))
+        writer.add_asset_analysis(analysis, "Ravi Kumar", params=AnalysisParams(5, 0.30, 6.0, date(2025, 1, 15)))
+
+    goal_rows = read_results(str(tmp_path), 'goals')
+    assert goal_rows['client'].tolist() == ["Ravi Kumar"] * 2 + ["Asha Rao"] * 2
+    assert goal_rows['goal'].tolist() == [goal['Goal'] for goal in goals] * 2
+    assert goal_rows['monthly_sip'].tolist() == pytest.approx([goal['Monthly SIP'] for goal in goals] * 2)
+    assert (goal_rows['report_date'] == np.datetime64('2025-01-15')).all()
+
+    assets = read_results(str(tmp_path), 'assets')
+    assert len(assets) == 1
+    row = assets.iloc[0]
+    assert row['asset_class'] == 'Mutual Funds' and row['as_of'] == np.datetime64('2025-01-15')
+    assert row['tax_impact'] == 1500.0 and row['tax_rate'] == 0.30
+    assert np.isnan(row['xirr']) and np.isnan(row['future_value'])
+    assert row['liquidity'] == 'High'
+
+def test_empty_export_reads_typed_columns(tmp_path):
+    assets = read_results(str(tmp_path), 'assets')
+    assert assets.empty and list(assets.columns)[:2] == ['client', 'as_of']
+    assert assets['as_of'].dtype.kind == 'M' and assets['tax_impact'].dtype == np.float64
+
+def test_parts_of_several_writers_read_in_write_order(tmp_path, monkeypatch):
+    from sahayak import results_export
+
+    # A clock that stands still must not reorder or overwrite parts
+    monkeypatch.setattr(results_export.time, 'time_ns', lambda: 1_736_899_200 * 10 ** 9)
+    goal = calculate_goal('education', goal_params('education'), 30)
+    first = ResultsWriter(str(tmp_path), rows_per_part=1, format='npz')
+    second = ResultsWriter(str(tmp_path), rows_per_part=1, format='npz')
+    clients = [f"Client {number}" for number in range(12)]
+    for number, client in enumerate(clients):
+        (first if number % 3 else second).add_goals({'calculated_goals': [goal], 'client_name': client})
+
+    assert read_results(str(tmp_path), 'goals')['client'].tolist() == clients
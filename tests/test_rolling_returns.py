@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sahayak.rolling_returns import PERCENTILES, rolling_cagr, summarize_rolling
+
+def test_rolling_cagr_and_summary_match_naive_pandas():
+    rng = np.random.default_rng(9)
+    days = pd.date_range('2021-01-01', '2024-12-31')
+    business = days.dayofweek < 5
+    navs = np.full((len(days), 2), np.nan)
+    navs[business] = 10 * np.exp(np.cumsum(rng.normal(0.0003, 0.01, (business.sum(), 2)), axis=0))
+    # The second scheme launches later and misses a fortnight
+    navs[:400, 1] = np.nan
+    navs[800:815, 1] = np.nan
+
+    cagr = rolling_cagr(days.to_numpy().astype('datetime64[D]'), navs, 1)
+    for column in range(2):
+        series = pd.Series(navs[:, column], index=days).dropna()
+        expected = np.full(len(days), np.nan)
+        for row, day in enumerate(days):
+            if np.isnan(navs[row, column]):
+                continue
+            start = day - pd.DateOffset(years=1)
+            before = series[series.index <= start]
+            if len(before) and start - before.index[-1] <= pd.Timedelta(days=7):
+                expected[row] = ((navs[row, column] / before.iloc[-1]) - 1) * 100
+        np.testing.assert_allclose(cagr[:, column], expected, rtol=1e-10, equal_nan=True)
+
+        summary = summarize_rolling(cagr)
+        periods = expected[~np.isnan(expected)]
+        assert summary['Periods'][column] == len(periods)
+        assert summary['Min'][column] == pytest.approx(periods.min())
+        assert summary['Max'][column] == pytest.approx(periods.max())
+        for q in PERCENTILES:
+            assert summary[f"P{q}"][column] == pytest.approx(np.percentile(periods, q))
+        assert summary['Mean'][column] == pytest.approx(periods.mean())
+        assert summary['Positive (%)'][column] == pytest.approx((periods > 0).mean() * 100)
@@ -0,0 +1,27 @@
+from sahayak.scheme_search import SchemeIndex
+
+SCHEMES = {
+    '118989': "HDFC Mid Cap Fund - Direct Plan - Growth",
+    '119062': "HDFC Mid Cap Fund - Regular Plan - Growth",
+    '120505': "Axis Midcap Fund - Direct Plan - Growth",
+    '118834': "Mirae Asset Large Cap Fund - Direct Plan - Growth",
+    '125497': "SBI Small Cap Fund - Direct Plan - Growth",
+}
+
+def test_prefix_matches_any_word_start_names_starting_with_it_first():
+    index = SchemeIndex(SCHEMES)
+    names = list(index.names[index.prefix("mid cap")])
+    assert set(names) == {SCHEMES['118989'], SCHEMES['119062']}
+    assert list(index.names[index.prefix("hdfc")]) == [SCHEMES['118989'], SCHEMES['119062']]
+    assert list(index.names[index.prefix("axis mid")]) == [SCHEMES['120505']]
+    assert not len(index.prefix("growth fund"))
+    assert not len(index.prefix("  "))
+
+def test_resolve_by_code_exact_name_or_close_match():
+    index = SchemeIndex(SCHEMES)
+    assert index.resolve("120505") == ('120505', SCHEMES['120505'])
+    assert index.resolve("sbi small cap fund direct plan growth") == ('125497', SCHEMES['125497'])
+    assert index.resolve("Mirae Asset Large Cap Direct") == ('118834', SCHEMES['118834'])
+    assert index.resolve("Nippon Gold ETF") is None
+    assert index.suggestions([SCHEMES['120505'], "axis midcap direct growth", ""]) == {
+        "axis midcap direct growth": ('120505', SCHEMES['120505'])}
@@ -0,0 +1,123 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pandas as pd
+from streamlit.runtime.state.safe_session_state import SafeSessionState
+from streamlit.runtime.state.session_state import SessionState
+
+from sahayak import metrics, session_store
+
+# The context of the run in progress, if any
+_run = {}
+
+def run_script(session_id, state, now, body=None):
+    """One run of a session: Streamlit wraps the session's state in a new
+    SafeSessionState per run"""
+    _run['ctx'] = SimpleNamespace(session_id=session_id, session_state=SafeSessionState(state, lambda: None))
+    _run['now'] = now
+    with session_store.track_session():
+        if body:
+            body()
+    _run.clear()
+
+def patch_runtime(monkeypatch):
+    monkeypatch.setattr(session_store, '_sessions', {})
+    monkeypatch.setattr(session_store, '_footprint_hooks', [])
+    monkeypatch.setattr(session_store, 'get_script_run_ctx', lambda suppress_warning=False: _run.get('ctx'))
+    monkeypatch.setattr(session_store.time, 'monotonic', lambda: _run.get('now', 0.0))
+
+def client_session():
+    state = SessionState()
+    state['goal_calculations'] = {'calculated_goals': [1, 2, 3]}
+    state['current_assets'] = pd.DataFrame({'a': range(10)})
+    state['calculations_done'] = True
+    state['client_name'] = "Ravi"
+    return state
+
+def test_idle_session_loses_derived_state_while_idle(monkeypatch):
+    patch_runtime(monkeypatch)
+    idle, busy = client_session(), client_session()
+    run_script('idle', idle, now=1000.0)
+    run_script('busy', busy, now=1000.0 + session_store.SESSION_IDLE_SECONDS)
+
+    evicted = session_store.evict_idle_sessions(now=1000.0 + session_store.SESSION_IDLE_SECONDS + 1)
+    assert evicted == ['idle']
+    assert 'goal_calculations' not in idle and idle['calculations_done'] is False
+    assert 'current_assets' in idle and idle['client_name'] == "Ravi"
+    assert 'goal_calculations' in busy
+    assert 'goal_calculations' not in session_store.session_report()['idle']['keys']
+
+def test_sweep_skips_a_session_in_the_middle_of_a_run(monkeypatch):
+    patch_runtime(monkeypatch)
+    state = client_session()
+    seen = {}
+
+    def long_run():
+        # Another thread sweeps while this run is going on
+        sweep = threading.Thread(target=lambda: seen.update(
+            evicted=session_store.evict_idle_sessions(max_idle_seconds=0, now=10.0 ** 9)))
+        sweep.start()
+        sweep.join()
+
+    run_script('client', state, now=1000.0, body=long_run)
+    assert seen['evicted'] == []
+    assert 'goal_calculations' in state
+
+def test_sweeper_thread_frees_idle_sessions(monkeypatch):
+    patch_runtime(monkeypatch)
+    state = client_session()
+    run_script('client', state, now=1000.0)
+    monkeypatch.setattr(session_store.time, 'monotonic', lambda: 1000.0 + session_store.SESSION_IDLE_SECONDS)
+    stop = session_store.start_sweeper(interval=0.01)
+    try:
+        deadline = time.time() + 5
+        while 'goal_calculations' in state and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        stop.set()
+    assert 'goal_calculations' not in state and 'current_assets' in state
+
+def test_footprints_are_sampled_and_published(monkeypatch):
+    patch_runtime(monkeypatch)
+    measured = []
+    original = session_store.session_footprint
+    monkeypatch.setattr(session_store, 'session_footprint', lambda state: measured.append(1) or original(state))
+    state = client_session()
+    run_script('client', state, now=1000.0)
+    run_script('client', state, now=1001.0)
+    assert len(measured) == 1
+    run_script('client', state, now=1000.0 + session_store.FOOTPRINT_INTERVAL_SECONDS)
+    assert len(measured) == 2
+
+    # A hook gets the footprint of every run
+    calls = []
+    session_store.add_footprint_hook(lambda session_id, footprint: calls.append((session_id, footprint)))
+    run_script('client', state, now=1000.0 + session_store.FOOTPRINT_INTERVAL_SECONDS + 1)
+    assert calls and calls[0][0] == 'client' and calls[0][1]['current_assets'] > 0
+
+    assert metrics.SESSIONS.value() == 1
+    assert metrics.SESSION_BYTES.value('client') == session_store.session_report()['client']['total_bytes']
+    assert metrics.SESSION_KEY_BYTES.value('current_assets') == calls[0][1]['current_assets']
+
+def test_closed_sessions_are_forgotten_on_the_next_run(monkeypatch):
+    patch_runtime(monkeypatch)
+    closed = set()
+    monkeypatch.setattr(session_store, '_session_closed', lambda session_id: session_id in closed)
+    run_script('gone', client_session(), now=1000.0)
+    closed.add('gone')
+    run_script('other', SessionState(), now=1001.0)
+    assert set(session_store._sessions) == {'other'}
+    assert metrics.SESSION_BYTES.value('gone') == 0
+
+def test_allocation_tables_are_kept_compact():
+    from sahayak.resources import DEFAULT_TABLES
+
+    state = {}
+    for name in ('lumpsum', 'sip', 'fund_perf'):
+        edited = pd.DataFrame(DEFAULT_TABLES[name])
+        table = session_store.store_table(f"{name}_edited", edited, state)
+        assert isinstance(state[f"{name}_edited"], session_store.CompactTable)
+        pd.testing.assert_frame_equal(session_store.as_frame(table), edited)
+        # An unchanged editor output keeps the stored table
+        assert session_store.store_table(f"{name}_edited", edited.copy(), state) is table
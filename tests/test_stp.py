@@ -0,0 +1,18 @@
+import pandas as pd
+import pytest
+
+from sahayak.stp import stp_schedule
+
+def allocation(*rows):
+    return pd.DataFrame(rows, columns=['Category', 'Scheme Name', 'Amount'])
+
+def test_repeated_scheme_is_counted_once():
+    initial = allocation(('Debt Liquid', 'Liquid Fund', 600000.0), ('Debt Liquid', 'Liquid Fund', 400000.0))
+    final = allocation(('Equity Large Cap', 'Bluechip Fund', 500000.0), ('Equity Large Cap', 'Bluechip Fund', 300000.0),
+                       ('Debt Liquid', 'Liquid Fund', 200000.0))
+    stp = stp_schedule(initial, final, '2025-01-01', 'Monthly', instalments=4, returns={'Equity': 0.0, 'Debt': 0.0})
+
+    assert stp['schedule']['transfer'].sum() == pytest.approx(800000.0)
+    last = stp['balances'][stp['balances']['instalment'] == stp['balances']['instalment'].max()]
+    assert sorted(last['scheme']) == ['Bluechip Fund', 'Liquid Fund']
+    assert dict(zip(last['scheme'], last['balance'])) == pytest.approx({'Bluechip Fund': 800000.0, 'Liquid Fund': 200000.0})
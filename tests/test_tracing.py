@@ -0,0 +1,46 @@
+import json
+
+from sahayak import tracing
+
+@tracing.traced("calc.inner")
+def inner(value):
+    with tracing.span("calc.step", value=value):
+        return value * 2
+
+def test_nested_spans_are_written_as_a_chrome_trace(tmp_path, monkeypatch):
+    monkeypatch.setattr(tracing, '_output', None)
+    tracing.configure(str(tmp_path))
+    with tracing.request("report.test", client="Ravi"):
+        trace = tracing.current()
+        with tracing.span("pdf.layout", pages=3):
+            assert inner(21) == 42
+    assert tracing.current() is None
+
+    assert [(r['span'], r['parent'], r['depth']) for r in trace.records()] == [
+        ("report.test", None, 0), ("pdf.layout", "report.test", 1),
+        ("calc.inner", "pdf.layout", 2), ("calc.step", "calc.inner", 3),
+    ]
+    assert trace.records()[1]['pages'] == 3
+
+    paths = list(tmp_path.glob("report.test-*.json"))
+    assert len(paths) == 1
+    with open(paths[0], encoding='utf-8') as f:
+        data = json.load(f)
+    assert data['otherData']['request'] == "report.test"
+    events = data['traceEvents']
+    assert [event['name'] for event in events] == ["report.test", "pdf.layout", "calc.inner", "calc.step"]
+    assert all(event['ph'] == 'X' for event in events)
+    assert events[0]['args'] == {'client': "Ravi"} and events[3]['args'] == {'value': "21"}
+    # Each span lies within its parent
+    for outer, nested in zip(events, events[1:]):
+        assert outer['ts'] <= nested['ts']
+        assert nested['ts'] + nested['dur'] <= outer['ts'] + outer['dur'] + 1e-3
+
+def test_spans_are_a_shared_no_op_without_a_trace(tmp_path, monkeypatch):
+    monkeypatch.setattr(tracing, '_output', None)
+    assert tracing.span("pdf.layout") is tracing._NO_SPAN
+    with tracing.request("report.test") as attrs:
+        assert tracing.current() is None and attrs == {}
+        assert tracing.span("pdf.layout", pages=3) is tracing._NO_SPAN
+    assert inner(1) == 2
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,61 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from sahayak.xirr import xirr
+
+def npv(rate, days, amounts):
+    """Value of the flows at the last flow's date at an annual rate"""
+    last = max(days)
+    return sum(amount * (1 + rate) ** ((last - day) / 365.0) for day, amount in zip(days, amounts))
+
+def npv_root(days, amounts, lo=-0.9999, hi=10.0):
+    """The rate where npv is zero, by plain bisection"""
+    f_lo = npv(lo, days, amounts)
+    for _ in range(200):
+        mid = (lo + hi) / 2
+        f_mid = npv(mid, days, amounts)
+        if (f_mid < 0) == (f_lo < 0):
+            lo, f_lo = mid, f_mid
+        else:
+            hi = mid
+    return (lo + hi) / 2
+
+def sip_flows(rng, start):
+    """Monthly instalments from start and a current value on the last day"""
+    months = int(rng.integers(2, 60))
+    days = [start + int(30.4 * month) for month in range(months)] + [start + int(30.4 * months)]
+    sip = float(rng.integers(1, 20) * 1000)
+    growth = float(rng.uniform(0.6, 2.5))
+    return days, [-sip] * months + [sip * months * growth]
+
+def test_xirr_is_the_npv_root_of_each_group():
+    rng = np.random.default_rng(3)
+    start = date(2015, 1, 1).toordinal()
+    groups, days, amounts, expected = [], [], [], []
+    for group in range(40):
+        group_days, group_amounts = sip_flows(rng, start + int(rng.integers(0, 1000)))
+        groups += [group] * len(group_days)
+        days += group_days
+        amounts += group_amounts
+        expected.append(npv_root(group_days, group_amounts))
+
+    dates = np.array([date.fromordinal(day) for day in days], dtype='datetime64[D]')
+    rates = xirr(groups, dates, amounts)
+    assert rates == pytest.approx(expected, abs=1e-8)
+    for group, rate in enumerate(rates):
+        in_group = [i for i, g in enumerate(groups) if g == group]
+        value = npv(rate, [days[i] for i in in_group], [amounts[i] for i in in_group])
+        assert abs(value) < 1e-4 * sum(abs(amounts[i]) for i in in_group)
+
+def test_xirr_without_a_sign_change_is_nan():
+    day = date(2024, 1, 1)
+    dates = np.array([day, day + timedelta(days=365), day, day + timedelta(days=365), day, day, day,
+                      day + timedelta(days=365)], dtype='datetime64[D]')
+    groups = [0, 0, 1, 1, 2, 2, 3, 3]
+    amounts = [-1000.0, -500.0, 1000.0, 200.0, -1000.0, 1100.0, -1000.0, 1100.0]
+    rates = xirr(groups, dates, amounts)
+    # Only outflows, only inflows, everything on one day
+    assert np.isnan(rates[:3]).all()
+    assert rates[3] == pytest.approx(0.10)